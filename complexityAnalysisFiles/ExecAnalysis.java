@@ -59,12 +59,24 @@ public class ExecAnalysis {
         return new ExecutionResult(Te, executionTime);
     }
 
+    // Usage: ExecAnalysis [repetitions n1 n2 ...]
+    // Without arguments the original node list is run once. Every repetition prints its own line for the benchmark driver to parse
     public static void main(String[] args) {
+        int repetitions = 1;
         int[] node_list = {2, 500, 1000, 1500, 2000, 2500, 3000, 3500, 4000, 4500, 5000, 5500, 6000, 6500, 7000, 7500, 8000, 8500, 9000, 9500, 10000, 10500, 11000, 11500, 12000, 12500, 13000, 13500, 14000, 14500, 15000, 15500, 16000, 16500, 17000, 17500, 18000, 18500, 19000, 19500, 20000};
+        if (args.length > 1) {
+            repetitions = Integer.parseInt(args[0]);
+            node_list = new int[args.length - 1];
+            for (int i = 1; i < args.length; i++) {
+                node_list[i - 1] = Integer.parseInt(args[i]);
+            }
+        }
 
         for (int n : node_list) {
-            ExecutionResult result = primMinimumSpanningTreeUniformWeight(n);
-            System.out.printf("Execution time for uniform weight with %d nodes: %.6f seconds%n", n, result.executionTime);
+            for (int r = 0; r < repetitions; r++) {
+                ExecutionResult result = primMinimumSpanningTreeUniformWeight(n);
+                System.out.printf("Execution time for uniform weight with %d nodes: %.9f seconds%n", n, result.executionTime);
+            }
         }
     }
 
@@ -1,4 +1,6 @@
 #include <iostream>
+#include <iomanip>
+#include <cstdlib>
 #include <set>
 #include <unordered_map>
 #include <chrono>
@@ -53,15 +55,29 @@ pair<set<pair<int, int>>, double> primMinimumSpanningTreeUniformWeight(int verti
     return {Te, execTime.count()};
 }
 
-int main() {
-    vector<int> node_list = {2};
-    for (int x = 500; x <= 20500; x += 500) {
-        node_list.push_back(x);
+// Usage: exec_analysis [repetitions n1 n2 ...]
+// Without arguments the original node list is run once. Every repetition prints its own line for the benchmark driver to parse.
+int main(int argc, char* argv[]) {
+    int repetitions = 1;
+    vector<int> node_list;
+    if (argc > 2) {
+        repetitions = atoi(argv[1]);
+        for (int i = 2; i < argc; ++i) {
+            node_list.push_back(atoi(argv[i]));
+        }
+    } else {
+        node_list.push_back(2);
+        for (int x = 500; x <= 20500; x += 500) {
+            node_list.push_back(x);
+        }
     }
 
+    cout << fixed << setprecision(9);
     for (int n : node_list) {
-        auto [Te, execTime] = primMinimumSpanningTreeUniformWeight(n);
-        cout << "Execution time for uniform weight with " << n << " nodes: " << execTime << " seconds\n";
+        for (int r = 0; r < repetitions; ++r) {
+            auto [Te, execTime] = primMinimumSpanningTreeUniformWeight(n);
+            cout << "Execution time for uniform weight with " << n << " nodes: " << execTime << " seconds\n";
+        }
     }
 
     return 0;
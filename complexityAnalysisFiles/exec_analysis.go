@@ -3,6 +3,8 @@ package main
 import (
 	"fmt"
 	"math"
+	"os"
+	"strconv"
 	"time"
 )
 
@@ -54,22 +56,44 @@ func primMinimumSpanningTreeUniformWeight(verticesCount int) ([][]int, float64)
 	}
 
 	endTime := time.Now()
-	executionTime = endTime.Sub(startTime).Seconds()
+	executionTime := endTime.Sub(startTime).Seconds()
 
 	return Te, executionTime
 }
 
+// Usage: exec_analysis [repetitions n1 n2 ...]
+// Without arguments the original node list is run once. Every repetition prints its own line for the benchmark driver to parse
 func main() {
+	repetitions := 1
 	nodeList := []int{2}
 
-	for x := 500; x <= 20500; x += 500 {
-		nodeList = append(nodeList, x)
-	}
+	if len(os.Args) > 2 {
+		repetitions = mustAtoi(os.Args[1])
+		nodeList = nodeList[:0]
+		for _, arg := range os.Args[2:] {
+			nodeList = append(nodeList, mustAtoi(arg))
+		}
+	} else {
+		for x := 500; x <= 20500; x += 500 {
+			nodeList = append(nodeList, x)
+		}
 
-	fmt.Println(nodeList)
+		fmt.Println(nodeList)
+	}
 
 	for _, n := range nodeList {
-		_, execTime := primMinimumSpanningTreeUniformWeight(n)
-		fmt.Printf("Execution time for uniform weight with %d nodes: %.6f seconds\n", n, execTime)
+		for r := 0; r < repetitions; r++ {
+			_, execTime := primMinimumSpanningTreeUniformWeight(n)
+			fmt.Printf("Execution time for uniform weight with %d nodes: %.9f seconds\n", n, execTime)
+		}
+	}
+}
+
+func mustAtoi(arg string) int {
+	value, err := strconv.Atoi(arg)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "invalid integer argument %q\n", arg)
+		os.Exit(2)
 	}
+	return value
 }
@@ -1,3 +1,4 @@
+import sys
 import time
 
 
@@ -116,15 +117,21 @@ def prim_minimum_spanning_tree_uniform_weight(vertices_count):
     execution_time = end_time - start_time
     return Te, execution_time
 
-# Example usage
-node_list = [2]
+# Usage: python exec_analysis.py [repetitions n1 n2 ...]
+# Without arguments the original node list is run once. Every repetition prints its own line for the benchmark driver to parse
+if len(sys.argv) > 2:
+    repetitions = int(sys.argv[1])
+    node_list = [int(arg) for arg in sys.argv[2:]]
+else:
+    repetitions = 1
+    node_list = [2]
 
-for x in range(500, 20500, 500):
-    node_list.append(x)
+    for x in range(500, 20500, 500):
+        node_list.append(x)
 
-print(node_list)
+    print(node_list)
 
 for n in node_list:
-    Te, exec_time = prim_minimum_spanning_tree_uniform_weight(n)
-    print(f"Execution time for uniform weight with {n} nodes: {exec_time:.6f} seconds")
-
+    for _ in range(repetitions):
+        Te, exec_time = prim_minimum_spanning_tree_uniform_weight(n)
+        print(f"Execution time for uniform weight with {n} nodes: {exec_time:.9f} seconds")
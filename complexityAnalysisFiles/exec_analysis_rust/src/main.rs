@@ -37,15 +37,26 @@ fn prim_minimum_spanning_tree_uniform_weight(vertices_count: usize) -> (HashSet<
     (te, execution_time)
 }
 
+// Usage: exec_analysis_rust [repetitions n1 n2 ...]
+// Without arguments the original node list is run once. Every repetition prints its own line for the benchmark driver to parse
 fn main() {
+    let args: Vec<String> = std::env::args().skip(1).collect();
+    let mut repetitions = 1;
     let mut node_list = vec![2usize];
 
-    for x in (500..=20000).step_by(500) {
-        node_list.push(x);
+    if args.len() > 1 {
+        repetitions = args[0].parse().expect("repetitions must be an integer");
+        node_list = args[1..].iter().map(|arg| arg.parse().expect("node counts must be integers")).collect();
+    } else {
+        for x in (500..=20000).step_by(500) {
+            node_list.push(x);
+        }
     }
 
     for n in node_list {
-        let (_te, exec_time) = prim_minimum_spanning_tree_uniform_weight(n);
-        println!("Execution time for uniform weight with {} nodes: {:.6} seconds", n, exec_time);
+        for _ in 0..repetitions {
+            let (_te, exec_time) = prim_minimum_spanning_tree_uniform_weight(n);
+            println!("Execution time for uniform weight with {} nodes: {:.9} seconds", n, exec_time);
+        }
     }
 }
@@ -1,5 +1,7 @@
 # config.py
 
+import os
+
 # Window configurations
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
@@ -13,11 +15,51 @@ COMPLEXITY_PLACEHOLDER_COLOUR = "grey"
 
 VISUALISER_GUIDE_TEXT = "The graph visualiser allows you to construct the minimum spanning tree (MST) of a graph in an iterative manner using Prim's algorithm. You can create, generate or import a graph directly through the user interface using the menus, buttons and drawable canvas in the centre of the screen.\n\n" + "1. Click the middle canvas to create new nodes.\n\n" + "2. Use the menus on the left to create edges, delete nodes/edges, and use other features like graph importing and graph resetting.\n\n" + "3. Select a source node in the top right, and click Run Prim's to start Prim's algorithm on your graph.\n\n" + "4. Use the Next Step button in the bottom right to progress Prim's on your graph until your MST is complete.\n\n" + "5. Continue editing your graphs dimensions or use the Reset Graph button to start again."
 
-COMPLEXITY_GUIDE_TEXT = "The complexity analyser allows you to see the time complexity of Prim's algorithm for a series of complete graphs. You can specify the maximum number of nodes and the size of the step interval between plotted points.\n\n" + "1. Select No. of Comparisons/Execution Time in the top left to specify the complexity metrics you want to collect.\n\n" + "2. Use the sliders to specify the maximum number of nodes and the step interval for the chart data.\n\n" + "3. Click the Analyse button to start the analysis.\n\n" + "4. After a short while, the generated chart will display the time complexity of Prim's algorithm for the series of complete graphs. Complexity data will be displayed below the sliders.\n\n" + "5. Change the slider parameters and click the Analyse button again to see how the time complexity and complexity metrics change."
+COMPLEXITY_GUIDE_TEXT = "The complexity analyser allows you to see the time complexity of Prim's algorithm for a series of complete graphs. You can specify the maximum number of nodes and the size of the step interval between plotted points.\n\n" + "1. Select No. of Comparisons/Execution Time/Memory in the top left to specify the complexity metrics you want to collect.\n\n" + "2. Use the sliders to specify the maximum number of nodes and the step interval for the chart data.\n\n" + "3. Click the Analyse button to start the analysis.\n\n" + "4. After a short while, the generated chart will display the time complexity of Prim's algorithm for the series of complete graphs. Complexity data will be displayed below the sliders.\n\n" + "5. Change the slider parameters and click the Analyse button again to see how the time complexity and complexity metrics change."
 
 FAQ_TEXT = "Q: What is a complete graph?\n\n" + "A complete graph is a graph where there is an edge between every pair of nodes. In a complete graph with n nodes, there are n(n-1)/2 edges.\n\n" +  "Q: What formats can I import a graph in?\n\n" + "You can import a graph in JSON format. The JSON file should contain a list of nodes, where each node has a valid alphabetical identifier (eg. A, B, C...) and valid x/y coordiantes for the canvas (Canvas width is 600 and height is 700) and a list of edges, where each edge is listed with a start and end node and a weight.\n\n" + "Q: What format are exported graphs in?\n\n" + "Exported graphs are in the same JSON format as imported graphs. You can save the JSON file and import it back into the graph visualiser at a later time.\n\n"
 
 
+# How often (ms) the complexity analyser checks the sweep thread's queue for new results
+SWEEP_POLL_INTERVAL = 100
+
+# Worker processes for parallel sweeps. None uses every core, fewer only when that many copies of the largest point's graph
+# wouldn't fit in the memory that is free, estimated at SWEEP_BYTES_PER_EDGE per edge (a triple and its CSR graph at once)
+SWEEP_POOL_WORKERS = None
+SWEEP_BYTES_PER_EDGE = 512
+
+
+# Seed for the benchmark workload generator, each sweep point's graph is derived from (seed, number of nodes)
+WORKLOAD_SEED = 0
+
+# Timing harness used by execution time analysis, untimed warm-up runs, the shortest a timed sample may be (s) and the repetitions offered
+BENCHMARK_WARMUP_RUNS = 1
+BENCHMARK_MIN_SAMPLE_TIME = 0.05
+BENCHMARK_REPETITION_OPTIONS = ["1", "3", "5", "10", "20"]
+BENCHMARK_DEFAULT_REPETITIONS = "5"
+
+# On-disk cache of measured sweep points, only reused on the same machine and library versions. Oldest points go past the size limit
+SWEEP_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".vp_cache", "sweeps.sqlite3")
+SWEEP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+# Canvas geometry, node circles are drawn with NODE_RADIUS and clicks within EDGE_PICK_TOLERANCE px of an edge's line select it.
+# Nodes and edges are indexed in a grid of SPATIAL_INDEX_CELL_SIZE px cells so hit-testing doesn't scan the whole graph
+NODE_RADIUS = 18
+EDGE_PICK_TOLERANCE = 4
+SPATIAL_INDEX_CELL_SIZE = 64
+
+# Canvas redraws are coalesced to at most CANVAS_FRAME_RATE per second, bursts of resize events become one rescale per frame
+CANVAS_FRAME_RATE = 60
+CANVAS_FRAME_INTERVAL = round(1000 / CANVAS_FRAME_RATE)  # ms
+
+# Canvas tags. Every item is tagged with its layer, listed bottom to top so the z-order is restored with one raise per layer,
+# and edges with their state so the MST view and colour resets are tag-wide rather than per item
+EDGE_LAYER, MARKER_LAYER, LABEL_LAYER, NODE_LAYER, NODE_LABEL_LAYER = "edges", "markers", "labels", "nodes", "node_labels"
+CANVAS_LAYERS = (EDGE_LAYER, MARKER_LAYER, LABEL_LAYER, NODE_LAYER, NODE_LABEL_LAYER)
+MST_TAG, NON_MST_TAG = "mst", "non_mst"
+
+
 # Color configurations
 FRAME_FG_COLOR = "#2b2828"
 FRAME_BG_COLOR = "#2b2828"
@@ -1,27 +1,41 @@
 import json
-from tkinter import messagebox, filedialog
+import itertools
+import time
 from interface.edge import Edge
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph
+from interface.vp_kruskal import DisjointSet
 
 
-# Checks if the graph is connected using depth-first search
-def is_graph_connected(V, E):
-    if not V:
+# Checks if the graph is connected, accepts an IndexedGraph in place of V
+def is_graph_connected(V, E=None):
+    labels = connected_component_labels(V, E)
+    if not labels:
         return False    # Return false if no vertices are present
 
-    visited = set()     # For tracking all V that have been visited
+    return max(labels.values()) == 0  # Only returns true if every vertex is in the first component, this would mean graph is connected
 
-    def dfs(v):
-        if v in visited:
-            return      # Returns immediately if vertex is in visited to stop duplicate additions
-        visited.add(v)  # Adds v to visited if it was previously unvisited
-        for u in V:
-            if (v, u) in E or (u, v) in E:  # Checks if there is an edge between two vertices,
-                dfs(u)                      # if so, dfs recursively called
 
-    # Start depth-first search from the first node in V
-    dfs(next(iter(V)))
+# Labels every vertex with the number of its connected component using union-find over the edge list, near-linear and non-recursive
+def connected_component_labels(V, E=None):
+    graph = V if isinstance(V, IndexedGraph) else IndexedGraph(V, E)
+    components = DisjointSet(graph.num_vertices)
 
-    return visited == V #  Only returns true if list of visited vertices matches original list of vertices, this would mean graph is connected
+    for start, end in zip(graph.edge_start, graph.edge_end):
+        if components.num_sets == 1:
+            break   # Already connected, the remaining edges can't change anything
+        components.union(start, end)
+
+    # Components are numbered in order of their first vertex in V
+    numbers = {}
+    return {identifier: numbers.setdefault(components.find(i), len(numbers)) for i, identifier in enumerate(graph.identifiers)}
+
+
+# Groups vertex identifiers by their component label, for describing a disconnected graph
+def group_components(labels):
+    groups = {}
+    for identifier, label in labels.items():
+        groups.setdefault(label, []).append(identifier)
+    return [groups[label] for label in sorted(groups)]
 
 
 # Extracts the graph data from the drawn nodes and edges for generating the MST
@@ -40,6 +54,11 @@ def extract_graph_data(nodes, edges):
     return V, E, W
 
 
+# Builds the indexed graph used by the MST engines from the drawn nodes and edges
+def extract_indexed_graph(nodes, edges):
+    return IndexedGraph.from_nodes_edges(nodes, edges)
+
+
 # Generates a unique identifier for each node
 def generate_node_identifier(node_counter):
     # Generates a unique identifier for each node
@@ -51,3 +70,27 @@ def generate_node_identifier(node_counter):
         return generate_node_identifier(quotient - 1) + alphabet[remainder]
 
 
+
+# Complete graph on num_nodes vertices with unit weights as a (V, E, W) triple, module level so sweep worker processes can call it.
+# With implicit=True an ImplicitCompleteGraph is returned instead, which never stores its O(n^2) edges
+def generate_complete_graph(num_nodes, implicit=False):
+    if num_nodes < 2:
+        raise ValueError("Number of nodes must be at least 2 to generate a graph.")
+
+    if implicit:
+        return ImplicitCompleteGraph(generate_node_identifier(i) for i in range(num_nodes))
+
+    start_time = time.time()
+    print(f"Generating graph with {num_nodes} nodes...")
+
+    nodes = [generate_node_identifier(i) for i in range(num_nodes)]
+    edges = list(itertools.combinations(nodes, 2))
+    weights = [1] * len(edges)  # This creates a list with a "1" for each edge
+
+    # Combine nodes and weights
+    E = {(start, end): weight for (start, end), weight in zip(edges, weights)}
+
+    end_time = time.time()
+    print(f"Time to generate graph with {num_nodes} nodes: {end_time - start_time} seconds")
+
+    return nodes, edges, E
@@ -0,0 +1,94 @@
+#####################################################################################
+# Benchmark harness for MST engine timings, warm-up, calibration and repetitions    #
+# summarised by the median, interquartile range and a confidence interval           #
+#####################################################################################
+
+import inspect
+import math
+import time
+import numpy as np
+
+from interface.vp_engine_registry import get_engine, prepare_graph, run_engine
+from interface.config import BENCHMARK_WARMUP_RUNS, BENCHMARK_MIN_SAMPLE_TIME
+
+MAX_CALIBRATION_LOOPS = 1 << 20  # Upper bound on calls per sample, stops calibration running away on a very fast function
+
+
+# Per-call timings of one benchmarked function, all in seconds
+class TimingSummary:
+    def __init__(self, samples, loops):
+        self.samples = samples  # Seconds per call for each repetition
+        self.loops = loops  # Calls timed together in each sample, chosen by calibration
+        self.repetitions = len(samples)
+        self.median = float(np.median(samples))
+        self.q1, self.q3 = (float(q) for q in np.percentile(samples, [25, 75]))
+        self.iqr = self.q3 - self.q1
+        self.ci_low, self.ci_high = median_confidence_interval(samples)
+
+    def __repr__(self):
+        return f"TimingSummary(median={self.median:.6g}s, iqr={self.iqr:.3g}s, 95% ci=[{self.ci_low:.6g}, {self.ci_high:.6g}], n={self.repetitions}x{self.loops})"
+
+
+# Distribution-free 95% confidence interval for the median from the order statistics of the samples
+def median_confidence_interval(samples, z=1.96):
+    ordered = sorted(samples)
+    n = len(ordered)
+    low = max(math.floor((n - z * math.sqrt(n)) / 2), 0)
+    return ordered[low], ordered[n - 1 - low]
+
+
+def _time_loops(func, loops):
+    start_time = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - start_time
+
+
+# Times func after warm-up runs, calibrating how many calls make up each sample so every sample lasts at least min_sample_time
+def benchmark(func, repetitions=5, warmup=BENCHMARK_WARMUP_RUNS, min_sample_time=BENCHMARK_MIN_SAMPLE_TIME):
+    if repetitions < 1:
+        raise ValueError("At least one repetition is needed to benchmark.")
+
+    for _ in range(warmup):
+        func()
+
+    # Grow the loop count until one sample is long enough for the clock resolution and timer overhead not to matter
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= min_sample_time or elapsed <= 0 or loops >= MAX_CALIBRATION_LOOPS:
+            break   # elapsed <= 0 only happens with a stopped clock, more loops would never reach the target
+        loops = min(loops * min(10, max(2, math.ceil(min_sample_time / elapsed))), MAX_CALIBRATION_LOOPS)
+
+    # A single call that already meets the minimum is an ordinary sample, no need to throw it away
+    samples = [elapsed] if loops == 1 else []
+    while len(samples) < repetitions:
+        samples.append(_time_loops(func, loops) / loops)
+
+    return TimingSummary(samples, loops)
+
+
+# Runs the named engine once for its tree and counters, then benchmarks it on the same prepared graph, quietly for engines
+# that log so printing doesn't skew the timings. The result's "mst" timing becomes the median and the full summary is kept on result.timing_summary
+def benchmark_engine(name, graph, repetitions=5, warmup=BENCHMARK_WARMUP_RUNS, min_sample_time=BENCHMARK_MIN_SAMPLE_TIME):
+    start_time = time.perf_counter()
+    graph = prepare_graph(name, graph)
+    build_time = time.perf_counter() - start_time
+
+    result = run_engine(name, graph)    # Also the first warm-up run
+    engine = get_engine(name)
+    kwargs = {"quiet": True} if "quiet" in inspect.signature(engine).parameters else {}
+    summary = benchmark(lambda: engine(graph, **kwargs), repetitions, max(warmup - 1, 0), min_sample_time)
+
+    result.timing_summary = summary
+    result.timings["build"] = build_time
+    result.timings["mst"] = summary.median
+    result.timings["total"] = build_time + summary.median
+    return result
+
+
+# Single timed run when repetitions is None (comparison counts don't need repeating), benchmarked otherwise
+def measure_engine(name, graph, repetitions=None):
+    if repetitions is None:
+        return run_engine(name, graph)
+    return benchmark_engine(name, graph, repetitions)
@@ -0,0 +1,211 @@
+#####################################################################################
+# Headless complexity analyser, runs the same sweeps as the GUI without Tk and      #
+# writes the results as CSV/JSON with an optional PNG/SVG chart                     #
+#                                                                                   #
+#   python -m interface.vp_benchmark_cli --engine "Prim's (array)" --max-nodes 500  #
+#####################################################################################
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from interface.config import WORKLOAD_SEED, BENCHMARK_DEFAULT_REPETITIONS, SWEEP_POOL_WORKERS, SWEEP_CACHE_PATH, SWEEP_CACHE_MAX_BYTES
+from interface.vp_engine_registry import engine_names, DEFAULT_ENGINE
+from interface.vp_workloads import GRAPH_FAMILIES, WEIGHT_DISTRIBUTIONS, describe_workload
+from interface.vp_sweep_pool import shutdown_sweep_pool, sweep_node_counts, sweep_points
+from interface.vp_sweep_cache import SweepCache, environment_fingerprint
+from interface.vp_complexity_charts import comparisons_figure, execution_time_figure, memory_figure
+from interface.vp_memory_profile import workload_bytes_per_edge
+from interface.vp_complexity_fit import fit_complexity
+
+CSV_COLUMNS = ["engine", "family", "weights", "seed", "nodes", "edges", "comparisons", "total_weight", "mst_time", "build_time",
+               "total_time", "median", "q1", "q3", "ci_low", "ci_high", "repetitions", "graph_bytes", "generation_peak", "generation_rss",
+               "mst_peak", "mst_rss", "cached"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m interface.vp_benchmark_cli", description="Run a complexity analyser sweep without the GUI.")
+    parser.add_argument("--metric", choices=["comparisons", "execution_time", "memory"], default="execution_time", help="what the chart plots, execution time sweeps are benchmarked with repetitions and memory sweeps are profiled")
+    parser.add_argument("--engine", choices=engine_names(), default=DEFAULT_ENGINE)
+    parser.add_argument("--family", choices=list(GRAPH_FAMILIES), default="Complete")
+    parser.add_argument("--weights", choices=list(WEIGHT_DISTRIBUTIONS), default="Unit")
+    parser.add_argument("--seed", type=int, default=WORKLOAD_SEED)
+    parser.add_argument("--max-nodes", type=int, default=100)
+    parser.add_argument("--step", type=int, default=10)
+    parser.add_argument("--repetitions", type=int, default=None, help=f"timed repetitions per point (default {BENCHMARK_DEFAULT_REPETITIONS} for execution_time, 1 for comparisons)")
+    parser.add_argument("--parallel", action="store_true", help="measure the points in a process pool")
+    parser.add_argument("--workers", type=int, default=SWEEP_POOL_WORKERS, help="process pool size, every core by default unless the largest graph would not fit in memory that many times")
+    parser.add_argument("--csv", help="write one row per point to this CSV file")
+    parser.add_argument("--json", help="write the sweep and its environment to this JSON file")
+    parser.add_argument("--plot", help="render the chart to this .png or .svg file")
+    parser.add_argument("--cache", default=SWEEP_CACHE_PATH, help="sweep cache file")
+    parser.add_argument("--no-cache", action="store_true", help="measure every point and leave the cache untouched, memory sweeps never use the cache")
+    parser.add_argument("--clear-cache", action="store_true", help="empty the sweep cache before running")
+    args = parser.parse_args(argv)
+
+    if args.max_nodes < 3:
+        parser.error("--max-nodes must be at least 3")
+    if args.step < 1:
+        parser.error("--step must be at least 1")
+    if args.repetitions is not None and args.repetitions < 1:
+        parser.error("--repetitions must be at least 1")
+    if args.plot and os.path.splitext(args.plot)[1].lower() not in (".png", ".svg"):
+        parser.error("--plot must end in .png or .svg")
+    return args
+
+
+# None for the unit weight complete graphs, the same convention as ComplexityAnalyser.selected_workload
+def workload_from_args(args):
+    if args.family == "Complete" and args.weights == "Unit":
+        return None
+    return {"family": args.family, "weights": args.weights, "seed": args.seed}
+
+
+# Comparison counts are deterministic so they are measured once, the same choice ComplexityAnalyser.benchmark_repetitions makes
+def repetitions_from_args(args):
+    if args.metric == "execution_time":
+        return args.repetitions or int(BENCHMARK_DEFAULT_REPETITIONS)
+    return args.repetitions
+
+
+def point_record(engine, workload, n, result, cached):
+    workload = workload or {"family": "Complete", "weights": "Unit", "seed": 0}
+    summary = result.timing_summary
+    memory = result.memory_profile
+    return {
+        "engine": engine,
+        "family": workload["family"],
+        "weights": workload["weights"],
+        "seed": workload["seed"],
+        "nodes": n,
+        "edges": result.num_edges,
+        "comparisons": result.num_comparisons,
+        "total_weight": result.total_weight,
+        "mst_time": result.timings["mst"],
+        "build_time": result.timings.get("build"),
+        "total_time": result.timings.get("total"),
+        "median": summary.median if summary else None,
+        "q1": summary.q1 if summary else None,
+        "q3": summary.q3 if summary else None,
+        "ci_low": summary.ci_low if summary else None,
+        "ci_high": summary.ci_high if summary else None,
+        "repetitions": summary.repetitions if summary else None,
+        "graph_bytes": memory.graph_bytes if memory else None,
+        "generation_peak": memory.generation_peak if memory else None,
+        "generation_rss": memory.generation_rss if memory else None,
+        "mst_peak": memory.mst_peak if memory else None,
+        "mst_rss": memory.mst_rss if memory else None,
+        "cached": cached,
+    }
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+# The fitted models as plain numbers, best first
+def fit_record(fit):
+    if fit is None:
+        return None
+    return {
+        "best": fit.best.name,
+        "exponent": fit.exponent,
+        "exponent_interval": [fit.exponent_low, fit.exponent_high],
+        "coefficient_interval": [fit.coefficient_low, fit.coefficient_high],
+        "support": fit.support,
+        "models": [{"model": model.name, "coefficient": model.coefficient, "intercept": model.intercept, "aic": model.aic,
+                    "r_squared": model.r_squared} for model in fit.models],
+    }
+
+
+# Fits the metric the sweep was run for, memory sweeps have no single metric to fit
+def fit_sweep(args, nodes, results):
+    if args.metric == "memory":
+        return None
+    values = [result.num_comparisons if args.metric == "comparisons" else result.timings["mst"] for result in results]
+    return fit_complexity(nodes, values, [result.num_edges for result in results])
+
+
+def write_json(path, args, records, representations=None, fit=None):
+    with open(path, "w") as file:
+        json.dump({
+            "metric": args.metric,
+            "engine": args.engine,
+            "workload": {"family": args.family, "weights": args.weights, "seed": args.seed},
+            "max_nodes": args.max_nodes,
+            "step": args.step,
+            "repetitions": repetitions_from_args(args),
+            "environment": environment_fingerprint(),
+            "points": records,
+            "bytes_per_edge": representations,
+            "fit": fit_record(fit),
+        }, file, indent=4)
+
+
+# Renders through the Agg canvas directly, so no GUI backend is ever selected
+def write_plot(path, args, nodes, results, representations=None, fit=None):
+    description = describe_workload(workload_from_args(args))
+    if args.metric == "comparisons":
+        fig = comparisons_figure(nodes, [result.num_comparisons for result in results], f"Time complexity of {args.engine} for a series of {description} up to {args.max_nodes} nodes.", fit)
+    elif args.metric == "memory":
+        fig = memory_figure(nodes, [result.memory_profile for result in results], representations, f"Memory used by {args.engine} on a series of {description} up to {args.max_nodes} nodes.")
+    else:
+        fig = execution_time_figure(nodes, [result.timings["mst"] for result in results], [result.timing_summary for result in results], f"Execution time of {args.engine} on a series of {description} up to {args.max_nodes} nodes.", fit)
+    FigureCanvasAgg(fig)
+    fig.savefig(path)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    nodes = sweep_node_counts(args.max_nodes, args.step)
+    workload = workload_from_args(args)
+    repetitions = repetitions_from_args(args)
+    memory = args.metric == "memory"
+
+    cache = None
+    if not args.no_cache:
+        cache = SweepCache(args.cache, SWEEP_CACHE_MAX_BYTES)
+        if args.clear_cache:
+            cache.invalidate()
+
+    results = {}
+    records = {}
+    # Graph generation prints its progress, stdout is kept for the CSV rows
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            for n, result, cached in sweep_points(args.engine, nodes, repetitions, workload, args.parallel, args.workers, cache, memory):
+                results[n] = result
+                records[n] = point_record(args.engine, workload, n, result, cached)
+                print(f"{n} nodes: {result.num_comparisons} comparisons, {result.timings['mst']:.6f}s{' (cached)' if cached else ''} ({len(results)}/{len(nodes)})")
+        finally:
+            shutdown_sweep_pool()
+        representations = workload_bytes_per_edge(nodes[-1], workload) if memory else None
+
+    fit = fit_sweep(args, nodes, [results[n] for n in nodes])
+    if fit is not None:
+        print(f"Fitted complexity: {fit.describe()}", file=sys.stderr)
+
+    ordered = [records[n] for n in nodes]
+    if args.csv:
+        write_csv(args.csv, ordered)
+    if args.json:
+        write_json(args.json, args, ordered, representations, fit)
+    if args.plot:
+        write_plot(args.plot, args, nodes, [results[n] for n in nodes], representations, fit)
+    if not (args.csv or args.json):
+        writer = csv.DictWriter(sys.stdout, fieldnames=CSV_COLUMNS)    # Nowhere else asked for, so the rows go to stdout
+        writer.writeheader()
+        writer.writerows(ordered)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
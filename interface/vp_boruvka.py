@@ -0,0 +1,115 @@
+#####################################################################################
+# Borůvka's algorithm MST, vectorised over NumPy edge arrays                        #
+#####################################################################################
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from interface.vp_graph_core import as_indexed_graph
+
+NO_EDGE = np.iinfo(np.int64).max  # Rank stored for components with no outgoing edge
+
+
+# Edge arrays held by each worker process, set once by _init_shard_worker so rounds only send the component labels
+_shard_edges = None
+
+
+def _init_shard_worker(start, end, rank):
+    global _shard_edges
+    _shard_edges = (start, end, rank)
+
+
+# Cheapest outgoing edge rank per component for edges [lo, hi), returned as compact (components, ranks) arrays
+def _cheapest_in_shard(comp, lo, hi):
+    start, end, rank = _shard_edges
+    comp_start, comp_end = comp[start[lo:hi]], comp[end[lo:hi]]
+    crossing = comp_start != comp_end
+    return cheapest_outgoing(comp_start[crossing], comp_end[crossing], rank[lo:hi][crossing], len(comp))
+
+
+# Segmented min over edges, best[c] is the lowest rank among edges leaving component c
+def cheapest_outgoing(comp_start, comp_end, rank, n):
+    best = np.full(n, NO_EDGE, dtype=np.int64)
+    np.minimum.at(best, comp_start, rank)
+    np.minimum.at(best, comp_end, rank)
+    found = np.flatnonzero(best != NO_EDGE)
+    return found, best[found]
+
+
+def boruvka_minimum_spanning_tree(graph, processes=None, stats=None):
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+    n = graph.num_vertices
+    start = np.frombuffer(graph.edge_start, dtype=np.int64)
+    end = np.frombuffer(graph.edge_end, dtype=np.int64)
+    Te = set()  # Set of edges in the minimum spanning tree
+    num_comparisons = 0
+    round_times = []
+
+    # Ranks break weight ties by edge id, so every component agrees on a single cheapest edge and no cycle can form
+    by_weight = np.argsort(np.asarray(graph.edge_weights), kind='stable')
+    rank = np.empty(graph.num_edges, dtype=np.int64)
+    rank[by_weight] = np.arange(graph.num_edges)
+
+    comp = np.arange(n)  # Component label of each vertex, always the index of the component's root vertex
+    live = np.flatnonzero(start != end)  # Edges that can still join two components
+
+    pool = None
+    if processes and processes > 1:
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_shard_worker, initargs=(start, end, rank))
+
+    try:
+        while live.size:
+            round_start = time.perf_counter()
+
+            # Find the cheapest edge leaving every component
+            if pool:
+                bounds = np.linspace(0, graph.num_edges, processes + 1).astype(int)
+                shards = pool.map(_cheapest_in_shard, [comp] * processes, bounds[:-1], bounds[1:])
+                best = np.full(n, NO_EDGE, dtype=np.int64)
+                for components, ranks in shards:
+                    np.minimum.at(best, components, ranks)
+                components = np.flatnonzero(best != NO_EDGE)
+                ranks = best[components]
+                num_comparisons += 2 * graph.num_edges  # Every shard edge is compared against both endpoint components
+            else:
+                comp_start, comp_end = comp[start[live]], comp[end[live]]
+                crossing = comp_start != comp_end
+                live = live[crossing]   # Edges inside a component never become useful again
+                components, ranks = cheapest_outgoing(comp_start[crossing], comp_end[crossing], rank[live], n)
+                num_comparisons += 2 * live.size  # Each live edge is compared in the segment of both endpoint components
+
+            if components.size == 0:
+                break   # Every remaining component is isolated, the graph is disconnected
+
+            chosen = by_weight[ranks]
+            for edge_id in np.unique(chosen).tolist():
+                Te.add(graph.edges[edge_id])
+
+            # Contract, each component points at the component across its chosen edge
+            parent = np.arange(n)
+            comp_a, comp_b = comp[start[chosen]], comp[end[chosen]]
+            parent[components] = np.where(comp_a == components, comp_b, comp_a)
+
+            # Two components that chose the same edge point at each other, the lower label becomes the root
+            mutual = (parent[parent[components]] == components) & (components < parent[components])
+            parent[components[mutual]] = components[mutual]
+
+            # Pointer jumping until every component points straight at its root
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+            comp = parent[comp]
+
+            round_times.append(time.perf_counter() - round_start)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    if stats is not None:
+        stats["rounds"] = len(round_times)
+        stats["round_times"] = round_times
+
+    return Te, num_comparisons
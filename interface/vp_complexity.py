@@ -12,6 +12,8 @@ import itertools
 import numpy as np
 import psutil
 import os
+import queue
+import threading
 
 from interface.node import Node
 from interface.edge import Edge
@@ -19,10 +21,17 @@ from interface.vp_complexity_gui import ComplexityGUI
 from interface.utils import *
 from interface.config import *
 
-from interface.vp_prims_algorithm import prim_minimum_spanning_tree
+from interface.vp_benchmark import measure_engine
+from interface.vp_engine_registry import supports_implicit_graph
+from interface.vp_workloads import generate_workload, describe_workload
+from interface.vp_sweep_pool import shutdown_sweep_pool, sweep_node_counts, sweep_points
+from interface.vp_sweep_cache import SweepCache
+from interface.vp_complexity_charts import comparisons_figure, execution_time_figure, memory_figure
+from interface.vp_memory_profile import profile_engine_memory, workload_bytes_per_edge
+from interface.vp_complexity_fit import fit_complexity
 
 class ComplexityAnalyser(ComplexityGUI):
-    def __init__(self):
+    def __init__(self, sweep_cache_path=SWEEP_CACHE_PATH):
         super().__init__()
 
         self.nodes = []  # List to store nodes
@@ -31,46 +40,204 @@ class ComplexityAnalyser(ComplexityGUI):
         self.node_counter = 0  # Counter to keep track of the number of nodes
         self.processor = platform.processor()
 
+        self.sweep_thread = None  # Background thread running the current sweep, if any
+        self.sweep_queue = None
+        self.sweep_cancel = None
+        self.sweep_cache = SweepCache(sweep_cache_path, SWEEP_CACHE_MAX_BYTES)  # Tests pass a throwaway file rather than the user's cache
+
         
     def analyse(self, analysis_type):
+        max_nodes, nodes = self.sweep_settings(analysis_type)
+
+        self.clear_graph()
+        self.clear_metrics()
+
+        engine = self.engine_var.get()
+        repetitions = self.benchmark_repetitions(analysis_type)
+        workload = self.selected_workload()
+        memory = analysis_type == "memory"
+        results = [self.measure_point(engine, n, repetitions, workload, memory) for n in nodes]
+        self.sweep_representations = workload_bytes_per_edge(nodes[-1], workload) if memory else None
+        self.show_results(analysis_type, max_nodes, nodes, results)
+
+
+    # Runs the same sweep as analyse on a background thread so the window stays responsive, results come back through a queue
+    def start_analysis(self, analysis_type):
+        if self.sweep_thread is not None and self.sweep_thread.is_alive():
+            return  # Only one sweep at a time, the Analyse buttons are disabled while one runs anyway
+
+        self.sweep_type = analysis_type
+        self.sweep_max_nodes, self.sweep_nodes = self.sweep_settings(analysis_type)
+        self.sweep_results = {}  # Node count -> result, parallel sweeps finish points out of order
+        self.sweep_representations = None
+
+        self.clear_graph()
+        self.clear_metrics()
+        self.set_sweep_running(True)
+
+        self.sweep_queue = queue.Queue()
+        self.sweep_cancel = threading.Event()
+        memory = analysis_type == "memory"
+        self.sweep_thread = threading.Thread(target=self.run_sweep, args=(self.engine_var.get(), self.sweep_nodes, self.sweep_queue, self.sweep_cancel, self.parallel_var.get(), self.benchmark_repetitions(analysis_type), self.selected_workload(), self.sweep_cache, memory), daemon=True)
+        self.sweep_thread.start()
+        self.after(SWEEP_POLL_INTERVAL, self.poll_sweep)
+
+
+    # Runs on the sweep thread and never touches widgets, Tk is not thread safe so every point goes through the queue.
+    # Memory sweeps finish by comparing the graph representations at the largest node count
+    def run_sweep(self, engine, nodes, results_queue, cancel, parallel=False, repetitions=None, workload=None, cache=None, memory=False):
+        try:
+            for n, result, _ in sweep_points(engine, nodes, repetitions, workload, parallel, SWEEP_POOL_WORKERS, cache, memory, cancel):
+                results_queue.put(("point", (n, result)))
+            if cancel.is_set():
+                results_queue.put(("cancelled", None))
+                return
+            if memory:
+                results_queue.put(("representations", workload_bytes_per_edge(nodes[-1], workload)))
+        except Exception as e:
+            results_queue.put(("error", str(e)))
+            return
+        results_queue.put(("done", None))
+
+
+    # Drains the sweep queue on the Tk thread, rescheduling itself with after() until the sweep finishes
+    def poll_sweep(self):
+        total = len(self.sweep_nodes)
+        while True:
+            try:
+                kind, payload = self.sweep_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "point":
+                n, result = payload
+                self.sweep_results[n] = result
+                done = len(self.sweep_results)
+                self.sweep_progress.set(done / total)
+                self.sweep_status_label.configure(text=f"{n} nodes: {result.num_comparisons} comparisons, {result.timings['mst']:.4f}s ({done}/{total})")
+            elif kind == "representations":
+                self.sweep_representations = payload
+            elif kind == "done":
+                self.set_sweep_running(False)
+                self.sweep_status_label.configure(text=f"Analysis complete ({total}/{total})")
+                self.show_results(self.sweep_type, self.sweep_max_nodes, self.sweep_nodes, [self.sweep_results[n] for n in self.sweep_nodes])
+                return
+            elif kind == "cancelled":
+                self.set_sweep_running(False)
+                self.sweep_status_label.configure(text=f"Cancelled after {len(self.sweep_results)} of {total} points")
+                return
+            else:
+                self.set_sweep_running(False)
+                self.sweep_status_label.configure(text="Analysis failed")
+                messagebox.showerror("Analysis Error", payload, parent=self)
+                return
+
+        self.after(SWEEP_POLL_INTERVAL, self.poll_sweep)
+
+
+    # The sweep thread checks this between points, the point being measured is allowed to finish
+    def cancel_analysis(self):
+        if self.sweep_thread is not None and self.sweep_thread.is_alive():
+            self.sweep_cancel.set()
+            self.sweep_cancel_button.configure(state='disabled')
+            self.sweep_status_label.configure(text="Cancelling after the current point...")
+
+
+    # Forgets every cached point, along with any left behind by other machines or library versions
+    def clear_sweep_cache(self):
+        removed = self.sweep_cache.invalidate()
+        self.sweep_status_label.configure(text=f"Cleared {removed} cached point{'s' if removed != 1 else ''}")
+
+
+    def set_sweep_running(self, running):
+        self.comp_tab_analyse_button.configure(state='disabled' if running else 'normal')
+        self.exec_tab_analyse_button.configure(state='disabled' if running else 'normal')
+        self.mem_tab_analyse_button.configure(state='disabled' if running else 'normal')
+        self.engine_menu.configure(state='disabled' if running else 'normal')
+        self.family_menu.configure(state='disabled' if running else 'normal')
+        self.weights_menu.configure(state='disabled' if running else 'normal')
+        self.parallel_switch.configure(state='disabled' if running else 'normal')
+        self.clear_cache_button.configure(state='disabled' if running else 'normal')
+        self.sweep_cancel_button.configure(state='normal' if running else 'disabled')
+        if running:
+            self.sweep_progress.set(0)
+            self.sweep_status_label.configure(text=f"Starting analysis (0/{len(self.sweep_nodes)})")
+
+
+    # Returns the maximum node count and the list of node counts to measure, read from the sliders of the chosen tab
+    def sweep_settings(self, analysis_type):
         if analysis_type == "comparisons":
             max_nodes = int(self.comp_slider.get())
             steps = int(self.comp_steps_slider.get())
         elif analysis_type == "execution_time":
             max_nodes = int(self.exec_slider.get())
             steps = int(self.exec_steps_slider.get())
+        elif analysis_type == "memory":
+            max_nodes = int(self.mem_slider.get())
+            steps = int(self.mem_steps_slider.get())
         else:
-            raise ValueError("Invalid analysis type provided. Choose either 'comparisons' or 'execution_time'.")
+            raise ValueError("Invalid analysis type provided. Choose either 'comparisons', 'execution_time' or 'memory'.")
 
-        self.clear_graph()
-        self.clear_metrics()
+        return max_nodes, sweep_node_counts(max_nodes, steps)
 
-        initial_range = list(range(2, max_nodes, steps))
-        if max_nodes - initial_range[-1] > steps / 2:
-            initial_range.append(max_nodes)
-        
-        nodes = initial_range
-        comparisons = []
-        execution_times = []
 
-        for n in nodes:
-            graph = self.generate_complete_graph(n)
-            start_time = time.perf_counter()
-            _, num_comparisons = prim_minimum_spanning_tree(graph)
-            end_time = time.perf_counter()
+    # Execution time sweeps benchmark every point with the chosen repetitions, comparison counts are deterministic so run once
+    def benchmark_repetitions(self, analysis_type):
+        if analysis_type == "execution_time":
+            return int(self.repetitions_var.get())
+        return None
+
 
-            comparisons.append(num_comparisons)
-            execution_time = end_time - start_time
-            execution_times.append(execution_time)
-            print(f"Prim's execution time on graph with {n} nodes: {execution_time} seconds")
+    # None for the original unit weight complete graphs, otherwise the generate_workload arguments for the chosen family
+    def selected_workload(self):
+        if self.family_var.get() == "Complete" and self.weights_var.get() == "Unit":
+            return None
+        return {"family": self.family_var.get(), "weights": self.weights_var.get(), "seed": WORKLOAD_SEED}
 
+
+    # Describes the graphs being measured for chart titles
+    def workload_description(self):
+        return describe_workload(self.selected_workload())
+
+
+    # Generates the graph for one sweep point and runs the engine on it, safe to call from the sweep thread.
+    # With memory=True the generation and the MST run are memory profiled instead of timed
+    def measure_point(self, engine, n, repetitions=None, workload=None, memory=False):
+        implicit = supports_implicit_graph(engine)  # O(n) memory complete graphs for engines that can use them
+        if workload is None:
+            generate = lambda size: self.generate_complete_graph(size, implicit=implicit)
+        else:
+            generate = lambda size: generate_workload(n=size, implicit=implicit, **workload)
+        if memory:
+            result = profile_engine_memory(engine, generate, n)
+            print(f"{engine} memory on graph with {n} nodes: {result.memory_profile}")
+            return result
+        result = measure_engine(engine, generate(n), repetitions)
+        print(f"{engine} execution time on graph with {n} nodes: {result.timings['mst']} seconds")
+        return result
+
+
+    def show_results(self, analysis_type, max_nodes, nodes, results):
+        comparisons = [result.num_comparisons for result in results]
+        execution_times = [result.timings["mst"] for result in results]  # Medians when the points were benchmarked
+        mst_edges = results[-1].tree_edges
+        num_edges = int((max_nodes * (max_nodes - 1)) / 2) if self.selected_workload() is None else results[-1].num_edges
+        edges = None if self.selected_workload() is None else [result.num_edges for result in results]   # None is complete graphs to the fit
+
+        # Both the time and the comparison count reported are the max node graph's, the last point of the sweep
         if analysis_type == "comparisons":
-            self.display_complexity_metrics(max_nodes, int((max_nodes * (max_nodes - 1)) / 2) , _, (execution_times[len(execution_times) - 1])/len(execution_times), comparisons[-1], self.processor)
-            self.visualize_complexity(nodes, comparisons)
+            self.display_complexity_metrics(max_nodes, num_edges, mst_edges, execution_times[-1], comparisons[-1], self.processor)
+            self.visualize_complexity(nodes, comparisons, edges)
         elif analysis_type == "execution_time":
-            self.display_complexity_metrics(max_nodes, int((max_nodes * (max_nodes - 1)) / 2), _, (execution_times[len(execution_times) - 1])/len(execution_times), num_comparisons, self.processor)
-            self.visualize_execution_time(nodes, execution_times)
-        
+            self.display_complexity_metrics(max_nodes, num_edges, mst_edges, execution_times[-1], comparisons[-1], self.processor)
+            if results[-1].timing_summary is not None:
+                self.display_timing_metrics(results[-1].timing_summary)
+            self.visualize_execution_time(nodes, execution_times, [result.timing_summary for result in results], edges)
+        elif analysis_type == "memory":
+            self.display_complexity_metrics(max_nodes, num_edges, mst_edges, execution_times[-1], comparisons[-1], self.processor)
+            self.display_memory_metrics(results[-1].memory_profile, self.sweep_representations)
+            self.visualize_memory(nodes, [result.memory_profile for result in results], self.sweep_representations)
+
 
     def clear_graph(self):
         # Clear graph visualization
@@ -84,49 +251,16 @@ class ComplexityAnalyser(ComplexityGUI):
             widget.destroy()
 
 
-    def generate_complete_graph(self, num_nodes):
-        if num_nodes < 2:
-            raise ValueError("Number of nodes must be at least 2 to generate a graph.")
-        
-        start_time = time.time()
-        print(f"Generating graph with {num_nodes} nodes...")
-
-        nodes = [generate_node_identifier(i) for i in range(num_nodes)]
-        edges = list(itertools.combinations(nodes, 2))
-        weights = [1] * len(edges)  # This creates a list with a "1" for each edge
-
-        # Combine nodes and weights
-        E = {(start, end): weight for (start, end), weight in zip(edges, weights)}        
-
-        end_time = time.time()
-        print(f"Time to generate graph with {num_nodes} nodes: {end_time - start_time} seconds")
-        
-        return nodes, edges, E
+    def generate_complete_graph(self, num_nodes, implicit=False):
+        return generate_complete_graph(num_nodes, implicit)
     
     
-    def visualize_complexity(self, nodes, comparisons):
-        # Create a Matplotlib figure and axis for plotting
-        fig = Figure(figsize=(10, 5))
-        ax = fig.add_subplot(111)
-
+    # edges is the edge count of each point's graph, the O(m log n) model needs it. None means complete graphs
+    def visualize_complexity(self, nodes, comparisons, edges=None):
         print(f"Comaprisons in visualising complexity function: {comparisons}")
-        # Plot the number of comparisons against the number of nodes
-        ax.plot(nodes, comparisons, label='Your graph', color='red', marker='o')
-
-        # Optionally, plot theoretical complexity for comparison, e.g., O(n^2) or O(n log n), depending on the expected complexity
-        # For demonstration, plotting an n^2 complexity curve
-        nsquared = [n**2 for n in nodes]
-        ax.plot(nodes, nsquared, label='$O(n^2)$ (Theoretical)', linestyle='dotted', color='blue', marker='.')
-
-        # Labeling the plot
-        ax.set_xlabel("Number of nodes")
-        if comparisons[len(comparisons) - 1] > 900000:
-            ax.set_ylabel("Number of comparisons (million)")
-        else:
-            ax.set_ylabel("Number of comparisons")
-        ax.set_title(f"Time complexity of Prim's for a series of complete graphs up to {int(self.comp_slider.get())} nodes.")
-        ax.legend()
-        ax.grid(True)
+        fit = fit_complexity(nodes, comparisons, edges)
+        print(f"Fitted complexity: {fit}")
+        fig = comparisons_figure(nodes, comparisons, f"Time complexity of {self.engine_var.get()} for a series of {self.workload_description()} up to {int(self.comp_slider.get())} nodes.", fit)
 
         # Embed the figure in the right frame (assuming 'self.right_frame' is your designated area for plots)
         canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
@@ -134,32 +268,21 @@ class ComplexityAnalyser(ComplexityGUI):
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
 
-    def visualize_execution_time(self, nodes, execution_times):
-        # Create a Matplotlib figure and axis for plotting
-        fig = Figure(figsize=(10, 5))
-        ax = fig.add_subplot(111)
-
+    def visualize_execution_time(self, nodes, execution_times, timing_summaries=None, edges=None):
         print(f"Execution times: {execution_times}")
-        # Plot the number of comparisons against the number of nodes
-        ax.plot(nodes, execution_times, label='Your graph', color='red', linestyle="dashed", marker='o')
-
-        # Fit the O(n^2) curve
-        # Use a polynomial of degree 2 because we're fitting an n^2 curve
-        coefficients = np.polyfit(nodes, execution_times, 2)
-        # Generate a polynomial function from the coefficients
-        polynomial = np.poly1d(coefficients)
-        # Calculate the fitted y-values
-        fitted_execution_times = polynomial(nodes)
-
-        # Plot the fitted O(n^2) curve
-        ax.plot(nodes, fitted_execution_times, label='$O(n^2)$ (Theoretical)', linestyle='dotted', color='blue', marker='.')
-
-        # Labeling the plot
-        ax.set_xlabel("Number of nodes")
-        ax.set_ylabel("Execution time (s)")
-        ax.set_title(f"Execution time of Prim's algorithm on a series of complete graphs up to {int(self.exec_slider.get())} nodes.")
-        ax.legend()
-        ax.grid(True)
+        fit = fit_complexity(nodes, execution_times, edges)
+        print(f"Fitted complexity: {fit}")
+        fig = execution_time_figure(nodes, execution_times, timing_summaries, f"Execution time of {self.engine_var.get()} on a series of {self.workload_description()} up to {int(self.exec_slider.get())} nodes.", fit)
+
+        # Embed the figure in the right frame (assuming 'self.right_frame' is your designated area for plots)
+        canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+
+    def visualize_memory(self, nodes, memory_profiles, representations=None):
+        print(f"Memory profiles: {memory_profiles}")
+        fig = memory_figure(nodes, memory_profiles, representations, f"Memory used by {self.engine_var.get()} on a series of {self.workload_description()} up to {int(self.mem_slider.get())} nodes.")
 
         # Embed the figure in the right frame (assuming 'self.right_frame' is your designated area for plots)
         canvas = FigureCanvasTkAgg(fig, master=self.right_frame)
@@ -172,11 +295,27 @@ class ComplexityAnalyser(ComplexityGUI):
         ctk.CTkLabel(self.lower_left_frame, text=f"Maximum number of nodes specified: {num_nodes}", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
         ctk.CTkLabel(self.lower_left_frame, text=f"Number of edges in max node graph: {edges}", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
         ctk.CTkLabel(self.lower_left_frame, text=f"Number of edges in MST of max node graph: {int(num_nodes - 1)}", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
-        ctk.CTkLabel(self.lower_left_frame, text=f"Average Prim's execution time: {execution_time:.6f} seconds", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+        ctk.CTkLabel(self.lower_left_frame, text=f"Median execution time on max node graph: {execution_time:.6f} seconds", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
         ctk.CTkLabel(self.lower_left_frame, text=f"Number of comparisons: {num_comparisons}", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
 
+
+    def display_timing_metrics(self, timing_summary):
+        # How far the median time of the max node graph can be trusted, from the spread of its repetitions
+        ctk.CTkLabel(self.lower_left_frame, text=f"95% confidence interval for the median: {timing_summary.ci_low:.6f} - {timing_summary.ci_high:.6f} seconds", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+        ctk.CTkLabel(self.lower_left_frame, text=f"Interquartile range: {timing_summary.iqr:.6f} seconds over {timing_summary.repetitions} repetitions", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+
+
+    def display_memory_metrics(self, memory_profile, representations=None):
+        # Memory of the max node graph, in MiB, followed by the bytes per edge of each representation
+        ctk.CTkLabel(self.lower_left_frame, text=f"Graph generation peak: {memory_profile.generation_peak / 2**20:.2f} MiB (RSS {memory_profile.generation_rss / 2**20:+.2f} MiB)", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+        ctk.CTkLabel(self.lower_left_frame, text=f"MST run peak: {memory_profile.mst_peak / 2**20:.2f} MiB (RSS {memory_profile.mst_rss / 2**20:+.2f} MiB)", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+        for name, bytes_per_edge in (representations or {}).items():
+            ctk.CTkLabel(self.lower_left_frame, text=f"{name}: {bytes_per_edge:.1f} bytes per edge", font = COMPLEXITY_SUBTITLE_FONT, anchor='center').pack(side=tk.TOP, fill=tk.X)
+
     
     def return_to_main_menu(self):
+        self.cancel_analysis()  # The sweep thread is a daemon, it stops at the next point instead of running on unseen
+        shutdown_sweep_pool()
         self.destroy()
         from interface.vp_main_gui import MainMenu    #Importing here to avoid circular import
         main_menu = MainMenu()  
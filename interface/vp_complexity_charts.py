@@ -0,0 +1,114 @@
+#####################################################################################
+# Complexity analyser charts, built on a plain matplotlib Figure so the same chart  #
+# can be embedded in Tk or rendered headless with Agg                               #
+#####################################################################################
+
+from matplotlib.figure import Figure
+
+
+# fit is the ComplexityFit of the comparisons, its best model is drawn over the measurements when there is one
+def comparisons_figure(nodes, comparisons, title, fit=None):
+    # Create a Matplotlib figure and axis for plotting
+    fig = Figure(figsize=(10, 5))
+    ax = fig.add_subplot(111)
+    scale = 1e6 if comparisons[len(comparisons) - 1] > 900000 else 1
+
+    # Plot the number of comparisons against the number of nodes
+    ax.plot(nodes, [value / scale for value in comparisons], label='Your graph', color='red', marker='o')
+
+    # Plot the model that fitted the measurements best rather than assuming one
+    if fit is not None:
+        sizes, fitted = fit.curve()
+        ax.plot(sizes, fitted / scale, label=fit.label(), linestyle='dotted', color='blue', marker='.')
+
+    # Labeling the plot
+    ax.set_xlabel("Number of nodes")
+    if scale > 1:
+        ax.set_ylabel("Number of comparisons (million)")
+    else:
+        ax.set_ylabel("Number of comparisons")
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+# fit is the ComplexityFit of the execution times, its best model is drawn over the measurements when there is one
+def execution_time_figure(nodes, execution_times, timing_summaries, title, fit=None):
+    # Create a Matplotlib figure and axis for plotting
+    fig = Figure(figsize=(10, 5))
+    ax = fig.add_subplot(111)
+
+    # Plot the median execution time against the number of nodes, with the interquartile range as error bars when benchmarked
+    if timing_summaries and all(timing_summaries):
+        spread = [[summary.median - summary.q1 for summary in timing_summaries], [summary.q3 - summary.median for summary in timing_summaries]]
+        ax.errorbar(nodes, execution_times, yerr=spread, label='Your graph (median, IQR)', color='red', linestyle="dashed", marker='o', capsize=4)
+    else:
+        ax.plot(nodes, execution_times, label='Your graph', color='red', linestyle="dashed", marker='o')
+
+    # Plot the model that fitted the measurements best rather than assuming one
+    if fit is not None:
+        sizes, fitted = fit.curve()
+        ax.plot(sizes, fitted, label=fit.label(), linestyle='dotted', color='blue', marker='.')
+
+    # Labeling the plot
+    ax.set_xlabel("Number of nodes")
+    ax.set_ylabel("Execution time (s)")
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    return fig
+
+
+# Peak traced memory and RSS growth of each sweep point, next to the bytes per edge of each graph representation
+def memory_figure(nodes, memory_profiles, representations, title):
+    fig = Figure(figsize=(10, 5))
+    ax, bars = fig.subplots(1, 2, gridspec_kw={"width_ratios": [3, 2]})
+    megabytes = lambda values: [value / 2**20 for value in values]
+
+    # Traced peaks as solid lines, RSS growth dashed in the same colour
+    ax.plot(nodes, megabytes(profile.generation_peak for profile in memory_profiles), label='Generation peak (traced)', color='red', marker='o')
+    ax.plot(nodes, megabytes(profile.generation_rss for profile in memory_profiles), label='Generation RSS growth', color='red', linestyle='dashed')
+    ax.plot(nodes, megabytes(profile.mst_peak for profile in memory_profiles), label='MST run peak (traced)', color='blue', marker='o')
+    ax.plot(nodes, megabytes(profile.mst_rss for profile in memory_profiles), label='MST run RSS growth', color='blue', linestyle='dashed')
+    ax.plot(nodes, megabytes(profile.graph_bytes for profile in memory_profiles), label='Graph held', color='green', linestyle='dotted', marker='.')
+
+    ax.set_xlabel("Number of nodes")
+    ax.set_ylabel("Memory (MiB)")
+    fig.suptitle(title)
+    ax.legend(fontsize='small')
+    ax.grid(True)
+
+    # Log scale, the implicit graph and the dense matrix on a sparse graph are orders of magnitude apart
+    if representations:
+        names = list(representations)
+        container = bars.barh(names, [max(representations[name], 1e-3) for name in names], color='#4D85AC')
+        bars.bar_label(container, fmt='%.1f', padding=2)
+        bars.set_xscale('log')
+        bars.tick_params(axis='x', which='minor', labelbottom=False)
+        bars.invert_yaxis()
+        bars.set_xlabel("Bytes per edge")
+        bars.set_title(f"Graph representations at {nodes[-1]} nodes")
+        bars.grid(True, axis='x')
+    fig.tight_layout()
+    return fig
+
+
+# Median time of every implementation against the number of nodes with the interquartile range as error bars.
+# Log scale, the compiled programs are orders of magnitude faster than the Python ones
+def languages_figure(summaries, title):
+    fig = Figure(figsize=(10, 5))
+    ax = fig.add_subplot(111)
+    implementations = list(dict.fromkeys(summary["implementation"] for summary in summaries))
+    for implementation in implementations:
+        points = [summary for summary in summaries if summary["implementation"] == implementation]
+        spread = [[point["median"] - point["q1"] for point in points], [point["q3"] - point["median"] for point in points]]
+        ax.errorbar([point["nodes"] for point in points], [point["median"] for point in points], yerr=spread, label=implementation, marker='o', capsize=3)
+
+    ax.set_yscale('log')
+    ax.set_xlabel("Number of nodes")
+    ax.set_ylabel("Execution time (s)")
+    ax.set_title(title)
+    ax.legend(fontsize='small')
+    ax.grid(True)
+    return fig
@@ -0,0 +1,126 @@
+#####################################################################################
+# Empirical complexity fitting, the growth exponent from a log-log regression and  #
+# a choice between candidate models by goodness of fit, both with bootstrap        #
+# confidence bounds                                                                 #
+#####################################################################################
+
+import numpy as np
+
+# Candidate growth models as functions of the vertex and edge counts, m log n separates sparse from dense workloads
+COMPLEXITY_MODELS = {
+    "O(n)": lambda n, m: n,
+    "O(n log n)": lambda n, m: n * np.log2(n),
+    "O(n^2)": lambda n, m: n ** 2,
+    "O(m log n)": lambda n, m: m * np.log2(n),
+}
+
+# Matplotlib mathtext labels for the chart legends
+MODEL_LABELS = {"O(n)": "$O(n)$", "O(n log n)": "$O(n \\log n)$", "O(n^2)": "$O(n^2)$", "O(m log n)": "$O(m \\log n)$"}
+
+BOOTSTRAP_RESAMPLES = 1000
+CONFIDENCE = 0.95
+
+
+class ModelFit:
+    def __init__(self, name, coefficient, intercept, rss, r_squared, num_points):
+        self.name = name
+        self.coefficient = coefficient  # y is modelled as coefficient * f(n, m) + intercept, the intercept absorbs fixed overheads
+        self.intercept = intercept
+        self.rss = rss  # Sum of squared relative residuals, points are weighted by 1/y so small graphs count as much as large ones
+        self.r_squared = r_squared
+        self.aic = num_points * np.log(max(rss, 1e-300) / num_points) + 2 * 2  # Two parameters in every model, so AIC ranks them by rss
+
+    def predict(self, sizes, edges):
+        return self.coefficient * COMPLEXITY_MODELS[self.name](np.asarray(sizes, dtype=np.float64), np.asarray(edges, dtype=np.float64)) + self.intercept
+
+    def __repr__(self):
+        return f"ModelFit({self.name}, coefficient={self.coefficient:.4g}, intercept={self.intercept:.4g}, r^2={self.r_squared:.4f})"
+
+
+class ComplexityFit:
+    def __init__(self, sizes, edges, exponent, exponent_interval, models, support, coefficient_interval):
+        self.sizes = sizes  # The points that were fitted, as float arrays
+        self.edges = edges
+        self.exponent = exponent  # Slope of log y against log n over the larger half of the sweep
+        self.exponent_low, self.exponent_high = exponent_interval
+        self.models = models  # Every candidate's ModelFit, best first
+        self.support = support  # Fraction of bootstrap resamples in which the best model also came out best
+        self.coefficient_low, self.coefficient_high = coefficient_interval  # Bootstrap interval for the best model's coefficient
+
+    @property
+    def best(self):
+        return self.models[0]
+
+    # The best model evaluated at the fitted points, for plotting against the measurements
+    def curve(self):
+        return self.sizes, self.best.predict(self.sizes, self.edges)
+
+    def label(self):
+        return f"Fitted {MODEL_LABELS[self.best.name]}, exponent {self.exponent:.2f} [{self.exponent_low:.2f}, {self.exponent_high:.2f}]"
+
+    def describe(self):
+        return (f"{self.best.name}, exponent {self.exponent:.2f} ({CONFIDENCE:.0%} CI {self.exponent_low:.2f} to {self.exponent_high:.2f}), "
+                f"best in {self.support:.0%} of resamples")
+
+    def __repr__(self):
+        return f"ComplexityFit({self.describe()})"
+
+
+# Weighted least squares for y = a * f + c with weights 1/y, so the fit minimises relative rather than absolute error
+def _fit_model(name, sizes, edges, values):
+    basis = COMPLEXITY_MODELS[name](sizes, edges)
+    design = np.column_stack((basis / values, 1 / values))
+    (coefficient, intercept), *_ = np.linalg.lstsq(design, np.ones(values.size), rcond=None)
+    residuals = 1 - design @ np.array([coefficient, intercept])
+    rss = float(residuals @ residuals)
+    fitted = coefficient * basis + intercept
+    total = float(np.sum((values - values.mean()) ** 2))
+    r_squared = 1 - float(np.sum((values - fitted) ** 2)) / total if total > 0 else 1.0
+    return ModelFit(name, float(coefficient), float(intercept), rss, r_squared, values.size)
+
+
+# Slope of log y against log n. Only the larger half of the points is used, the smallest graphs are dominated by fixed costs
+def loglog_exponent(sizes, values):
+    order = np.argsort(sizes)
+    upper = order[len(order) // 2:] if len(order) >= 6 else order
+    if np.unique(sizes[upper]).size < 2:
+        upper = order    # A bootstrap resample can repeat one large size, fall back to every point
+    slope, _ = np.polyfit(np.log(sizes[upper]), np.log(values[upper]), 1)
+    return float(slope)
+
+
+def _rank_models(sizes, edges, values):
+    return sorted((_fit_model(name, sizes, edges, values) for name in COMPLEXITY_MODELS), key=lambda fit: fit.aic)
+
+
+# Fits every candidate model and the log-log exponent to one sweep. edges defaults to complete graphs, n(n - 1) / 2.
+# Points with a value of 0 are left out (they have no logarithm), and None is returned when fewer than 3 points remain
+def fit_complexity(sizes, values, edges=None, resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    sizes = np.asarray(sizes, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    edges = sizes * (sizes - 1) / 2 if edges is None else np.asarray(edges, dtype=np.float64)
+    keep = values > 0
+    sizes, values, edges = sizes[keep], values[keep], edges[keep]
+    if np.unique(sizes).size < 3:
+        return None
+
+    models = _rank_models(sizes, edges, values)
+    exponent = loglog_exponent(sizes, values)
+
+    # Bootstrap over sweep points, resamples with fewer than 3 distinct sizes can't be fitted and are skipped
+    rng = np.random.default_rng(seed)
+    exponents, coefficients, wins = [], [], 0
+    for _ in range(resamples):
+        sample = rng.integers(0, sizes.size, size=sizes.size)
+        if np.unique(sizes[sample]).size < 3:
+            continue
+        exponents.append(loglog_exponent(sizes[sample], values[sample]))
+        ranked = _rank_models(sizes[sample], edges[sample], values[sample])
+        wins += ranked[0].name == models[0].name
+        coefficients.append(next(fit.coefficient for fit in ranked if fit.name == models[0].name))
+
+    if not exponents:
+        return ComplexityFit(sizes, edges, exponent, (exponent, exponent), models, 1.0, (models[0].coefficient, models[0].coefficient))
+    tail = (1 - CONFIDENCE) / 2 * 100
+    return ComplexityFit(sizes, edges, exponent, tuple(np.percentile(exponents, [tail, 100 - tail])), models, wins / len(exponents),
+                         tuple(np.percentile(coefficients, [tail, 100 - tail])))
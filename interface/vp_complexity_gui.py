@@ -3,6 +3,8 @@ import tkinter as tk
 from tkinter import OptionMenu, StringVar
 from interface.config import *
 from interface.utils import *
+from interface.vp_engine_registry import engine_names, DEFAULT_ENGINE
+from interface.vp_workloads import GRAPH_FAMILIES, WEIGHT_DISTRIBUTIONS
 
 # GUI class that inherits from the custom tkinter class, handles all GUI related changes except canvas changes related to Prim's
 class ComplexityGUI(ctk.CTk):
@@ -44,6 +46,48 @@ class ComplexityGUI(ctk.CTk):
         self.upper_left_frame = ctk.CTkFrame(self.left_frame, width=300, height=100, corner_radius=10)
         self.upper_left_frame.grid(row=1, column=0, pady=10, padx=10, sticky='w')
 
+        # Selectors for which MST engine the analysis runs, on which graph family and weight distribution
+        self.workload_frame = ctk.CTkFrame(self.left_frame, fg_color=FRAME_FG_COLOR)
+        self.workload_frame.grid(row=2, column=0, pady=(0, 10), padx=10, sticky='w')
+
+        self.engine_var = StringVar(self)
+        self.engine_var.set(DEFAULT_ENGINE)  # Default value
+        self.engine_menu = ctk.CTkOptionMenu(self.workload_frame, variable=self.engine_var, values=engine_names(), width=200, dynamic_resizing=False, fg_color=BUTTON_FG_COLOR)
+        self.engine_menu.grid(row=0, column=0, columnspan=2, pady=(0, 5), sticky='w')
+
+        self.family_var = StringVar(self)
+        self.family_var.set("Complete")  # Default value
+        self.family_menu = ctk.CTkOptionMenu(self.workload_frame, variable=self.family_var, values=list(GRAPH_FAMILIES), width=170, dynamic_resizing=False, fg_color=BUTTON_FG_COLOR)
+        self.family_menu.grid(row=1, column=0, padx=(0, 10), sticky='w')
+
+        self.weights_var = StringVar(self)
+        self.weights_var.set("Unit")  # Default value
+        self.weights_menu = ctk.CTkOptionMenu(self.workload_frame, variable=self.weights_var, values=list(WEIGHT_DISTRIBUTIONS), width=120, dynamic_resizing=False, fg_color=BUTTON_FG_COLOR)
+        self.weights_menu.grid(row=1, column=1, sticky='w')
+
+        # Progress of the running sweep, with a Cancel button that stops it between points
+        self.sweep_frame = ctk.CTkFrame(self.left_frame, fg_color=FRAME_FG_COLOR)
+        self.sweep_frame.grid(row=3, column=0, pady=(0, 5), padx=10, sticky='ew')
+
+        self.sweep_progress = ctk.CTkProgressBar(self.sweep_frame, width=200, progress_color=BUTTON_FG_COLOR)
+        self.sweep_progress.set(0)
+        self.sweep_progress.grid(row=0, column=0, padx=(0, 10), sticky='w')
+
+        self.sweep_cancel_button = ctk.CTkButton(self.sweep_frame, text="Cancel", command=self.cancel_analysis, text_color=TITLE_COLOUR, fg_color="red", font=COMPLEXITY_SUBTITLE_FONT, width=80, state='disabled')
+        self.sweep_cancel_button.grid(row=0, column=1, sticky='e')
+
+        self.sweep_status_label = ctk.CTkLabel(self.sweep_frame, text="No analysis running", font=COMPLEXITY_SUBTITLE_FONT, text_color=COMPLEXITY_PLACEHOLDER_COLOUR, anchor='w')
+        self.sweep_status_label.grid(row=1, column=0, columnspan=2, sticky='w')
+
+        # Spreads the sweep points over a pool of worker processes instead of measuring them one after another
+        self.parallel_var = tk.BooleanVar(self, value=False)
+        self.parallel_switch = ctk.CTkSwitch(self.sweep_frame, text="Parallel sweep (process pool)", variable=self.parallel_var, font=COMPLEXITY_SUBTITLE_FONT, progress_color=BUTTON_FG_COLOR)
+        self.parallel_switch.grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky='w')
+
+        # Previously measured points are reused from the sweep cache, this forgets them so every point is measured again
+        self.clear_cache_button = ctk.CTkButton(self.sweep_frame, text="Clear cache", command=self.clear_sweep_cache, text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, font=COMPLEXITY_SUBTITLE_FONT, width=80)
+        self.clear_cache_button.grid(row=2, column=1, pady=(5, 0), sticky='e')
+
         self.lower_left_frame_title = ctk.CTkLabel(self.left_frame, text="View complexity metrics", font=TITLE_FONT, text_color=TITLE_COLOUR)
         self.lower_left_frame_title.grid(row=4, column=0, pady=(15, 5), padx=10, sticky='w')
 
@@ -58,6 +102,7 @@ class ComplexityGUI(ctk.CTk):
 
         self.comp_tab = self.parameter_tabview.add("No. of Comparisons")
         self.exec_tab = self.parameter_tabview.add("Execution Time")
+        self.mem_tab = self.parameter_tabview.add("Memory")
 
         # Node selector for the number of nodes in comparisons tab
         self.comp_tab_node_title = ctk.CTkLabel(self.comp_tab, text="Use the slider to specify max nodes:", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
@@ -80,7 +125,7 @@ class ComplexityGUI(ctk.CTk):
         self.comp_steps_slider_label.pack(padx=(10))
 
         # Button to start the analysis in comparisons tab
-        self.comp_tab_analyse_button = ctk.CTkButton(self.comp_tab, text="Analyse", command=lambda: self.analyse("comparisons"), text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, bg_color=ANALYSER_FRAME_COLOR, font=COMPLEXITY_SUBTITLE_FONT)
+        self.comp_tab_analyse_button = ctk.CTkButton(self.comp_tab, text="Analyse", command=lambda: self.start_analysis("comparisons"), text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, bg_color=ANALYSER_FRAME_COLOR, font=COMPLEXITY_SUBTITLE_FONT)
         self.comp_tab_analyse_button.pack(padx=(30), pady = (30,10))
 
 
@@ -99,9 +144,37 @@ class ComplexityGUI(ctk.CTk):
         self.exec_steps_slider_label = ctk.CTkLabel(self.exec_tab, text="50", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
         self.exec_steps_slider_label.pack(padx=(10))
 
-        self.exec_tab_analyse_button = ctk.CTkButton(self.exec_tab, text="Analyse", command=lambda: self.analyse("execution_time"), text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, bg_color=ANALYSER_FRAME_COLOR, font=COMPLEXITY_SUBTITLE_FONT)
+        # Timed repetitions per point, each point is summarised by the median of these
+        self.exec_tab_repetitions_title = ctk.CTkLabel(self.exec_tab, text="Timed repetitions per point:", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
+        self.exec_tab_repetitions_title.pack(padx=(20))
+        self.repetitions_var = StringVar(self)
+        self.repetitions_var.set(BENCHMARK_DEFAULT_REPETITIONS)  # Default value
+        self.repetitions_menu = ctk.CTkOptionMenu(self.exec_tab, variable=self.repetitions_var, values=BENCHMARK_REPETITION_OPTIONS, width=80, fg_color=BUTTON_FG_COLOR)
+        self.repetitions_menu.pack(padx=(10))
+
+        self.exec_tab_analyse_button = ctk.CTkButton(self.exec_tab, text="Analyse", command=lambda: self.start_analysis("execution_time"), text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, bg_color=ANALYSER_FRAME_COLOR, font=COMPLEXITY_SUBTITLE_FONT)
         self.exec_tab_analyse_button.pack(padx=(30), pady = (30,10))
 
+
+        # Memory tab, a lower node limit than the other tabs since the representation comparison builds every representation of the max node graph
+        self.mem_tab_node_title = ctk.CTkLabel(self.mem_tab, text="Use the slider to specify max nodes:", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
+        self.mem_tab_node_title.pack(padx=(20))
+        self.mem_slider = ctk.CTkSlider(self.mem_tab, from_=100, to=1000, number_of_steps=9, command=lambda value: self.update_slider_label(self.mem_slider_label, value), button_color=BUTTON_FG_COLOR)
+        self.mem_slider.pack(padx=(10))
+        self.mem_slider_label = ctk.CTkLabel(self.mem_tab, text="550", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
+        self.mem_slider_label.pack(padx=(10))
+        self.mem_slider.bind("<ButtonRelease-1>", lambda event, arg="mem": self.on_node_slider_change(arg, event))
+
+        self.mem_tab_steps_title = ctk.CTkLabel(self.mem_tab, text="Specify the size of the step interval for the x axis:", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
+        self.mem_tab_steps_title.pack(padx=(20))
+        self.mem_steps_slider = ctk.CTkSlider(self.mem_tab, from_=10, to=100,number_of_steps=10, command=lambda value: self.update_slider_label(self.mem_steps_slider_label, value), button_color=BUTTON_FG_COLOR)
+        self.mem_steps_slider.pack(padx=(10))
+        self.mem_steps_slider_label = ctk.CTkLabel(self.mem_tab, text="55", font=COMPLEXITY_SUBTITLE_FONT, text_color=TITLE_COLOUR)
+        self.mem_steps_slider_label.pack(padx=(10))
+
+        self.mem_tab_analyse_button = ctk.CTkButton(self.mem_tab, text="Analyse", command=lambda: self.start_analysis("memory"), text_color=TITLE_COLOUR, fg_color=BUTTON_FG_COLOR, bg_color=ANALYSER_FRAME_COLOR, font=COMPLEXITY_SUBTITLE_FONT)
+        self.mem_tab_analyse_button.pack(padx=(30), pady = (30,10))
+
         # Button to return to the main menu
         return_button = ctk.CTkButton(self.left_frame, text="Main Menu", command=self.return_to_main_menu, text_color=TITLE_COLOUR, fg_color="orange", bg_color=FRAME_FG_COLOR, font=COMPLEXITY_SUBTITLE_FONT, width=100)
         return_button.grid(row = 8, pady=20, padx=10, sticky='sw')
@@ -132,4 +205,14 @@ class ComplexityGUI(ctk.CTk):
             self.exec_steps_slider.configure(from_=min_steps, to=max_steps)
 
             self.exec_steps_slider.set(max_steps - (min_steps / 2))
-            self.update_slider_label(self.exec_steps_slider_label, max_steps - (min_steps / 2))
\ No newline at end of file
+            self.update_slider_label(self.exec_steps_slider_label, max_steps - (min_steps / 2))
+        elif identifier == "mem":
+            max_nodes = int(self.mem_slider.get()) 
+            max_steps = max_nodes / 10
+            min_steps = max_nodes / 20
+
+            # Adjust the step slider's range. Assuming `self.step_slider` is your Tkinter Scale for steps
+            self.mem_steps_slider.configure(from_=min_steps, to=max_steps)
+
+            self.mem_steps_slider.set(max_steps - (min_steps / 2))
+            self.update_slider_label(self.mem_steps_slider_label, max_steps - (min_steps / 2))
\ No newline at end of file
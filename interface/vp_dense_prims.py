@@ -0,0 +1,87 @@
+#####################################################################################
+# Implementation for Prim's algorithm MST based on PLK Chapter 8 - Graph Algorithms #
+# Dense variant for complete graphs, L and the weight matrix are NumPy arrays       #
+#####################################################################################
+
+from operator import itemgetter
+import numpy as np
+
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph
+
+
+# Builds the n x n weight matrix (inf where there is no edge) and a matrix marking the orientation each edge was given in E
+def dense_weight_matrix(graph):
+    if isinstance(graph, IndexedGraph):
+        identifiers, edges = graph.identifiers, graph.edges
+        starts = np.frombuffer(graph.edge_start, dtype=np.int64)
+        ends = np.frombuffer(graph.edge_end, dtype=np.int64)
+        weights = np.asarray(graph.edge_weights, dtype=np.float64)
+    else:
+        V, E, W = graph     # Mapped straight to index arrays, the CSR adjacency isn't needed for a dense matrix
+        identifiers, edges = list(V), list(E)
+        index = {identifier: i for i, identifier in enumerate(identifiers)}
+        starts = np.fromiter(map(index.__getitem__, map(itemgetter(0), edges)), dtype=np.int64, count=len(edges))
+        ends = np.fromiter(map(index.__getitem__, map(itemgetter(1), edges)), dtype=np.int64, count=len(edges))
+        weights = np.fromiter(map(W.__getitem__, edges), dtype=np.float64, count=len(edges))
+
+    n = len(identifiers)
+    matrix = np.full((n, n), np.inf)
+    np.minimum.at(matrix, (starts, ends), weights)  # Keeps the lightest edge if a pair appears more than once
+    np.minimum.at(matrix, (ends, starts), weights)
+
+    forward = np.zeros((n, n), dtype=bool)
+    forward[starts, ends] = True
+
+    return identifiers, matrix, forward
+
+
+# An ImplicitCompleteGraph supplies each row of weights on demand instead, so only O(V) memory is used
+def prim_minimum_spanning_tree_dense(graph):
+    if isinstance(graph, ImplicitCompleteGraph):
+        identifiers, weight_row, edge_between = graph.identifiers, graph.row, graph.edge
+    else:
+        identifiers, M, forward = dense_weight_matrix(graph)
+        weight_row = M.__getitem__
+        edge_between = lambda p, w: (identifiers[p], identifiers[w]) if forward[p, w] else (identifiers[w], identifiers[p])
+    n = len(identifiers)
+    Te = set()  # Set of edges in the minimum spanning tree
+    Tv = np.zeros(n, dtype=bool)  # Visited flag for each vertex index
+    unvisited = np.ones(n, dtype=bool)  # V - Tv as a mask, kept alongside Tv to avoid negating it every iteration
+    improved = np.empty(n, dtype=bool)  # Scratch mask for the L update
+    u = 0  # Starting vertex, choosing any vertex in V
+    num_comparisons = 0
+
+    Tv[u] = True           #Adding initial vertex to Tv
+    unvisited[u] = False
+
+    # Initialize L(v) from row u of the weight matrix, visited vertices are held at infinity so argmin skips them
+    L = weight_row(u).copy()
+    L[u] = np.inf
+    parent = np.full(n, u)  # Vertex whose edge set L(v)
+    remaining = n - 1  # |V - Tv|
+
+    while remaining:
+        # Find w: L(w) = min{L(v) | v ∈ (V − Tv)}
+        w = int(np.argmin(L))
+        if Tv[w]:
+            w = int(np.flatnonzero(unvisited)[0])  # Every remaining L is infinite, the graph is disconnected
+
+        # Add the edge e from parent(w) to TE, oriented as it was given in E
+        if L[w] != np.inf:
+            Te.add(edge_between(int(parent[w]), w))
+
+        # Update TV
+        Tv[w] = True
+        unvisited[w] = False
+        L[w] = np.inf
+        remaining -= 1
+
+        # Update L(v) for v ∈ (V − Tv) with one vectorised comparison of row w against L
+        row = weight_row(w)
+        np.less(row, L, out=improved)
+        improved &= unvisited
+        L[improved] = row[improved]
+        parent[improved] = w
+        num_comparisons += int(np.count_nonzero(np.isfinite(row)))  # Counting one comparison per neighbour of w, as the array engine does
+
+    return Te, num_comparisons
@@ -0,0 +1,178 @@
+#####################################################################################
+# Minimum spanning forest and connected components kept up to date as edges and #
+# vertices are added/removed                                                        #
+#####################################################################################
+
+from collections import deque
+
+
+# Keeps a minimum spanning forest of an editable graph without recomputing it from scratch, along with a
+# component label per vertex so "is the graph connected?" and "how many components?" are O(1) queries.
+# Vertices and edge keys can be any hashable objects, the visualiser uses its Node and Edge objects
+class DynamicMST:
+    def __init__(self):
+        self.edges = {}  # Edge key -> (u, v, weight) for every edge in the graph
+        self.incident = {}  # Vertex -> set of keys of all edges touching it
+        self.tree = {}  # Vertex -> {neighbour: edge key} for tree edges only
+        self.tree_edges = set()  # Keys of the edges in the minimum spanning forest
+        self.total_weight = 0
+        self.component = {}  # Vertex -> label of its connected component
+        self.members = {}  # Component label -> set of vertices in that component
+        self.next_label = 0
+
+
+    def add_vertex(self, v):
+        if v in self.component:
+            return
+        self.incident[v] = set()
+        self.tree[v] = {}
+        self._new_component({v})
+
+
+    @property
+    def num_components(self):
+        return len(self.members)
+
+
+    def is_connected(self):
+        return len(self.members) == 1
+
+
+    # Removes v and all of its edges, tree edges are replaced across each cut they leave behind
+    def remove_vertex(self, v):
+        for key in list(self.incident.get(v, ())):
+            self.remove_edge(key)
+        if v in self.component:
+            del self.members[self.component.pop(v)]    # v is isolated once its edges are gone
+        self.incident.pop(v, None)
+        self.tree.pop(v, None)
+
+
+    # Inserting (u, v) closes at most one cycle, if it is lighter than the heaviest tree edge on that cycle it replaces it
+    def add_edge(self, key, u, v, weight):
+        self.add_vertex(u)
+        self.add_vertex(v)
+        self.edges[key] = (u, v, weight)
+        self.incident[u].add(key)
+        self.incident[v].add(key)
+
+        if self.component[u] != self.component[v]:
+            self._link(key)     # u and v were in different trees, the new edge joins them
+            self._merge_components(u, v)
+            return True
+
+        path = self.tree_path(u, v)
+        if not path:
+            return False    # Self-loop, can never be a tree edge
+
+        heaviest = max(path, key=lambda path_key: self.edges[path_key][2])
+        if weight < self.edges[heaviest][2]:
+            self._cut(heaviest)
+            self._link(key)
+            return True
+        return False
+
+
+    # Removing a tree edge splits its tree in two, the lightest edge across that cut reconnects them if one exists
+    def remove_edge(self, key):
+        if key not in self.edges:
+            return
+        u, v, _ = self.edges[key]
+        was_tree_edge = key in self.tree_edges
+        if was_tree_edge:
+            self._cut(key)
+
+        del self.edges[key]
+        self.incident[u].discard(key)
+        self.incident[v].discard(key)
+
+        if was_tree_edge:
+            side, replacement = self._lightest_crossing_edge(u, v)
+            if replacement is not None:
+                self._link(replacement)
+            else:
+                self._split_component(side)    # Nothing crosses the cut, the smaller side becomes its own component
+
+
+    # Returns the keys of the tree edges on the path from u to v, or None if they are in different trees
+    def tree_path(self, u, v):
+        previous = {u: None}  # Vertex -> (vertex it was reached from, tree edge key)
+        queue = deque([u])
+        while queue:
+            x = queue.popleft()
+            if x == v:
+                path = []
+                while previous[x] is not None:
+                    x, key = previous[x]
+                    path.append(key)
+                return path
+            for y, key in self.tree[x].items():
+                if y not in previous:
+                    previous[y] = (x, key)
+                    queue.append(y)
+        return None
+
+
+    def _link(self, key):
+        u, v, weight = self.edges[key]
+        self.tree[u][v] = key
+        self.tree[v][u] = key
+        self.tree_edges.add(key)
+        self.total_weight += weight
+
+
+    def _cut(self, key):
+        u, v, weight = self.edges[key]
+        self.tree[u].pop(v, None)
+        self.tree[v].pop(u, None)
+        self.tree_edges.discard(key)
+        self.total_weight -= weight
+
+
+    # Explores both halves of the cut one vertex at a time and scans the edges of whichever half finishes first
+    def _lightest_crossing_edge(self, u, v):
+        sides = ({u}, {v})
+        queues = (deque([u]), deque([v]))
+        side = None
+        while side is None:
+            for i in (0, 1):
+                if not queues[i]:
+                    side = sides[i]
+                    break
+                x = queues[i].popleft()
+                for y in self.tree[x]:
+                    if y not in sides[i]:
+                        sides[i].add(y)
+                        queues[i].append(y)
+
+        lightest = None
+        for x in side:
+            for key in self.incident[x]:
+                a, b, weight = self.edges[key]
+                if (a in side) != (b in side) and (lightest is None or weight < self.edges[lightest][2]):
+                    lightest = key
+        return side, lightest
+
+
+    def _new_component(self, vertices):
+        label = self.next_label
+        self.next_label += 1
+        self.members[label] = vertices
+        for x in vertices:
+            self.component[x] = label
+
+
+    # Union by size, the vertices of the smaller component are relabelled so each vertex moves O(log V) times overall
+    def _merge_components(self, u, v):
+        keep, absorb = self.component[u], self.component[v]
+        if len(self.members[keep]) < len(self.members[absorb]):
+            keep, absorb = absorb, keep
+        for x in self.members[absorb]:
+            self.component[x] = keep
+        self.members[keep] |= self.members.pop(absorb)
+
+
+    def _split_component(self, side):
+        label = self.component[next(iter(side))]
+        self.members[label] -= side
+        self._new_component(set(side))
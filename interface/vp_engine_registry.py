@@ -0,0 +1,119 @@
+#####################################################################################
+# Registry of MST engines, looked up by name and run through a common result        #
+#####################################################################################
+
+import inspect
+import time
+
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph, as_indexed_graph
+from interface.vp_prims_algorithm import prim_minimum_spanning_tree
+from interface.vp_priority_q_prims import prim_minimum_spanning_tree_with_priority_queue
+from interface.vp_dense_prims import prim_minimum_spanning_tree_dense
+from interface.vp_kruskal import kruskal_minimum_spanning_tree
+from interface.vp_boruvka import boruvka_minimum_spanning_tree
+from interface.vp_integer_weight_mst import prim_minimum_spanning_tree_bucket_queue, kruskal_minimum_spanning_tree_counting_sort
+
+MST_ENGINES = {}  # Engine name -> function taking a graph and returning (Te, num_comparisons), in registration order
+TRIPLE_INPUT_ENGINES = set()  # Engines that work straight from a (V, E, W) triple, so the indexed graph isn't built for them
+IMPLICIT_GRAPH_ENGINES = set()  # Engines that run on an ImplicitCompleteGraph without materialising its edges
+
+
+# What every engine run returns regardless of the engine's own return shape
+class MSTResult:
+    def __init__(self, engine, tree_edges, total_weight, counters, timings, num_edges=None):
+        self.engine = engine  # Name the engine was registered under
+        self.num_edges = num_edges  # Edges in the graph the engine ran on
+        self.tree_edges = tree_edges  # Set of (start, end) identifier pairs in the minimum spanning tree/forest
+        self.total_weight = total_weight
+        self.counters = counters  # Operation counts, always has "comparisons", engines taking stats add their own
+        self.timings = timings  # Seconds spent in each phase, "build", "mst" and "total", plus any *_times lists from stats
+        self.timing_summary = None  # TimingSummary when the run was benchmarked with repetitions, see vp_benchmark
+        self.memory_profile = None  # MemoryProfile when the run was memory profiled, see vp_memory_profile
+
+    @property
+    def num_comparisons(self):
+        return self.counters["comparisons"]
+
+
+# New engines only need registering here to appear in the analyser and batch tools
+def register_engine(name, engine, indexed=True, implicit=False):
+    if name in MST_ENGINES:
+        raise ValueError(f"An MST engine named {name!r} is already registered.")
+    MST_ENGINES[name] = engine
+    if not indexed:
+        TRIPLE_INPUT_ENGINES.add(name)
+    if implicit:
+        IMPLICIT_GRAPH_ENGINES.add(name)
+
+
+def supports_implicit_graph(name):
+    return name in IMPLICIT_GRAPH_ENGINES
+
+
+def engine_names():
+    return list(MST_ENGINES)
+
+
+def get_engine(name):
+    if name not in MST_ENGINES:
+        raise ValueError(f"Unknown MST engine {name!r}. Choose one of: {', '.join(MST_ENGINES)}")
+    return MST_ENGINES[name]
+
+
+# Runs the named engine on a (V, E, W) triple or IndexedGraph, timing the graph build and the MST separately
+def run_engine(name, graph):
+    engine = get_engine(name)
+    counters = {}
+    kwargs = {"stats": counters} if "stats" in inspect.signature(engine).parameters else {}
+
+    start_time = time.perf_counter()
+    graph = prepare_graph(name, graph)
+    build_time = time.perf_counter()
+    Te, num_comparisons = engine(graph, **kwargs)
+    end_time = time.perf_counter()
+
+    tree_edges = {edge for edge in Te if edge is not None}     # Array Prim's records None for a vertex it couldn't reach
+    counters["comparisons"] = num_comparisons
+    timings = {"build": build_time - start_time, "mst": end_time - build_time, "total": end_time - start_time}
+    for key in [key for key in counters if key.endswith("_times")]:
+        timings[key] = counters.pop(key)   # Per-round timings reported through stats, eg. Borůvka's round_times
+    num_edges = len(graph[1]) if isinstance(graph, tuple) else getattr(graph, "num_edges", None)
+    return MSTResult(name, tree_edges, tree_weight(graph, tree_edges), counters, timings, num_edges)
+
+
+# Converts a (V, E, W) triple to the indexed graph unless the engine reads triples directly, and materialises an
+# implicit graph for engines that can't run on one. Anything else is passed through
+def prepare_graph(name, graph):
+    if isinstance(graph, tuple) and name not in TRIPLE_INPUT_ENGINES:
+        return as_indexed_graph(graph)
+    if isinstance(graph, ImplicitCompleteGraph) and name not in IMPLICIT_GRAPH_ENGINES:
+        return graph.to_indexed()
+    return graph
+
+
+# Engines report tree edges as (start, end) pairs, so where a pair is joined by several edges the lightest one is the one in the tree
+def tree_weight(graph, tree_edges):
+    if not tree_edges:
+        return 0
+    if isinstance(graph, ImplicitCompleteGraph):
+        return sum(graph.edge_weight(start, end) for start, end in tree_edges)
+    if isinstance(graph, IndexedGraph):
+        weights = {}
+        for (start, end), weight in zip(graph.edges, graph.edge_weights):
+            for pair in ((start, end), (end, start)):
+                if weight < weights.get(pair, float("inf")):
+                    weights[pair] = weight
+    else:
+        weights = graph[2]
+    return sum(weights[edge] for edge in tree_edges)
+
+
+register_engine("Prim's (array)", prim_minimum_spanning_tree, implicit=True)
+register_engine("Prim's (binary heap)", prim_minimum_spanning_tree_with_priority_queue)
+register_engine("Prim's (dense NumPy)", prim_minimum_spanning_tree_dense, indexed=False, implicit=True)
+register_engine("Kruskal's (union-find)", kruskal_minimum_spanning_tree)
+register_engine("Borůvka's (NumPy)", boruvka_minimum_spanning_tree)
+register_engine("Prim's (bucket queue)", prim_minimum_spanning_tree_bucket_queue)
+register_engine("Kruskal's (counting sort)", kruskal_minimum_spanning_tree_counting_sort)
+
+DEFAULT_ENGINE = "Prim's (array)"
@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox, simpledialog, filedialog
 import random
 import time
 
@@ -7,6 +7,9 @@ from interface.node import Node
 from interface.edge import Edge
 from interface.vp_graph_gui import GraphVisualiserGUI
 from interface.utils import *
+from interface.vp_graph_core import as_indexed_graph
+from interface.vp_dynamic_mst import DynamicMST
+from interface.vp_spatial_index import SpatialGrid, point_in_circle, segment_distance
 from interface.config import *
 from PIL import ImageGrab
 import sys
@@ -19,7 +22,16 @@ class GraphVisualiser(GraphVisualiserGUI):
         self.edges = []  # List to store edges
         self.selected_node = None   # For storing the node that is currently selected for drag_handler
         self.drag_start_pos = None  # For storing the starting position of the drag for left_click_handler
+        self.drag_job = None  # after() job that applies the latest pointer position to the selected node, None when no move is waiting
+        self.pending_drag_pos = None  # (x, y) from the latest motion event not yet applied
         self.node_counter = 0  # Counter to keep track of the number of nodes
+        self.live_mst = DynamicMST()  # Minimum spanning forest kept up to date as the graph is edited
+        self.node_index = SpatialGrid(SPATIAL_INDEX_CELL_SIZE)  # Node circles by grid cell, for find_node
+        self.edge_index = SpatialGrid(SPATIAL_INDEX_CELL_SIZE)  # Edge lines by grid cell, for find_edge
+        self.incident_edges = {}  # Node -> {edge: None} for the edges touching it, an insertion ordered set so moves only touch those edges
+
+        self.resize_job = None  # after() job that applies the latest canvas size, None when no resize is waiting
+        self.pending_canvas_size = None  # (width, height) from the latest Configure event not yet applied
 
         # Bind the Configure event to handle canvas resizes
         self.canvas.bind("<Configure>", self.on_canvas_resize)
@@ -27,6 +39,7 @@ class GraphVisualiser(GraphVisualiserGUI):
         # Bind mouse events
         self.canvas.bind("<Button-1>", self.left_click_handler)
         self.canvas.bind("<B1-Motion>", self.drag_handler)
+        self.canvas.bind("<ButtonRelease-1>", self.release_handler)
 
         self.canvas_old_width = self.canvas.winfo_reqwidth()
         self.canvas_old_height = self.canvas.winfo_reqheight()
@@ -35,11 +48,15 @@ class GraphVisualiser(GraphVisualiserGUI):
     # For creating a new node
     def create_node(self, x, y, identifier):
         new_node = Node(x, y, identifier)
-        new_node.id = self.canvas.create_oval(x - 18, y - 18, x + 18, y + 18, fill="blue", outline = "black", width = 3)
-        new_node.text_id = self.canvas.create_text(x, y, text=identifier, font=("Arial", 14))
+        new_node.id = self.canvas.create_oval(x - NODE_RADIUS, y - NODE_RADIUS, x + NODE_RADIUS, y + NODE_RADIUS, fill="blue", outline = "black", width = 3, tags=(NODE_LAYER,))
+        new_node.text_id = self.canvas.create_text(x, y, text=identifier, font=("Arial", 14), tags=(NODE_LABEL_LAYER,))
         self.nodes.append(new_node)
         self.node_counter += 1
+        self.live_mst.add_vertex(new_node)
+        self.incident_edges[new_node] = {}
+        self.index_node(new_node)
         self.update_node_options()  # Update dropdown menus when a new node is added
+        self.update_live_mst_label()
     
 
     # Deletes a node and its edges
@@ -57,16 +74,23 @@ class GraphVisualiser(GraphVisualiserGUI):
         
             # Remove the node from internal list
             self.nodes.remove(node_to_delete)
+            if self.selected_node is node_to_delete:
+                self.cancel_drag()    # A move still waiting for the next frame is dropped with the node
+            self.live_mst.remove_vertex(node_to_delete)  # Also drops its edges, replacing any that were in the live MST
+            self.node_index.remove(node_to_delete)
 
-            # Remove edges connected to the node
-            edges_to_remove = [edge for edge in self.edges if edge.start_node == node_to_delete or edge.end_node == node_to_delete]
+            # Remove edges connected to the node, the edge list is filtered once rather than searched per edge
+            edges_to_remove = self.incident_edges.pop(node_to_delete, {})
             for edge in edges_to_remove:
                 self.canvas.delete(edge.line_id)
                 self.canvas.delete(edge.text_id)
                 self.canvas.delete(edge.midpoint_id)
-                self.edges.remove(edge)
+                self.incident_edges.get(edge.end_node if edge.start_node == node_to_delete else edge.start_node, {}).pop(edge, None)  # A self-loop's other end is the node already popped
+                self.edge_index.remove(edge)
+            self.edges[:] = [edge for edge in self.edges if edge not in edges_to_remove]
 
             self.update_node_options()
+            self.update_live_mst_label()
             self.clear_info_text()
             self.next_step_button.configure(state='disabled')  # Disabled if canvas is clicked during Prim's
             self.toggle_mst_button.configure(state='disabled', text='Show MST only')  # Disabled if canvas is clicked during Prim's
@@ -91,29 +115,36 @@ class GraphVisualiser(GraphVisualiserGUI):
         # Create the edge and add it to the list
         edge.line_id = self.canvas.create_line(
             edge.start_node.x, edge.start_node.y,
-            edge.end_node.x, edge.end_node.y, width=2, fill="black"
+            edge.end_node.x, edge.end_node.y, width=2, fill="black", tags=(EDGE_LAYER, NON_MST_TAG)
         )
 
         # Create an oval at the midpoint to serve as midpoint marker
         edge.midpoint_id = self.canvas.create_oval(
-            mid_x - 8, mid_y - 8, mid_x + 8, mid_y + 8, fill="white", outline="black"
+            mid_x - 8, mid_y - 8, mid_x + 8, mid_y + 8, fill="white", outline="black", tags=(MARKER_LAYER, NON_MST_TAG)
         )
 
         # Create the text for the weight
-        edge.text_id = self.canvas.create_text(mid_x, mid_y, text=str(edge.weight), font=("Arial", 12), fill="black")
+        edge.text_id = self.canvas.create_text(mid_x, mid_y, text=str(edge.weight), font=("Arial", 12), fill="black", tags=(LABEL_LAYER, NON_MST_TAG))
 
         self.edges.append(edge)
+        self.live_mst.add_edge(edge, edge.start_node, edge.end_node, edge.weight)
+        self.incident_edges.setdefault(edge.start_node, {})[edge] = None
+        self.incident_edges.setdefault(edge.end_node, {})[edge] = None
+        self.index_edge(edge)
 
         print(f"Edge created in canvas: {edge.start_node.identifier} -> {edge.end_node.identifier}, Weight: {edge.weight}")
 
-        # Ensure the text is above the oval
-        self.canvas.tag_raise(edge.text_id)
-
-        for node in self.nodes:
-            self.canvas.tag_raise(node.id)
-            self.canvas.tag_raise(node.text_id)
+        # The new items were drawn on top, put the edge back under the markers, labels and nodes
+        self.restack_layers()
 
         self.update_edge_options()  # Update dropdown menu when a new edge is added
+        self.update_live_mst_label()
+
+
+    # Restores the z-order of the canvas layers bottom to top, one raise per layer however many items it holds
+    def restack_layers(self):
+        for layer in CANVAS_LAYERS:
+            self.canvas.tag_raise(layer)
 
 
     # For manual edge creation using drop down menus, weight field and "Create Edge" button
@@ -176,9 +207,14 @@ class GraphVisualiser(GraphVisualiserGUI):
             self.canvas.delete(edge_to_delete.text_id)
             self.canvas.delete(edge_to_delete.midpoint_id)
             self.edges.remove(edge_to_delete)
+            self.live_mst.remove_edge(edge_to_delete)
+            self.incident_edges.get(edge_to_delete.start_node, {}).pop(edge_to_delete, None)
+            self.incident_edges.get(edge_to_delete.end_node, {}).pop(edge_to_delete, None)
+            self.edge_index.remove(edge_to_delete)
 
             self.status_label.configure(text=f"Edge {edge_identifier} has been deleted")
             self.update_edge_options()  # Update dropdown menu when an edge is deleted
+            self.update_live_mst_label()
         
         self.delete_edge_var.set("   ")
         self.reset_node_and_edge_colors()  
@@ -189,12 +225,42 @@ class GraphVisualiser(GraphVisualiserGUI):
         self.unhide_edges()
 
 
-    # Handles scenarios where user drags nodes around
+    # Handles scenarios where user drags nodes around. Motion events can arrive far faster than the canvas can redraw, so each one
+    # only records the pointer and the node is moved to the latest position at most once per frame
     def drag_handler(self, event):
         if self.selected_node:
+            self.pending_drag_pos = (event.x, event.y)
+            if self.drag_job is None:
+                self.drag_job = self.after(CANVAS_FRAME_INTERVAL, self.apply_drag)
+
+
+    # Ends a drag, the last recorded position is applied straight away so the node ends up under the pointer
+    def release_handler(self, event):
+        self.apply_drag()
+        self.selected_node = None
+
+
+    # Drops the selected node and any move still waiting for the next frame without applying it
+    def cancel_drag(self):
+        if self.drag_job is not None:
+            self.after_cancel(self.drag_job)
+            self.drag_job = None
+        self.pending_drag_pos = None
+        self.selected_node = None
+
+
+    # Moves the selected node and its edges to the latest recorded pointer position, can also be called directly to flush a pending move
+    def apply_drag(self):
+        if self.drag_job is not None:
+            self.after_cancel(self.drag_job)
+            self.drag_job = None
+        if self.selected_node and self.pending_drag_pos is not None:
+            x, y = self.pending_drag_pos
+            self.pending_drag_pos = None
+
             # New x, y coordinates after the drag
-            new_x = min(max(event.x, 15), self.canvas.winfo_width() - 15)
-            new_y = min(max(event.y, self.top_margin), self.canvas.winfo_height() - 15)
+            new_x = min(max(x, 15), self.canvas.winfo_width() - 15)
+            new_y = min(max(y, self.top_margin), self.canvas.winfo_height() - 15)
         
             # Calculate the deltas
             dx = new_x - self.selected_node.x
@@ -207,40 +273,58 @@ class GraphVisualiser(GraphVisualiserGUI):
             # Move the node and its text identifier
             self.canvas.move(self.selected_node.id, dx, dy)
             self.canvas.move(self.selected_node.text_id, dx, dy)
+            self.index_node(self.selected_node)
         
             # Update connected edges
-            for edge in self.edges:
-                if edge.start_node == self.selected_node or edge.end_node == self.selected_node:
-                    # Move edge
-                    self.canvas.coords(edge.line_id, 
-                                   edge.start_node.x, edge.start_node.y, 
-                                   edge.end_node.x, edge.end_node.y)
-                
-                    # Calculate new midpoint position
-                    mid_x = (edge.start_node.x + edge.end_node.x) / 2
-                    mid_y = (edge.start_node.y + edge.end_node.y) / 2
-                
-                    # Move midpoint oval
-                    if edge.midpoint_id is not None:
-                        self.canvas.coords(edge.midpoint_id,
-                                       mid_x - 8, mid_y - 8, 
-                                       mid_x + 8, mid_y + 8)
-                
-                    # Move weight label
-                    if edge.text_id is not None:
-                        self.canvas.coords(edge.text_id, mid_x, mid_y)
-                
-                    # Bring edge, midpoint, and label to top
-                    self.canvas.tag_raise(edge.midpoint_id)
-                    self.canvas.tag_raise(edge.text_id)
+            for edge in self.edges_of(self.selected_node):
+                # Move edge
+                self.canvas.coords(edge.line_id, 
+                               edge.start_node.x, edge.start_node.y, 
+                               edge.end_node.x, edge.end_node.y)
+                self.index_edge(edge)
+            
+                # Calculate new midpoint position
+                mid_x = (edge.start_node.x + edge.end_node.x) / 2
+                mid_y = (edge.start_node.y + edge.end_node.y) / 2
+            
+                # Move midpoint oval
+                if edge.midpoint_id is not None:
+                    self.canvas.coords(edge.midpoint_id,
+                                   mid_x - 8, mid_y - 8, 
+                                   mid_x + 8, mid_y + 8)
+            
+                # Move weight label, the layers already keep it and the midpoint above every edge line
+                if edge.text_id is not None:
+                    self.canvas.coords(edge.text_id, mid_x, mid_y)
+
+
+    # For registering a node's circle in the spatial index, again whenever it moves
+    def index_node(self, node):
+        self.node_index.insert_circle(node, node.x, node.y, NODE_RADIUS)
 
 
-    # Finds the node that was clicked on for left_click_handler
+    # For registering an edge's line in the spatial index, again whenever either end moves
+    def index_edge(self, edge):
+        self.edge_index.insert_segment(edge, edge.start_node.x, edge.start_node.y, edge.end_node.x, edge.end_node.y, EDGE_PICK_TOLERANCE)
+
+
+    # The edges touching node, looked up in the incident edge map rather than by scanning every edge
+    def edges_of(self, node):
+        return list(self.incident_edges.get(node, ()))
+
+
+    # Finds the node that was clicked on for left_click_handler, the one whose centre is closest if drawn circles overlap
     def find_node(self, x, y):
-        for node in self.nodes:
-            if (node.x - 10) <= x <= (node.x + 10) and (node.y - 10) <= y <= (node.y + 10):
-                return node
-        return None
+        hits = [node for node in self.node_index.query(x, y) if point_in_circle(x, y, node.x, node.y, NODE_RADIUS)]
+        return min(hits, key=lambda node: (node.x - x) ** 2 + (node.y - y) ** 2, default=None)
+
+
+    # Finds the edge whose line passes closest to (x, y), within EDGE_PICK_TOLERANCE
+    def find_edge(self, x, y):
+        distances = {edge: segment_distance(x, y, edge.start_node.x, edge.start_node.y, edge.end_node.x, edge.end_node.y)
+                     for edge in self.edge_index.query(x, y)}
+        hits = [edge for edge, distance in distances.items() if distance <= EDGE_PICK_TOLERANCE]
+        return min(hits, key=distances.get, default=None)
     
 
     # Handles all cases where user left clicks on the canvas
@@ -253,10 +337,17 @@ class GraphVisualiser(GraphVisualiserGUI):
 
         self.status_label.configure(text="Editing graph...")
 
+        clicked_edge = None if clicked_node else self.find_edge(x, y)
+
         if clicked_node:
             # If a node is clicked, initiate the drag process
             self.selected_node = clicked_node
             self.drag_start_pos = (x, y)
+        elif clicked_edge:
+            # If an edge is clicked, select it in the edge deletion menu instead of creating a node on top of it
+            edge_identifier = f"{clicked_edge.start_node.identifier} - {clicked_edge.end_node.identifier}"
+            self.delete_edge_var.set(edge_identifier)
+            self.status_label.configure(text=f"Edge {edge_identifier} selected, click Delete Edge to remove it")
         else:
             self.reset_node_and_edge_colors()  # Reset colors of nodes and edges
             self.clear_info_text()  # Clear the info text widget    
@@ -300,10 +391,13 @@ class GraphVisualiser(GraphVisualiserGUI):
             y = random.randint(self.top_margin, canvas_height - 15)
             node_identifier = generate_node_identifier(self.node_counter)
             new_node = Node(x, y, node_identifier)
-            new_node.id = self.canvas.create_oval(x - 18, y - 18, x + 18, y + 18, fill="blue", outline = "black", width = 3)
-            new_node.text_id = self.canvas.create_text(x, y, text=node_identifier, font=("Arial", 14))
+            new_node.id = self.canvas.create_oval(x - NODE_RADIUS, y - NODE_RADIUS, x + NODE_RADIUS, y + NODE_RADIUS, fill="blue", outline = "black", width = 3, tags=(NODE_LAYER,))
+            new_node.text_id = self.canvas.create_text(x, y, text=node_identifier, font=("Arial", 14), tags=(NODE_LABEL_LAYER,))
             self.nodes.append(new_node)
             self.node_counter += 1
+            self.live_mst.add_vertex(new_node)
+            self.incident_edges[new_node] = {}
+            self.index_node(new_node)
 
         self.update_node_options()
 
@@ -341,7 +435,13 @@ class GraphVisualiser(GraphVisualiserGUI):
         self.nodes = []
         self.edges = []
         self.node_counter = 0
+        self.live_mst = DynamicMST()
+        self.node_index.clear()
+        self.edge_index.clear()
+        self.incident_edges = {}
+        self.cancel_drag()
         self.update_node_options()
+        self.update_live_mst_label()
         self.status_label.configure(text="Graph has been reset")
         self.clear_info_text()  # Clear the info text widget
         self.toggle_mst_button.configure(state='disabled', text='Show MST only')  
@@ -479,26 +579,31 @@ class GraphVisualiser(GraphVisualiserGUI):
     ##########################################
 
 
-    # prim_minimum_spanning_tree function from correctPrims.py
+    # prim_minimum_spanning_tree function from correctPrims.py, running on the indexed graph
     def prim_minimum_spanning_tree(self, graph):
-        V, E, W = graph
+        graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+        V = graph.identifiers
+        offsets, targets, weights, edge_ids = graph.offsets, graph.targets, graph.weights, graph.edge_ids
         Te = set()  # Set of edges in the minimum spanning tree
         Tv = set()  # Set of visited vertices
-        u = self.start_vertex_var.get() if self.start_vertex_var.get() in V else next(iter(V))  # Starting vertex
+        u = self.start_vertex_var.get() if self.start_vertex_var.get() in graph.index else V[0]  # Starting vertex
         L = {}      # Dictionary for L values of each edge
 
         Tv.add(u)           #Adding initial vertex to Tv
 
-        print(graph)
+        print(graph.edges)
         
         # Initialize L(v) for all vertices
-        for v in V - Tv:
-            if (u, v) in E:
-                L[v] = W[(u, v)]
-            elif (v, u) in E:
-                L[v] = W[(v, u)]
-            else:
+        for v in V:
+            if v != u:
                 L[v] = float("inf")
+        for k in range(offsets[graph.index[u]], offsets[graph.index[u] + 1]):
+            v = V[targets[k]]
+            if v != u and weights[k] < L[v]:
+                L[v] = weights[k]
+
+        # Canvas edges keyed by identifiers so MST edges can be marked without scanning self.edges
+        canvas_edges = {(edge.start_node.identifier, edge.end_node.identifier): edge for edge in self.edges}
 
 
         self.update_info_text(f"Starting with node {u}\n\n")
@@ -507,32 +612,28 @@ class GraphVisualiser(GraphVisualiserGUI):
 
         total_weight = 0
 
-        while Tv != V:
+        while len(Tv) != graph.num_vertices:
             # Find w: L(w) = min{L(v) | v ∈ (V − Tv)}
-            w = min((v for v in (V - Tv)), key=lambda v: L[v])                
+            w = min((v for v in L if v not in Tv), key=L.get)
             
             self.update_info_text(f"Choosing next node with smallest L value: {w}\n\n")
 
-            # Find the associated edge e from TV
+            # Find the associated edge e from TV, only the neighbours of w can share an edge with it
             e = None
             min_weight = float('inf')
-            for v in Tv:
-                if (v, w) in E and W[(v, w)] < min_weight:
-                    e = (v, w)
-                    min_weight = W[(v, w)]
-                elif (w, v) in E and W[(w, v)] < min_weight:
-                    e = (w, v)
-                    min_weight = W[(w, v)]
+            for k in range(offsets[graph.index[w]], offsets[graph.index[w] + 1]):
+                if V[targets[k]] in Tv and weights[k] < min_weight:
+                    e = graph.edges[edge_ids[k]]
+                    min_weight = weights[k]
 
             # Add the edge e to TE
             if e != None:
                 Te.add(e)
                 total_weight += min_weight   
                 # Marks edge as part of MST for toggling button
-                for edge in self.edges:
-                    if (edge.start_node.identifier, edge.end_node.identifier) == e or \
-                       (edge.end_node.identifier, edge.start_node.identifier) == e:
-                        edge.is_mst_edge = True
+                edge = canvas_edges.get(e) or canvas_edges.get((e[1], e[0]))
+                if edge:
+                    self.mark_mst_edge(edge)
                 
             Tv.add(w)
 
@@ -540,11 +641,10 @@ class GraphVisualiser(GraphVisualiserGUI):
             yield e, w  # Pause the algorithm and return the added edge
 
             # Update L(v) for v ∈ (V − Tv) if there is an edge (w, v) or (v, w) in E with weight less than L(v)
-            for v in (V - Tv):
-                if (w, v) in E and W[(w, v)] < L[v]:
-                    L[v] = W[(w, v)]
-                elif (v, w) in E and W[(v, w)] < L[v]:
-                    L[v] = W[(v, w)]
+            for k in range(offsets[graph.index[w]], offsets[graph.index[w] + 1]):
+                v = V[targets[k]]
+                if v not in Tv and weights[k] < L[v]:
+                    L[v] = weights[k]
             
             self.update_info_text(f"Updated L table:\n{L}\n\n")
             yield
@@ -573,16 +673,21 @@ class GraphVisualiser(GraphVisualiserGUI):
             self.unhide_edges()  # Unhide all edges if they were hidden from previous Prim's run
             self.toggle_mst_button.configure(state='disabled', text='Show MST only')  # Disabled if Run Prims is clicked 
 
-            V, E, W = extract_graph_data(self.nodes, self.edges)
+            graph = extract_indexed_graph(self.nodes, self.edges)  # Built once and shared by the checks and Prim's
 
-            if not is_graph_connected(V, E):   # Check if the graph is connected
-                raise ValueError("Graph is disconnected. Prim's algorithm requires a connected graph.")
+            # Check if the graph is connected, the live model answers in O(1) and the components are only worked out to report them
+            if not self.live_mst.is_connected():
+                components = group_components(connected_component_labels(graph))
+                message = "Graph is disconnected. Prim's algorithm requires a connected graph."
+                if components:
+                    message += " Components: " + " | ".join(", ".join(component) for component in components)
+                raise ValueError(message)
 
             if not self.start_vertex_var.get() or self.start_vertex_var.get() == "Source":     # Check if a starting vertex is selected
                 raise ValueError("Select a source node to begin Prim's algorithm on your graph.")
             
             # Initialize Prim's algorithm
-            self.prim_generator = self.prim_minimum_spanning_tree((V, E, W))
+            self.prim_generator = self.prim_minimum_spanning_tree(graph)
             self.next_step_button.configure(state='normal')  # Enable "Next Step" button
 
             # Highlight the starting node
@@ -635,6 +740,14 @@ class GraphVisualiser(GraphVisualiserGUI):
                 break  
 
 
+    # Marks an edge as part of the MST for toggling button, its items move from the non-MST state tag to the MST one
+    def mark_mst_edge(self, edge):
+        edge.is_mst_edge = True
+        for item in (edge.line_id, edge.midpoint_id, edge.text_id):
+            self.canvas.dtag(item, NON_MST_TAG)
+            self.canvas.addtag_withtag(MST_TAG, item)
+
+
     # For highlighting MST nodes
     def highlight_node(self, node_identifier):    
         # Find the node by its identifier and update its color to indicate it's been visited
@@ -649,25 +762,30 @@ class GraphVisualiser(GraphVisualiserGUI):
 
     # For toggling between showing the full graph and the MST
     def toggle_mst_view(self):
-        for edge in self.edges:
-            if not edge.is_mst_edge:
-                # Hide or show the edge
-                current_state = self.canvas.itemcget(edge.line_id, 'state')
-                new_state = 'hidden' if current_state == 'normal' else 'normal'
-                self.canvas.itemconfigure(edge.line_id, state=new_state)
-                self.canvas.itemconfigure(edge.midpoint_id, state=new_state)
-
-                # Hide or show the weight label 
-                current_state_text = self.canvas.itemcget(edge.text_id, 'state')
-                new_state_text = 'hidden' if current_state_text == 'normal' else 'normal'
-                self.canvas.itemconfigure(edge.text_id, state=new_state_text)
+        # Hide or show the lines, midpoints and weight labels of every non-MST edge at once, the button text says which is showing
+        current_text = self.toggle_mst_button.cget('text')
+        self.canvas.itemconfigure(NON_MST_TAG, state='hidden' if current_text == 'Show MST only' else 'normal')
             
         # Update the button text based on the current state
-        current_text = self.toggle_mst_button.cget('text')
         new_text = 'Show full graph' if current_text == 'Show MST only' else 'Show MST only'
         self.toggle_mst_button.configure(text=new_text)
 
 
+    # For showing the weight of the live MST, which is updated on every edit without re-running Prim's
+    def update_live_mst_label(self):
+        if not self.live_mst.tree_edges:
+            text = "Live MST: no edges yet"
+        else:
+            text = f"Live MST: {len(self.live_mst.tree_edges)} edges, total weight {self.live_mst.total_weight}"
+
+        # Connectivity feedback so the user knows whether Prim's can run before pressing the button
+        if self.live_mst.num_components > 1:
+            text += f"\nDisconnected: {self.live_mst.num_components} components"
+        elif self.live_mst.num_components == 1 and len(self.nodes) > 1:
+            text += "\nConnected"
+        self.live_mst_label.configure(text=text)
+
+
     # For updating text in prim's textbox
     def update_info_text(self, message):
         self.info_text_widget.configure(state='normal')
@@ -685,48 +803,69 @@ class GraphVisualiser(GraphVisualiserGUI):
 
     # For resetting colours of nodes and edges on canvas
     def reset_node_and_edge_colors(self):
-        # Reset colors of nodes and edges
-        for node in self.nodes:
-            self.canvas.itemconfig(node.id, fill="blue", outline = "black", width = 3)  # Reset node color to blue
-        for edge in self.edges:
-            self.canvas.itemconfig(edge.line_id, width=2, fill="black")  # Reset edge color to black
+        # Reset colors of nodes and edges, one call per layer rather than per item
+        self.canvas.itemconfigure(NODE_LAYER, fill="blue", outline = "black", width = 3)  # Reset node color to blue
+        self.canvas.itemconfigure(EDGE_LAYER, width=2, fill="black")  # Reset edge color to black
     
 
     # For unhiding nodes and edges on canvas
     def unhide_edges(self):
-        for edge in self.edges:     
-                if not edge.is_mst_edge:
-                    # Show the edge
-                    current_state = self.canvas.itemcget(edge.line_id, 'state')
-                    reset_state = 'normal' if current_state == 'hidden' else 'normal'
-                    self.canvas.itemconfigure(edge.line_id, state=reset_state)
-                    self.canvas.itemconfigure(edge.midpoint_id, state=reset_state)
-
-                    # Show the weight label 
-                    current_state_text = self.canvas.itemcget(edge.text_id, 'state')
-                    reset_state_text = 'normal' if current_state_text == 'hidden' else 'normal'
-                    self.canvas.itemconfigure(edge.text_id, state=reset_state_text)
+        # Show the lines, midpoints and weight labels of every non-MST edge
+        self.canvas.itemconfigure(NON_MST_TAG, state='normal')
     
 
-    # Below is for handling graph dimensions wnen canvas is shrunk
+    # Below is for handling graph dimensions when canvas is resized. Configure events arrive in bursts while the window is
+    # being dragged, so each one only records the latest size and the graph is rescaled at most once per frame
     def on_canvas_resize(self, event):
-        # Calculate the new dimensions
-        new_width = event.width
-        new_height = event.height
-        
-        # Assuming self.canvas_old_width and self.canvas_old_height hold the old dimensions
-        # You need to initialize these somewhere in your code, probably in the __init__ method
+        self.pending_canvas_size = (event.width, event.height)
+        if self.resize_job is None:
+            self.resize_job = self.after(CANVAS_FRAME_INTERVAL, self.apply_canvas_resize)
+
+
+    # Rescales node positions from the last applied canvas size to the latest one, can also be called directly to flush a pending resize
+    def apply_canvas_resize(self):
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+            self.resize_job = None
+        if self.pending_canvas_size is None:
+            return
+        new_width, new_height = self.pending_canvas_size
+        self.pending_canvas_size = None
+
         scale_x = new_width / self.canvas_old_width if self.canvas_old_width else 1
         scale_y = new_height / self.canvas_old_height if self.canvas_old_height else 1
 
         # Update the old dimensions with the new dimensions
         self.canvas_old_width = new_width
         self.canvas_old_height = new_height
+        if scale_x == 1 and scale_y == 1:
+            return
 
-        # Update the positions of all nodes based on the scale factors
+        # Update the positions of all nodes in the model, then redraw everything from it in one pass
         for node in self.nodes:
-            self.resize_move_node(node, node.x * scale_x, node.y * scale_y)
-        
+            node.x *= scale_x
+            node.y *= scale_y
+        self.redraw_graph_positions()
+
+
+    # Moves every node and edge item to where the model puts it, each item's coordinates are computed and set once.
+    # Node circles, midpoint markers and labels keep their size, only their positions change
+    def redraw_graph_positions(self):
+        for node in self.nodes:
+            self.canvas.coords(node.id, node.x - NODE_RADIUS, node.y - NODE_RADIUS, node.x + NODE_RADIUS, node.y + NODE_RADIUS)
+            self.canvas.coords(node.text_id, node.x, node.y)
+            self.index_node(node)
+
+        for edge in self.edges:
+            self.canvas.coords(edge.line_id, edge.start_node.x, edge.start_node.y, edge.end_node.x, edge.end_node.y)
+            mid_x = (edge.start_node.x + edge.end_node.x) / 2
+            mid_y = (edge.start_node.y + edge.end_node.y) / 2
+            self.canvas.coords(edge.midpoint_id, mid_x - 8, mid_y - 8, mid_x + 8, mid_y + 8)
+            self.canvas.coords(edge.text_id, mid_x, mid_y)
+            self.index_edge(edge)
+
+
+    # Moves a single node to (new_x, new_y) along with the edges touching it
     def resize_move_node(self, node, new_x, new_y):
         # Calculate deltas
         dx = new_x - node.x
@@ -739,32 +878,33 @@ class GraphVisualiser(GraphVisualiserGUI):
         # Move the node and its text identifier
         self.canvas.move(node.id, dx, dy)
         self.canvas.move(node.text_id, dx, dy)
+        self.index_node(node)
 
         # Update connected edges
-        for edge in self.edges:
-            if edge.start_node == node or edge.end_node == node:
-                # Update the edge line
-                self.canvas.coords(edge.line_id, 
-                                edge.start_node.x, edge.start_node.y, 
-                                edge.end_node.x, edge.end_node.y)
-
-                # Recalculate the midpoint for the edge
-                mid_x = (edge.start_node.x + edge.end_node.x) / 2
-                mid_y = (edge.start_node.y + edge.end_node.y) / 2
+        for edge in self.edges_of(node):
+            # Update the edge line
+            self.canvas.coords(edge.line_id, 
+                            edge.start_node.x, edge.start_node.y, 
+                            edge.end_node.x, edge.end_node.y)
+            self.index_edge(edge)
 
-                # Update the position of the midpoint oval and the weight label
-                self.canvas.coords(edge.midpoint_id,
-                                mid_x - 8, mid_y - 8, 
-                                mid_x + 8, mid_y + 8)
-                self.canvas.coords(edge.text_id, mid_x, mid_y)
+            # Recalculate the midpoint for the edge
+            mid_x = (edge.start_node.x + edge.end_node.x) / 2
+            mid_y = (edge.start_node.y + edge.end_node.y) / 2
 
-                # Ensure the edge, midpoint, and label are raised above other canvas items
-                self.canvas.tag_raise(edge.midpoint_id)
-                self.canvas.tag_raise(edge.text_id)
+            # Update the position of the midpoint oval and the weight label
+            self.canvas.coords(edge.midpoint_id,
+                            mid_x - 8, mid_y - 8, 
+                            mid_x + 8, mid_y + 8)
+            self.canvas.coords(edge.text_id, mid_x, mid_y)
 
 
 
     def return_to_main_menu(self):
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)  # A rescale still waiting for the next frame would run against the destroyed canvas
+            self.resize_job = None
+        self.cancel_drag()
         self.destroy()
         from interface.vp_main_gui import MainMenu    #Importing here to avoid circular import
         main_menu = MainMenu()  
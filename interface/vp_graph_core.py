@@ -0,0 +1,194 @@
+#####################################################################################
+# Indexed graph core shared by the MST engines and graph utilities                  #
+#####################################################################################
+
+from array import array
+from operator import itemgetter
+import numpy as np
+
+
+# Graph with integer-indexed vertices and a compressed sparse row (CSR) adjacency structure.
+# The neighbours of vertex i are targets[offsets[i]:offsets[i + 1]], with the matching weights and
+# edge ids stored at the same positions, so neighbour iteration costs O(degree) instead of O(V)
+class IndexedGraph:
+    def __init__(self, identifiers, edges, weights=None, endpoints=None):
+        self.identifiers = list(identifiers)  # Vertex index -> vertex identifier
+        self.index = {identifier: i for i, identifier in enumerate(self.identifiers)}  # Vertex identifier -> vertex index
+        self.edges = list(edges)  # Original (start, end) identifier tuples, position in this list is the edge id
+        self.edge_weights = list(weights) if weights is not None else [1] * len(self.edges)  # Weight of each edge id
+        self.num_vertices = len(self.identifiers)
+        self.num_edges = len(self.edges)
+
+        if len(self.index) != self.num_vertices:
+            raise ValueError("Vertex identifiers must be unique.")
+        if len(self.edge_weights) != self.num_edges:
+            raise ValueError("Every edge must have exactly one weight.")
+
+        if endpoints is not None:
+            starts, ends = endpoints     # Vertex index arrays matching edges, already known when generated from indices
+        else:
+            try:
+                starts = np.fromiter(map(self.index.__getitem__, map(itemgetter(0), self.edges)), dtype=np.int64, count=self.num_edges)
+                ends = np.fromiter(map(self.index.__getitem__, map(itemgetter(1), self.edges)), dtype=np.int64, count=self.num_edges)
+            except KeyError as e:
+                raise ValueError(f"Edge references unknown vertex {e.args[0]}.")
+
+        # Integer weights stay integers so totals print the same as the input, anything else is stored as a float
+        weight_type = 'q' if set(map(type, self.edge_weights)) <= {int} else 'd'
+        edge_weights = np.array(self.edge_weights, dtype=np.int64 if weight_type == 'q' else np.float64)
+
+        # Each undirected edge is stored once from each endpoint, grouped by source vertex with a stable sort
+        sources = np.concatenate((starts, ends))
+        order = np.argsort(sources, kind='stable')
+        degrees = np.bincount(sources, minlength=self.num_vertices)
+
+        self.edge_start = array('q', starts.tobytes())  # Edge id -> start vertex index
+        self.edge_end = array('q', ends.tobytes())  # Edge id -> end vertex index
+        self.offsets = array('q', np.concatenate(([0], np.cumsum(degrees))).astype(np.int64).tobytes())
+        self.targets = array('q', np.concatenate((ends, starts))[order].tobytes())
+        edge_ids = np.tile(np.arange(self.num_edges, dtype=np.int64), 2)[order]
+        self.edge_ids = array('q', edge_ids.tobytes())
+        self.weights = array(weight_type, edge_weights[edge_ids].tobytes())
+
+
+    # Builds the indexed graph from the (V, E, W) triple used throughout the interface
+    @classmethod
+    def from_vew(cls, graph):
+        V, E, W = graph
+        E = list(E)
+        return cls(V, E, list(map(W.__getitem__, E)))
+
+
+    # Builds the indexed graph from NumPy arrays of start/end vertex indices and weights, without any identifier lookups
+    @classmethod
+    def from_index_arrays(cls, identifiers, starts, ends, weights):
+        identifiers = list(identifiers)
+        starts, ends = np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+        lookup = np.array(identifiers, dtype=object)
+        edges = list(zip(lookup[starts].tolist(), lookup[ends].tolist()))
+        return cls(identifiers, edges, np.asarray(weights).tolist(), endpoints=(starts, ends))
+
+
+    # Builds the indexed graph from the visualiser's Node and Edge objects
+    @classmethod
+    def from_nodes_edges(cls, nodes, edges):
+        return cls((node.identifier for node in nodes),
+                   [(edge.start_node.identifier, edge.end_node.identifier) for edge in edges],
+                   [edge.weight for edge in edges])
+
+
+    # Builds the indexed graph from imported/exported JSON graph data
+    @classmethod
+    def from_json(cls, data):
+        return cls((node["id"] for node in data["nodes"]),
+                   [(edge["start"], edge["end"]) for edge in data["edges"]],
+                   [edge["weight"] for edge in data["edges"]])
+
+
+    # Yields (neighbour index, weight, edge id) for every edge incident to vertex i
+    def neighbors(self, i):
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            yield self.targets[k], self.weights[k], self.edge_ids[k]
+
+
+    def degree(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+
+# Complete graph that never stores its edges, weights are worked out on demand so memory stays O(V).
+# Weights come from weight(i, j) for vertex indices i < j if given, otherwise a hash of the seed and the
+# edge id (integers 1..max_weight, the same every time for the same seed), otherwise every weight is 1.
+# Edge (i, j) with i < j is oriented as (identifiers[i], identifiers[j]) and has the id it would have in
+# itertools.combinations order, matching the explicit complete graphs built by generate_complete_graph
+class ImplicitCompleteGraph:
+    def __init__(self, identifiers, weight=None, seed=None, max_weight=10):
+        self.identifiers = list(identifiers)  # Vertex index -> vertex identifier
+        self.index = {identifier: i for i, identifier in enumerate(self.identifiers)}  # Vertex identifier -> vertex index
+        self.num_vertices = len(self.identifiers)
+        self.num_edges = self.num_vertices * (self.num_vertices - 1) // 2
+        self.weight = weight
+        self.seed = seed
+        self.max_weight = max_weight
+
+        if len(self.index) != self.num_vertices:
+            raise ValueError("Vertex identifiers must be unique.")
+
+
+    def edge_id(self, i, j):
+        i, j = min(i, j), max(i, j)
+        return i * self.num_vertices - i * (i + 1) // 2 + (j - i - 1)
+
+
+    def edge(self, i, j):
+        i, j = min(i, j), max(i, j)
+        return self.identifiers[i], self.identifiers[j]
+
+
+    def weight_between(self, i, j):
+        i, j = min(i, j), max(i, j)
+        if self.weight is not None:
+            return self.weight(i, j)
+        if self.seed is not None:
+            return int(self._seeded_weights(np.array([self.edge_id(i, j)], dtype=np.int64))[0])
+        return 1
+
+
+    # Weight of the edge between two vertex identifiers, in either order
+    def edge_weight(self, start, end):
+        return self.weight_between(self.index[start], self.index[end])
+
+
+    # Weights from vertex i to every vertex as a float array, infinity at i itself. O(V) time and memory per row
+    def row(self, i):
+        n = self.num_vertices
+        if self.weight is not None:
+            row = np.fromiter((self.weight(min(i, j), max(i, j)) if j != i else np.inf for j in range(n)), dtype=np.float64, count=n)
+        elif self.seed is not None:
+            others = np.arange(n, dtype=np.int64)
+            low, high = np.minimum(others, i), np.maximum(others, i)
+            row = self._seeded_weights(low * n - low * (low + 1) // 2 + (high - low - 1)).astype(np.float64)
+        else:
+            row = np.ones(n)
+        row[i] = np.inf
+        return row
+
+
+    # splitmix64 over the edge ids, vectorised with wrapping uint64 arithmetic
+    def _seeded_weights(self, edge_ids):
+        z = edge_ids.astype(np.uint64) + np.uint64((self.seed * 0xD1B54A32D192ED03 + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+        return (z % np.uint64(self.max_weight)).astype(np.int64) + 1
+
+
+    # Yields (neighbour index, weight, edge id) for every edge incident to vertex i, same contract as IndexedGraph
+    def neighbors(self, i):
+        for j in range(self.num_vertices):
+            if j != i:
+                yield j, self.weight_between(i, j), self.edge_id(i, j)
+
+
+    def degree(self, i):
+        return self.num_vertices - 1
+
+
+    # Materialises every edge for engines that need the CSR arrays, this costs O(V^2) memory like an explicit graph
+    def to_indexed(self):
+        edges, weights = [], []
+        for i in range(self.num_vertices):
+            edges.extend((self.identifiers[i], self.identifiers[j]) for j in range(i + 1, self.num_vertices))
+            if self.weight is not None:
+                weights.extend(self.weight(i, j) for j in range(i + 1, self.num_vertices))
+            else:
+                weights.extend(self.row(i)[i + 1:].astype(np.int64).tolist())
+        return IndexedGraph(self.identifiers, edges, weights)
+
+
+# Returns graph unchanged if it is already indexed, otherwise converts a (V, E, W) triple or materialises an implicit graph
+def as_indexed_graph(graph):
+    if isinstance(graph, IndexedGraph):
+        return graph
+    if isinstance(graph, ImplicitCompleteGraph):
+        return graph.to_indexed()
+    return IndexedGraph.from_vew(graph)
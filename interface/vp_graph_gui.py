@@ -152,6 +152,10 @@ class GraphVisualiserGUI(ctk.CTk):
         self.toggle_mst_button.grid(row=5, pady=10, columnspan = 2)
         self.toggle_mst_button.configure(state='disabled')  # Start as disabled
 
+        # Label showing the live MST weight as the graph is edited
+        self.live_mst_label = ctk.CTkLabel(self.right_frame, text="Live MST: no edges yet", font=("Helvetica", 14), text_color=TITLE_COLOUR)
+        self.live_mst_label.grid(row=3, column=0, columnspan = 2, padx=10, sticky='w')
+
         # Text widget to display Prim's algorithm steps
         self.info_text_widget = ctk.CTkTextbox(self, height=500, width=300)
         self.info_text_widget.grid(in_=self.right_frame, row=2, column=0, columnspan = 2, pady=10, padx=10, sticky='ew')
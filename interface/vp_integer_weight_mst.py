@@ -0,0 +1,96 @@
+#####################################################################################
+# MST engines specialised for small integer weights, bucket queue Prim's and       #
+# counting sort Kruskal's, falling back to the generic engines for other weights    #
+#####################################################################################
+
+from interface.vp_graph_core import as_indexed_graph
+from interface.vp_priority_q_prims import prim_minimum_spanning_tree_with_priority_queue
+from interface.vp_kruskal import kruskal_minimum_spanning_tree, kruskal_over_edge_order
+
+MAX_WEIGHT_BUCKETS = 1024  # Widest weight range (max - min + 1) the specialised engines will allocate buckets for
+
+
+# Returns (min weight, max weight) if every weight is an integer in a range narrow enough for buckets, otherwise None
+def small_integer_weight_range(graph):
+    if graph.num_edges == 0 or graph.weights.typecode != 'q':  # IndexedGraph only keeps an integer array when every weight is an int
+        return None
+    low, high = min(graph.edge_weights), max(graph.edge_weights)
+    if high - low + 1 > MAX_WEIGHT_BUCKETS:
+        return None
+    return low, high
+
+
+# Prim's with a bucket queue, bucket k holds the vertices whose L value is low + k.
+# Select-min scans forward from the lowest non-empty bucket, so a run costs O(E + V * C) for C buckets
+def prim_minimum_spanning_tree_bucket_queue(graph, quiet=False):
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+    weight_range = small_integer_weight_range(graph)
+    if weight_range is None:
+        if not quiet:
+            print("Weights are not small integers, falling back to binary heap Prim's")
+        return prim_minimum_spanning_tree_with_priority_queue(graph, quiet)
+
+    low, high = weight_range
+    offsets, targets, weights, edge_ids = graph.offsets, graph.targets, graph.weights, graph.edge_ids
+    Te = set()  # Set of edges in the minimum spanning tree
+    Tv = [False] * graph.num_vertices  # Visited flag for each vertex index
+    parent = [-1] * graph.num_vertices  # Edge id that set L(v)
+    L = [high + 1] * graph.num_vertices  # Any weight in range beats the initial value, standing in for infinity
+    buckets = [set() for _ in range(high - low + 1)]
+    lowest = 0  # No bucket below this index holds a vertex
+    next_root = 0  # No vertex below this index is outside the tree once the buckets run dry
+    num_comparisons = 0
+
+    w = 0  # Starting vertex, choosing any vertex in V
+    while True:
+        Tv[w] = True
+        if parent[w] != -1:
+            Te.add(graph.edges[parent[w]])
+
+        # Update L(v) for vertices v connected to w, moving v to the bucket of its new L value
+        for k in range(offsets[w], offsets[w + 1]):
+            v = targets[k]
+            if not Tv[v]:
+                num_comparisons += 1  # Counting weight comparison
+                if weights[k] < L[v]:
+                    if L[v] <= high:
+                        buckets[L[v] - low].discard(v)
+                    L[v] = weights[k]
+                    parent[v] = edge_ids[k]
+                    buckets[L[v] - low].add(v)
+                    lowest = min(lowest, L[v] - low)
+
+        # Find w: L(w) = min{L(v) | v ∈ (V − Tv)} from the first non-empty bucket
+        while lowest < len(buckets) and not buckets[lowest]:
+            lowest += 1
+        if lowest < len(buckets):
+            w = buckets[lowest].pop()
+            continue
+
+        # Every vertex reachable so far is in the tree, the next one outside it starts another tree so a disconnected
+        # graph gets a spanning forest like the other engines
+        while next_root < graph.num_vertices and Tv[next_root]:
+            next_root += 1
+        if next_root == graph.num_vertices:
+            break
+        w = next_root
+
+    return Te, num_comparisons
+
+
+# Kruskal's with the edges ordered by a counting sort over the weight range, O(E + C) instead of O(E log E)
+def kruskal_minimum_spanning_tree_counting_sort(graph, quiet=False):
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+    weight_range = small_integer_weight_range(graph)
+    if weight_range is None:
+        if not quiet:
+            print("Weights are not small integers, falling back to comparison sort Kruskal's")
+        return kruskal_minimum_spanning_tree(graph)
+
+    low, high = weight_range
+    buckets = [[] for _ in range(high - low + 1)]
+    for edge_id, weight in enumerate(graph.edge_weights):
+        buckets[weight - low].append(edge_id)   # Appending in edge order keeps the sort stable
+
+    order = [edge_id for bucket in buckets for edge_id in bucket]
+    return kruskal_over_edge_order(graph, order)
@@ -0,0 +1,72 @@
+#####################################################################################
+# Kruskal's algorithm MST with an array-backed union-find (disjoint set forest)     #
+#####################################################################################
+
+from array import array
+import numpy as np
+
+from interface.vp_graph_core import as_indexed_graph
+
+
+# Disjoint sets over vertex indices 0..n-1 stored in flat integer arrays, with path compression and union by rank
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = array('q', range(n))  # parent[v] == v for the root of each set
+        self.rank = bytearray(n)  # Upper bound on tree height, never exceeds log2(n) so a byte is enough
+        self.num_sets = n
+        self.num_find_steps = 0  # Parent links followed by find, including the compression pass
+
+    # Returns the root of v's set and points every vertex on the path straight at it
+    def find(self, v):
+        parent = self.parent
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+            self.num_find_steps += 1
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+            self.num_find_steps += 1
+        return root
+
+    # Merges the sets containing a and b, returns False if they were already the same set
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        self.num_sets -= 1
+        return True
+
+
+def kruskal_minimum_spanning_tree(graph):
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+
+    # Examine edges lightest first, a stable sort keeps ties in the order they were given
+    order = np.argsort(np.asarray(graph.edge_weights), kind='stable').tolist()
+
+    return kruskal_over_edge_order(graph, order)
+
+
+# Grows the tree by examining edge ids in the given (lightest first) order, shared by every Kruskal's variant
+def kruskal_over_edge_order(graph, order):
+    edge_start, edge_end = graph.edge_start, graph.edge_end
+    Te = set()  # Set of edges in the minimum spanning tree
+    components = DisjointSet(graph.num_vertices)
+    num_comparisons = 0
+
+    for edge_id in order:
+        if components.num_sets == 1:
+            break   # The tree already spans every vertex
+
+        root_start = components.find(edge_start[edge_id])
+        root_end = components.find(edge_end[edge_id])
+        num_comparisons += 1  # Counting the root comparison that decides whether the edge closes a cycle
+        if root_start != root_end:
+            components.union(root_start, root_end)
+            Te.add(graph.edges[edge_id])
+
+    return Te, num_comparisons
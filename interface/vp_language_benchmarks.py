@@ -0,0 +1,254 @@
+#####################################################################################
+# Cross-language benchmark driver, builds the complexityAnalysisFiles programs      #
+# with whichever toolchains are installed, runs them and the registry's Python      #
+# engines over the same node list and plots every implementation on one chart       #
+#                                                                                   #
+#   python -m interface.vp_language_benchmarks --max-nodes 5000 --step 500          #
+#####################################################################################
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from interface.vp_engine_registry import engine_names, supports_implicit_graph, DEFAULT_ENGINE
+from interface.vp_benchmark import benchmark_engine
+from interface.vp_sweep_pool import sweep_node_counts
+from interface.vp_sweep_cache import environment_fingerprint
+from interface.vp_complexity_charts import languages_figure
+from interface.utils import generate_complete_graph
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "complexityAnalysisFiles")
+BUILD_DIRECTORY = os.path.join(SOURCE_DIRECTORY, "build")  # Ignored by git, every build writes here rather than next to the sources
+RUN_TIMEOUT = 3600  # Seconds one implementation may take for the whole node list before it is abandoned
+
+# Every program prints one of these lines per repetition
+OUTPUT_PATTERN = re.compile(r"Execution time for uniform weight with (\d+) nodes: ([0-9.eE+-]+) seconds")
+
+CSV_COLUMNS = ["implementation", "language", "nodes", "repetition", "seconds"]
+SUMMARY_COLUMNS = ["implementation", "language", "nodes", "repetitions", "median", "q1", "q3"]
+
+
+class LanguageImplementation:
+    def __init__(self, name, language, tools, build, command):
+        self.name = name
+        self.language = language
+        self.tools = tools  # Executables that must all be on the PATH, the first of each alternatives tuple that is found is used
+        self.build = build  # Function of the resolved tools returning the build commands, run in order
+        self.command = command  # Function of the resolved tools returning the command that takes "repetitions n1 n2 ..."
+
+    def resolve_tools(self):
+        resolved = []
+        for tool in self.tools:
+            found = next((path for path in map(shutil.which, tool if isinstance(tool, tuple) else (tool,)) if path), None)
+            if found is None:
+                return None
+            resolved.append(found)
+        return resolved
+
+    def available(self):
+        return self.resolve_tools() is not None
+
+    def __repr__(self):
+        return f"LanguageImplementation({self.name})"
+
+
+def _source(name):
+    return os.path.join(SOURCE_DIRECTORY, name)
+
+
+def _built(name):
+    return os.path.join(BUILD_DIRECTORY, name)
+
+
+# The external programs, all timing Prim's on a uniform weight complete graph they generate themselves
+LANGUAGE_IMPLEMENTATIONS = {
+    "Python (exec_analysis.py)": LanguageImplementation(
+        "Python (exec_analysis.py)", "Python", [], lambda tools: [],
+        lambda tools: [sys.executable, _source("exec_analysis.py")]),
+    "C++": LanguageImplementation(
+        "C++", "C++", [("g++", "clang++")],
+        lambda tools: [[tools[0], "-O2", "-std=c++17", "-o", _built("exec_analysis_cpp"), _source("exec_analysis.cpp")]],
+        lambda tools: [_built("exec_analysis_cpp")]),
+    "Go": LanguageImplementation(
+        "Go", "Go", ["go"],
+        lambda tools: [[tools[0], "build", "-o", _built("exec_analysis_go"), _source("exec_analysis.go")]],
+        lambda tools: [_built("exec_analysis_go")]),
+    "Rust": LanguageImplementation(
+        "Rust", "Rust", ["cargo"],
+        lambda tools: [[tools[0], "build", "--release", "--quiet", "--manifest-path", _source(os.path.join("exec_analysis_rust", "Cargo.toml")),
+                        "--target-dir", _built("rust")]],
+        lambda tools: [_built(os.path.join("rust", "release", "exec_analysis_rust"))]),
+    "Java": LanguageImplementation(
+        "Java", "Java", ["javac", "java"],
+        lambda tools: [[tools[0], "-d", _built("java"), _source("ExecAnalysis.java")]],
+        lambda tools: [tools[1], "-cp", _built("java"), "prims_implementation.complexityAnalysisFiles.ExecAnalysis"]),
+}
+
+
+class BenchmarkFailure(Exception):
+    pass
+
+
+# Builds one implementation, raising BenchmarkFailure with the compiler's output when a step fails
+def build_implementation(implementation):
+    tools = implementation.resolve_tools()
+    if tools is None:
+        raise BenchmarkFailure(f"{implementation.name} needs {', '.join(map(str, implementation.tools))} on the PATH")
+    os.makedirs(BUILD_DIRECTORY, exist_ok=True)
+    for step in implementation.build(tools):
+        completed = subprocess.run(step, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise BenchmarkFailure(f"Building {implementation.name} failed:\n{completed.stderr or completed.stdout}")
+    return tools
+
+
+# (n, seconds) for every timing line in a program's output, lines that aren't timings are ignored
+def parse_timings(output):
+    return [(int(match.group(1)), float(match.group(2))) for match in OUTPUT_PATTERN.finditer(output)]
+
+
+# Normalised rows for the timings in the order they were printed, repetitions are numbered per node count from 1
+def timing_rows(implementation, language, timings):
+    counts = {}
+    rows = []
+    for n, seconds in timings:
+        counts[n] = counts.get(n, 0) + 1
+        rows.append({"implementation": implementation, "language": language, "nodes": n, "repetition": counts[n], "seconds": seconds})
+    return rows
+
+
+def run_implementation(implementation, nodes, repetitions, timeout=RUN_TIMEOUT):
+    tools = build_implementation(implementation)
+    command = implementation.command(tools) + [str(repetitions)] + [str(n) for n in nodes]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise BenchmarkFailure(f"{implementation.name} did not finish within {timeout}s")
+    if completed.returncode != 0:
+        raise BenchmarkFailure(f"{implementation.name} exited with status {completed.returncode}:\n{completed.stderr}")
+    rows = timing_rows(implementation.name, implementation.language, parse_timings(completed.stdout))
+    if len(rows) != len(nodes) * repetitions:
+        raise BenchmarkFailure(f"{implementation.name} printed {len(rows)} timings, {len(nodes) * repetitions} were expected")
+    return rows
+
+
+# A registry engine timed in process on the same unit weight complete graphs, one row per benchmark sample
+def run_registry_engine(engine, nodes, repetitions):
+    rows = []
+    for n in nodes:
+        result = benchmark_engine(engine, generate_complete_graph(n, supports_implicit_graph(engine)), repetitions)
+        rows.extend(timing_rows(f"Python engine: {engine}", "Python", [(n, seconds) for seconds in result.timing_summary.samples]))
+    return rows
+
+
+# Median and interquartile range of each implementation at each node count, in the order the rows arrived
+def summarise(rows):
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["implementation"], row["language"], row["nodes"]), []).append(row["seconds"])
+    summaries = []
+    for (implementation, language, n), samples in groups.items():
+        q1, median, q3 = (float(q) for q in np.percentile(samples, [25, 50, 75]))
+        summaries.append({"implementation": implementation, "language": language, "nodes": n, "repetitions": len(samples),
+                          "median": median, "q1": q1, "q3": q3})
+    return summaries
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m interface.vp_language_benchmarks",
+                                     description="Build and run the complexityAnalysisFiles implementations and the Python engines over the same node list.")
+    parser.add_argument("--implementations", nargs="+", choices=list(LANGUAGE_IMPLEMENTATIONS), default=list(LANGUAGE_IMPLEMENTATIONS),
+                        help="external programs to run, those without a toolchain on this machine are skipped")
+    parser.add_argument("--engines", nargs="*", choices=engine_names(), default=[DEFAULT_ENGINE], help="registry engines to time in process alongside them")
+    parser.add_argument("--max-nodes", type=int, default=5000)
+    parser.add_argument("--step", type=int, default=500)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=RUN_TIMEOUT, help="seconds each external program may take for the whole node list")
+    parser.add_argument("--csv", help="write one row per timed repetition to this CSV file")
+    parser.add_argument("--json", help="write the rows, their summary and the environment to this JSON file")
+    parser.add_argument("--plot", help="render the chart to this .png or .svg file")
+    args = parser.parse_args(argv)
+
+    if args.max_nodes < 3:
+        parser.error("--max-nodes must be at least 3")
+    if args.step < 1:
+        parser.error("--step must be at least 1")
+    if args.repetitions < 1:
+        parser.error("--repetitions must be at least 1")
+    if args.plot and os.path.splitext(args.plot)[1].lower() not in (".png", ".svg"):
+        parser.error("--plot must end in .png or .svg")
+    return args
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(path, args, rows, summaries, skipped):
+    with open(path, "w") as file:
+        json.dump({
+            "max_nodes": args.max_nodes,
+            "step": args.step,
+            "repetitions": args.repetitions,
+            "environment": environment_fingerprint(),
+            "skipped": skipped,
+            "rows": rows,
+            "summary": summaries,
+        }, file, indent=4)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    nodes = sweep_node_counts(args.max_nodes, args.step)
+    rows = []
+    skipped = {}
+
+    # Build tools and graph generation print their progress, stdout is kept for the CSV rows
+    with contextlib.redirect_stdout(sys.stderr):
+        for name in args.implementations:
+            implementation = LANGUAGE_IMPLEMENTATIONS[name]
+            if not implementation.available():
+                skipped[name] = "toolchain not found"
+                print(f"Skipping {name}, its toolchain is not installed")
+                continue
+            try:
+                rows.extend(run_implementation(implementation, nodes, args.repetitions, args.timeout))
+                print(f"{name}: {len(nodes)} points x {args.repetitions} repetitions")
+            except BenchmarkFailure as error:
+                skipped[name] = str(error)
+                print(f"Skipping {name}: {error}")
+
+        for engine in args.engines:
+            rows.extend(run_registry_engine(engine, nodes, args.repetitions))
+            print(f"Python engine {engine}: {len(nodes)} points x {args.repetitions} repetitions")
+
+    summaries = summarise(rows)
+    if args.csv:
+        write_csv(args.csv, rows)
+    if args.json:
+        write_json(args.json, args, rows, summaries, skipped)
+    if args.plot:
+        fig = languages_figure(summaries, f"Prim's on uniform weight complete graphs up to {args.max_nodes} nodes, by implementation.")
+        FigureCanvasAgg(fig)
+        fig.savefig(args.plot)
+    if not (args.csv or args.json):
+        writer = csv.DictWriter(sys.stdout, fieldnames=SUMMARY_COLUMNS)    # Nowhere else asked for, so the summary goes to stdout
+        writer.writeheader()
+        writer.writerows(summaries)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
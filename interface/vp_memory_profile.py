@@ -0,0 +1,108 @@
+#####################################################################################
+# Memory profiling for the complexity analyser, peak traced allocations and RSS     #
+# growth for graph generation and the MST run, and bytes per edge of each graph     #
+# representation                                                                    #
+#####################################################################################
+
+import gc
+import tracemalloc
+import numpy as np
+import psutil
+
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph, as_indexed_graph
+from interface.vp_dense_prims import dense_weight_matrix
+from interface.vp_engine_registry import run_engine
+from interface.vp_workloads import generate_workload
+from interface.utils import generate_complete_graph
+
+
+class MemoryProfile:
+    def __init__(self, graph_bytes, generation_peak, generation_rss, mst_peak, mst_rss):
+        self.graph_bytes = graph_bytes  # Traced bytes still held by the generated graph
+        self.generation_peak = generation_peak  # Peak traced bytes while generating the graph
+        self.generation_rss = generation_rss  # Resident set growth while generating the graph, the allocator may not hand memory back so this can be 0
+        self.mst_peak = mst_peak  # Peak traced bytes the MST run allocated on top of the graph, including any conversion to CSR
+        self.mst_rss = mst_rss  # Resident set growth during the MST run
+
+    def __repr__(self):
+        return f"MemoryProfile(graph={self.graph_bytes}B, generation peak={self.generation_peak}B, mst peak={self.mst_peak}B)"
+
+
+# Generates a graph with generate(n) and runs the engine on it once, with tracemalloc tracing both phases. Both are run
+# untraced on a 3 node graph first, so lazy imports and first-call caches aren't charged to the first point.
+# Tracing slows allocation down, so the timings of a profiled result are not comparable with measure_engine's
+def profile_engine_memory(engine, generate, n):
+    run_engine(engine, generate(min(n, 3)))
+    process = psutil.Process()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = process.memory_info().rss
+        graph = generate(n)
+        graph_current, generation_peak = tracemalloc.get_traced_memory()
+        generation_rss = process.memory_info().rss - rss_before
+
+        tracemalloc.reset_peak()
+        rss_before = process.memory_info().rss
+        result = run_engine(engine, graph)
+        mst_peak = tracemalloc.get_traced_memory()[1] - graph_current
+        mst_rss = process.memory_info().rss - rss_before
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    result.memory_profile = MemoryProfile(graph_current - traced_before, generation_peak - traced_before, generation_rss, mst_peak, mst_rss)
+    return result
+
+
+# Traced bytes held by whatever build() returns, measured while it is still referenced
+def retained_bytes(build):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        built = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+        del built
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return size
+
+
+# Bytes per edge of each representation that can hold the graph, every one built from the same index arrays.
+# The implicit graph only exists for complete graphs, and the dense matrix is skipped past max_dense_nodes (it is n^2 floats)
+def representation_bytes_per_edge(graph, max_dense_nodes=4000):
+    graph = as_indexed_graph(graph)
+    identifiers = list(graph.identifiers)
+    starts = np.frombuffer(graph.edge_start, dtype=np.int64).copy()
+    ends = np.frombuffer(graph.edge_end, dtype=np.int64).copy()
+    weights = np.asarray(graph.edge_weights)
+    n, m = len(identifiers), len(starts)
+
+    def triple():
+        E = [(identifiers[start], identifiers[end]) for start, end in zip(starts.tolist(), ends.tolist())]
+        return identifiers[:], E, dict(zip(E, weights.tolist()))
+
+    builders = {
+        "(V, E, W) triple": triple,
+        "IndexedGraph (CSR)": lambda: IndexedGraph.from_index_arrays(identifiers, starts, ends, weights),
+    }
+    if n <= max_dense_nodes:
+        builders["Dense weight matrix"] = lambda: dense_weight_matrix(graph)
+    if m == n * (n - 1) // 2:
+        builders["ImplicitCompleteGraph"] = lambda: ImplicitCompleteGraph(identifiers)
+
+    return {name: retained_bytes(build) / max(m, 1) for name, build in builders.items()}
+
+
+# Representation comparison for the unit weight complete graph on n vertices, or for a generate_workload graph
+def workload_bytes_per_edge(n, workload=None):
+    graph = generate_complete_graph(n) if workload is None else generate_workload(n=n, **workload)
+    return representation_bytes_per_edge(graph)
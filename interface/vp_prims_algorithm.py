@@ -2,72 +2,114 @@
 # Implementation for Prim's algorithm MST based on PLK Chapter 8 - Graph Algorithms #
 #####################################################################################
 
+import itertools
+
+from interface.vp_graph_core import as_indexed_graph, ImplicitCompleteGraph
+
 
 def prim_minimum_spanning_tree(graph):
-    V, E, W = graph
-    V = set(V)  # Set of vertices
-    E = set(E)  # Set of edges
+    if isinstance(graph, ImplicitCompleteGraph):
+        return prim_minimum_spanning_tree_implicit(graph)
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+    offsets, targets, weights, edge_ids = graph.offsets, graph.targets, graph.weights, graph.edge_ids
     Te = set()  # Set of edges in the minimum spanning tree
-    Tv = set()  # Set of visited vertices
-    u = next(iter(V))  # Starting vertex, choosing any vertex in V
-    L = {}      # Dictionary for L values of each edge
+    Tv = [False] * graph.num_vertices   # Visited flag for each vertex index
+    u = 0  # Starting vertex, choosing any vertex in V
+    L = [float("inf")] * graph.num_vertices    # L values of each vertex
     num_comparisons = 0
 
-    Tv.add(u)           #Adding initial vertex to Tv
+    Tv[u] = True           #Adding initial vertex to Tv
+    unvisited = list(range(1, graph.num_vertices))  # V - Tv
 
-    # Initialize L(v) for all vertices
-    for v in V - Tv:
-        if (u, v) in E:
-            L[v] = W[(u, v)]
-        elif (v, u) in E:
-            L[v] = W[(v, u)]
-        else:
-            L[v] = float("inf")
+    # Initialize L(v) for all neighbours of u, every other vertex stays at infinity
+    for k in range(offsets[u], offsets[u + 1]):
+        v = targets[k]
+        if not Tv[v] and weights[k] < L[v]:
+            L[v] = weights[k]
 
     
     
-    i = 0
-    while Tv != V:
-        i += 1
+    while unvisited:
         # Find w: L(w) = min{L(v) | v ∈ (V − Tv)}
-        w = min((v for v in (V - Tv)), key=lambda v: L[v])
+        w = min(unvisited, key=L.__getitem__)
+        unvisited.remove(w)
 
 
-        # Find the associated edge e from TV
+        # Find the associated edge e from TV, only the neighbours of w can share an edge with it
         e = None
         min_weight = float('inf')
-        for v in Tv:
-            edge_weight = W.get((v, w), W.get((w, v)))
-            if edge_weight is not None:
+        for k in range(offsets[w], offsets[w + 1]):
+            if Tv[targets[k]]:
                 num_comparisons += 1  # Counting weight comparison only
-                if edge_weight < min_weight:
-                    e = (v, w) if (v, w) in E else (w, v)
-                    min_weight = edge_weight
+                if weights[k] < min_weight:
+                    e = graph.edges[edge_ids[k]]
+                    min_weight = weights[k]
 
 
         # Add the edge e to TE
         Te.add(e)
 
         # Update TV
-        Tv.add(w)
+        Tv[w] = True
 
         
 
         # Update L(v) for v ∈ (V − Tv) if there is an edge (w, v) or (v, w) in E with weight less than L(v)
-        for v in (V - Tv):
-            edge_weight_vw = W.get((v, w))
-            edge_weight_wv = W.get((w, v))
-            
-            # Check the edge weight and count the comparison
-            if edge_weight_vw is not None:
-                num_comparisons += 1  # Counting weight comparison
-                if edge_weight_vw < L[v]:
-                    L[v] = edge_weight_vw
-            if edge_weight_wv is not None:
+        for k in range(offsets[w], offsets[w + 1]):
+            v = targets[k]
+            if not Tv[v]:
                 num_comparisons += 1  # Counting weight comparison
-                if edge_weight_wv < L[v]:
-                    L[v] = edge_weight_wv
+                if weights[k] < L[v]:
+                    L[v] = weights[k]
         
         
 
-    return Te, num_comparisons
\ No newline at end of file
+    return Te, num_comparisons
+
+
+
+# The same algorithm on an ImplicitCompleteGraph, every other vertex is a neighbour so the neighbour loops walk w's row of weights.
+# The row is walked in the order graph.to_indexed() lists w's neighbours, higher indices then lower ones, so ties are broken
+# and comparisons counted exactly as on the materialised graph
+def prim_minimum_spanning_tree_implicit(graph):
+    n = graph.num_vertices
+    Te = set()  # Set of edges in the minimum spanning tree
+    Tv = [False] * n   # Visited flag for each vertex index
+    u = 0  # Starting vertex, choosing any vertex in V
+    num_comparisons = 0
+
+    Tv[u] = True           #Adding initial vertex to Tv
+    unvisited = list(range(1, n))  # V - Tv
+
+    # Initialize L(v) from u's row of weights, u's own entry is infinite
+    L = graph.row(u).tolist()
+
+    while unvisited:
+        # Find w: L(w) = min{L(v) | v ∈ (V − Tv)}
+        w = min(unvisited, key=L.__getitem__)
+        unvisited.remove(w)
+        row = graph.row(w).tolist()
+
+        # Find the associated edge e from TV, the lightest edge from w to a visited vertex
+        closest = None
+        min_weight = float('inf')
+        for v in itertools.chain(range(w + 1, n), range(w)):
+            if Tv[v]:
+                num_comparisons += 1  # Counting weight comparison only
+                if row[v] < min_weight:
+                    closest = v
+                    min_weight = row[v]
+
+        # Add the edge e to TE
+        Te.add(graph.edge(w, closest))
+
+        # Update TV
+        Tv[w] = True
+
+        # Update L(v) for v ∈ (V − Tv) with w's row of weights
+        for v in unvisited:
+            num_comparisons += 1  # Counting weight comparison
+            if row[v] < L[v]:
+                L[v] = row[v]
+
+    return Te, num_comparisons
@@ -2,46 +2,125 @@
 # Implementation for Prim's algorithm MST based on PLK Chapter 8 - Graph Algorithms #
 #####################################################################################
 
-import heapq
+from interface.vp_graph_core import as_indexed_graph
 
-def prim_minimum_spanning_tree_with_priority_queue(graph):
-    V, E, W = graph
-    V = set(V)  # Set of vertices
-    E = set(E)  # Set of edges
+
+# Binary min-heap of vertex indices keyed by their L value, position[v] tracks where v sits in the heap
+# so decrease_key can sift a vertex up in O(log V) instead of pushing a lazy duplicate entry
+class IndexedMinHeap:
+    def __init__(self, capacity):
+        self.heap = []  # Vertex indices in heap order
+        self.keys = [float("inf")] * capacity  # Current key of each vertex
+        self.position = [-1] * capacity  # Index of each vertex in self.heap, -1 if not in the heap
+        self.num_comparisons = 0  # Key comparisons made while sifting
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, v):
+        return self.position[v] != -1
+
+    def push(self, v, key):
+        self.keys[v] = key
+        self.position[v] = len(self.heap)
+        self.heap.append(v)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, v, key):
+        self.keys[v] = key
+        self._sift_up(self.position[v])
+
+    # Removes and returns (key, vertex) for the vertex with the smallest key
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.position[top] = -1
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return self.keys[top], top
+
+    def _sift_up(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        v = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            self.num_comparisons += 1
+            if keys[v] >= keys[heap[parent]]:
+                break
+            heap[i] = heap[parent]
+            position[heap[i]] = i
+            i = parent
+        heap[i] = v
+        position[v] = i
+
+    def _sift_down(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        v = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size:
+                self.num_comparisons += 1
+                if keys[heap[child + 1]] < keys[heap[child]]:
+                    child += 1
+            self.num_comparisons += 1
+            if keys[heap[child]] >= keys[v]:
+                break
+            heap[i] = heap[child]
+            position[heap[i]] = i
+            i = child
+        heap[i] = v
+        position[v] = i
+
+
+# Prim's with an indexed binary heap, O(E log V) since each edge causes at most one decrease_key
+def prim_minimum_spanning_tree_with_priority_queue(graph, quiet=False):
+    graph = as_indexed_graph(graph)    # Accepts either a (V, E, W) triple or an IndexedGraph
+    offsets, targets, weights, edge_ids = graph.offsets, graph.targets, graph.weights, graph.edge_ids
     Te = set()  # Set of edges in the minimum spanning tree
-    Tv = set()  # Set of visited vertices
-    u = next(iter(V))  # Starting vertex, choosing any vertex in V
-    L = {v: float("inf") for v in V}  # Initialize L(v) for all vertices
-    L[u] = 0  # Starting vertex weight is 0 to ensure it's picked first
+    Tv = [False] * graph.num_vertices  # Visited flag for each vertex index
+    parent = [-1] * graph.num_vertices  # Edge id that set L(v), so the tree edge is known when v is popped
+    u = 0  # Starting vertex, choosing any vertex in V
     num_comparisons = 0
 
-    print(f"Running Prims on graph with {len(V)} vertices and {len(E)} edges")
-    # Priority queue of vertices outside the MST, initialized with all vertices. The priority is L[v].
-    pq = [(weight, v) for v, weight in L.items()]
-    heapq.heapify(pq)  # Convert list into a heap
+    if not quiet:
+        print(f"Running Prims on graph with {graph.num_vertices} vertices and {graph.num_edges} edges")
+    # Priority queue of discovered vertices outside the MST, the priority is L[v]
+    pq = IndexedMinHeap(graph.num_vertices)
+    L = pq.keys  # L values live in the heap so decrease_key and the comparisons below share them
 
-    while pq:
-        min_weight, w = heapq.heappop(pq)  # Get vertex with minimum L value
-        
-        if w in Tv:  # Skip if vertex is already visited
+    # Once the heap runs dry every vertex reachable from the root is in the tree, the next vertex not yet visited starts
+    # another tree so a disconnected graph gets a spanning forest like the other engines
+    for root in range(u, graph.num_vertices):
+        if Tv[root]:
             continue
+        pq.push(root, 0)  # Root weight is 0 to ensure it's picked first
 
-        Tv.add(w)  # Add w to the set of visited vertices
-
-        # If w was reached from another vertex u, add the edge (u, w) to Te
-        if w != u:  # For the first vertex u==w, so skip
-            Te.add((u, w) if (u, w) in E else (w, u))
+        while pq:
+            _, w = pq.pop()  # Get vertex with minimum L value
+            Tv[w] = True  # Add w to the set of visited vertices
 
-        # Update L(v) for vertices v connected to w
-        for v in V - Tv:
-            if (w, v) in E or (v, w) in E:
-                edge_weight = W.get((w, v), W.get((v, w)))
-                num_comparisons += 1  # Counting weight comparison
-                if edge_weight is not None and edge_weight < L[v]:
-                    L[v] = edge_weight
-                    heapq.heappush(pq, (L[v], v))  # Update priority queue with new lower weight
+            # Add the edge that last lowered L(w) to Te, a root has no such edge
+            if parent[w] != -1:
+                Te.add(graph.edges[parent[w]])
 
-        u = w  # Update u for edge addition check
+            # Update L(v) for vertices v connected to w
+            for k in range(offsets[w], offsets[w + 1]):
+                v = targets[k]
+                if not Tv[v]:
+                    num_comparisons += 1  # Counting weight comparison
+                    if weights[k] < L[v]:
+                        parent[v] = edge_ids[k]
+                        if v in pq:
+                            pq.decrease_key(v, weights[k])
+                        else:
+                            pq.push(v, weights[k])
 
-    print(f"Prim's algorithm found a minimum spanning tree with {len(Te)} edges")
-    return Te, num_comparisons
+    if not quiet:
+        print(f"Prim's algorithm found a minimum spanning tree with {len(Te)} edges")
+    return Te, num_comparisons + pq.num_comparisons    # Key comparisons made sifting the heap are comparisons of weights too
@@ -0,0 +1,92 @@
+#####################################################################################
+# Uniform grid spatial index for canvas hit-testing, every item is registered in    #
+# each cell its shape can be hit from, so a click only looks at one cell            #
+#####################################################################################
+
+import math
+
+
+# Buckets items by grid cell so a point query only checks the few items near it. The grid doesn't know the shapes,
+# callers register circles and segments padded by their hit tolerance and test the candidates exactly.
+# Items can be any hashable objects, the visualiser uses its Node and Edge objects
+class SpatialGrid:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> set of items registered in that cell
+        self.item_cells = {}  # Item -> list of the cells it is registered in, for removal
+
+
+    def __len__(self):
+        return len(self.item_cells)
+
+
+    def __contains__(self, item):
+        return item in self.item_cells
+
+
+    def _cell(self, value):
+        return math.floor(value / self.cell_size)
+
+
+    # Registers the square around a circle, a point outside it is further than radius from the centre
+    def insert_circle(self, item, x, y, radius):
+        columns = range(self._cell(x - radius), self._cell(x + radius) + 1)
+        rows = range(self._cell(y - radius), self._cell(y + radius) + 1)
+        self._register(item, [(column, row) for row in rows for column in columns])
+
+
+    # Registers every cell within padding of the segment, row by row. In each row only the stretch of the segment that
+    # passes within padding of that row is covered, so a long diagonal edge takes O(length / cell_size) cells, not its bounding box
+    def insert_segment(self, item, x0, y0, x1, y1, padding):
+        if y0 > y1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+        cells = []
+        for row in range(self._cell(y0 - padding), self._cell(y1 + padding) + 1):
+            low = max(row * self.cell_size - padding, y0)
+            high = min((row + 1) * self.cell_size + padding, y1)
+            if y1 == y0:
+                x_low, x_high = min(x0, x1), max(x0, x1)
+            else:
+                x_a = x0 + (x1 - x0) * (low - y0) / (y1 - y0)
+                x_b = x0 + (x1 - x0) * (high - y0) / (y1 - y0)
+                x_low, x_high = min(x_a, x_b), max(x_a, x_b)
+            cells.extend((column, row) for column in range(self._cell(x_low - padding), self._cell(x_high + padding) + 1))
+        self._register(item, cells)
+
+
+    def _register(self, item, cells):
+        self.remove(item)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(item)
+        self.item_cells[item] = cells
+
+
+    def remove(self, item):
+        for cell in self.item_cells.pop(item, ()):
+            members = self.cells[cell]
+            members.discard(item)
+            if not members:
+                del self.cells[cell]
+
+
+    def clear(self):
+        self.cells.clear()
+        self.item_cells.clear()
+
+
+    # Items whose registered shape may contain (x, y), callers still have to test each one exactly
+    def query(self, x, y):
+        return self.cells.get((self._cell(x), self._cell(y)), ())
+
+
+# True if (x, y) is inside or on the circle
+def point_in_circle(x, y, centre_x, centre_y, radius):
+    return (x - centre_x) ** 2 + (y - centre_y) ** 2 <= radius ** 2
+
+
+# Shortest distance from (x, y) to the segment between (x0, y0) and (x1, y1)
+def segment_distance(x, y, x0, y0, x1, y1):
+    dx, dy = x1 - x0, y1 - y0
+    length_squared = dx * dx + dy * dy
+    t = 0 if length_squared == 0 else max(0, min(1, ((x - x0) * dx + (y - y0) * dy) / length_squared))
+    return math.hypot(x - (x0 + t * dx), y - (y0 + t * dy))
@@ -0,0 +1,217 @@
+#####################################################################################
+# On-disk cache of measured sweep points, keyed by engine, workload, node count,   #
+# repetitions, the engine's code version and a fingerprint of the machine           #
+#####################################################################################
+
+import ast
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+from importlib import metadata
+
+from interface import vp_engine_registry, vp_sweep_pool
+from interface.vp_engine_registry import MSTResult, get_engine
+from interface.vp_benchmark import TimingSummary
+
+
+# The CPU model name, platform.processor() is empty on most Linux systems so /proc/cpuinfo is read there.
+# Falls back to the architecture, the core count is fingerprinted alongside it
+def cpu_model():
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                field, _, value = line.partition(":")
+                if field.strip() in ("model name", "Hardware", "cpu model") and value.strip():
+                    return value.strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+# Identifies the environment a timing was measured in, results from another Python, CPU or NumPy are never reused
+@functools.lru_cache(maxsize=None)
+def environment_fingerprint():
+    versions = {}
+    for package in ("numpy", "matplotlib"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    environment = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": cpu_model(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+    return hashlib.sha256(json.dumps(environment, sort_keys=True).encode()).hexdigest()[:16]
+
+
+# The interface modules a module imports, read from its source so constants taken from config count too
+def interface_imports(module):
+    try:
+        tree = ast.parse(inspect.getsource(module))
+    except (OSError, TypeError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module == "interface":
+            names.update(f"interface.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            names.add(node.module)
+    return {sys.modules[name] for name in names if name.startswith("interface.") and name in sys.modules}
+
+
+# Identifies the code an engine's points were measured with, a hash of the source of its module, the sweep pool that
+# generates and measures its graphs, and every interface module either imports transitively. The registry is hashed
+# but not followed, it imports every engine and would tie each engine's points to all the others.
+# Editing any of them makes the engine's cached points unreachable
+@functools.lru_cache(maxsize=None)
+def engine_version(engine):
+    modules, waiting = set(), [inspect.getmodule(get_engine(engine)), vp_sweep_pool]
+    while waiting:
+        module = waiting.pop()
+        if module is None or module in modules:
+            continue
+        modules.add(module)
+        if module is not vp_engine_registry:
+            waiting.extend(interface_imports(module))
+    digest = hashlib.sha256()
+    for module in sorted(modules, key=lambda module: module.__name__):
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            digest.update(module.__name__.encode())    # No source to read, eg. an engine defined interactively
+    return digest.hexdigest()[:16]
+
+
+def result_to_record(result):
+    record = {
+        "engine": result.engine,
+        "tree_edges": sorted(result.tree_edges),
+        "total_weight": result.total_weight,
+        "counters": result.counters,
+        "timings": result.timings,
+        "num_edges": result.num_edges,
+        "timing_summary": None,
+    }
+    if result.timing_summary is not None:
+        record["timing_summary"] = {"samples": result.timing_summary.samples, "loops": result.timing_summary.loops}
+    return record
+
+
+def record_to_result(record):
+    result = MSTResult(record["engine"], {tuple(edge) for edge in record["tree_edges"]}, record["total_weight"], record["counters"], record["timings"], record["num_edges"])
+    if record["timing_summary"] is not None:
+        result.timing_summary = TimingSummary(record["timing_summary"]["samples"], record["timing_summary"]["loops"])
+    return result
+
+
+# Sweep points stored in a SQLite file. A connection is opened per call so the cache can be used from the sweep thread
+class SweepCache:
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes  # Least recently used points are evicted once the stored records exceed this
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as connection:
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(points)")]
+            if columns and "version" not in columns:
+                connection.execute("DROP TABLE points")    # Written before points carried an engine version, none can be trusted
+            connection.execute("""CREATE TABLE IF NOT EXISTS points (
+                engine TEXT, version TEXT, family TEXT, weights TEXT, seed INTEGER, repetitions INTEGER, n INTEGER, fingerprint TEXT,
+                record TEXT, size INTEGER, last_used REAL,
+                PRIMARY KEY (engine, version, family, weights, seed, repetitions, n, fingerprint))""")
+        self.invalidate_stale()    # Points from other code or machines are never hit, so they would only take space until evicted
+
+
+    # Commits on success and always closes, sqlite3's own context manager only commits
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+    # Cached results for whichever of the node counts have been measured before, as {n: MSTResult}
+    def lookup(self, engine, workload, repetitions, nodes):
+        key = self._key(engine, workload, repetitions)
+        found = {}
+        with self._connect() as connection:
+            for n in nodes:
+                row = connection.execute("SELECT record FROM points WHERE engine=? AND version=? AND family=? AND weights=? AND seed=? AND repetitions=? AND n=? AND fingerprint=?", key + (n, environment_fingerprint())).fetchone()
+                if row is not None:
+                    found[n] = record_to_result(json.loads(row[0]))
+            if found:
+                marks = [(time.time(),) + key + (n, environment_fingerprint()) for n in found]
+                connection.executemany("UPDATE points SET last_used=? WHERE engine=? AND version=? AND family=? AND weights=? AND seed=? AND repetitions=? AND n=? AND fingerprint=?", marks)
+        return found
+
+
+    def store(self, engine, workload, repetitions, n, result):
+        record = json.dumps(result_to_record(result))
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               self._key(engine, workload, repetitions) + (n, environment_fingerprint(), record, len(record), time.time()))
+            self._evict(connection)
+
+
+    # Removes points matching every given field, or every point if nothing is given
+    def invalidate(self, engine=None, family=None, fingerprint=None):
+        conditions, values = [], []
+        for column, value in (("engine", engine), ("family", family), ("fingerprint", fingerprint)):
+            if value is not None:
+                conditions.append(f"{column}=?")
+                values.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._connect() as connection:
+            return connection.execute(f"DELETE FROM points{where}", values).rowcount
+
+
+    # Removes points measured in any other environment or with other engine code, they can never be hit again from this one
+    def invalidate_stale(self):
+        with self._connect() as connection:
+            removed = connection.execute("DELETE FROM points WHERE fingerprint != ?", (environment_fingerprint(),)).rowcount
+            for (engine,) in connection.execute("SELECT DISTINCT engine FROM points").fetchall():
+                try:
+                    version = engine_version(engine)
+                except ValueError:
+                    version = None    # No longer registered, every point it left is stale
+                removed += connection.execute("DELETE FROM points WHERE engine=? AND version IS NOT ?", (engine, version)).rowcount
+            return removed
+
+
+    def size(self):
+        with self._connect() as connection:
+            return connection.execute("SELECT COALESCE(SUM(size), 0) FROM points").fetchone()[0]
+
+
+    def _evict(self, connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM points").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for rowid, size in connection.execute("SELECT rowid, size FROM points ORDER BY last_used").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM points WHERE rowid=?", (rowid,))
+            total -= size
+
+
+    # None (the unit weight complete graphs) is stored under the same key as the equivalent explicit workload
+    @staticmethod
+    def _key(engine, workload, repetitions):
+        workload = workload or {"family": "Complete", "weights": "Unit", "seed": 0}
+        return engine, engine_version(engine), workload["family"], workload["weights"], workload["seed"], -1 if repetitions is None else repetitions
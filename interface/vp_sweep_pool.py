@@ -0,0 +1,113 @@
+#####################################################################################
+# Process pool for running complexity analyser sweep points in parallel             #
+#####################################################################################
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import psutil
+
+from interface.config import SWEEP_POLL_INTERVAL, SWEEP_BYTES_PER_EDGE
+from interface.utils import generate_complete_graph
+from interface.vp_benchmark import measure_engine
+from interface.vp_engine_registry import supports_implicit_graph
+from interface.vp_workloads import generate_workload, estimated_edge_count
+from interface.vp_memory_profile import profile_engine_memory
+
+# Pool kept alive between sweeps so worker start-up and imports are only paid once
+_pool = None
+_pool_workers = None
+
+
+# Returns the warm pool, only starting new workers the first time or when a different worker count is asked for
+def sweep_pool(workers=None):
+    global _pool, _pool_workers
+    workers = workers or os.cpu_count() or 1
+    if _pool is None or _pool_workers != workers:
+        shutdown_sweep_pool()
+        # Spawn rather than fork, forking a process that is running Tk and a sweep thread is not safe
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_sweep_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _pool_workers = None
+
+
+# Node counts measured by a sweep, every step from 2 up to max_nodes. max_nodes itself is added unless the last step is close to it
+def sweep_node_counts(max_nodes, steps):
+    initial_range = list(range(2, max_nodes, steps))
+    if max_nodes - initial_range[-1] > steps / 2:
+        initial_range.append(max_nodes)
+    return initial_range
+
+
+# Runs in a worker, the graph is generated and the engine timed inside the worker so the timing only covers that process.
+# workload is None for the unit weight complete graphs, otherwise keyword arguments for generate_workload.
+# With memory=True the point is memory profiled instead of timed
+def measure_sweep_point(engine, n, repetitions=None, workload=None, memory=False):
+    implicit = supports_implicit_graph(engine)
+    generate = lambda size: generate_complete_graph(size, implicit) if workload is None else generate_workload(n=size, implicit=implicit, **workload)
+    if memory:
+        return n, profile_engine_memory(engine, generate, n)
+    return n, measure_engine(engine, generate(n), repetitions)
+
+
+# Every core, unless that many copies of the largest point's graph wouldn't fit in the memory that is free, then as many as do.
+# Engines that run on an ImplicitCompleteGraph only hold O(n) of it per worker
+def sweep_workers(engine, nodes, workload=None):
+    cores = os.cpu_count() or 1
+    n = max(nodes)
+    implicit = supports_implicit_graph(engine) and (workload is None or (workload["family"] == "Complete" and workload["weights"] in ("Unit", "Integer")))
+    graph_bytes = (n if implicit else estimated_edge_count(n, workload)) * SWEEP_BYTES_PER_EDGE
+    return max(1, min(cores, psutil.virtual_memory().available // max(graph_bytes, 1)))
+
+
+# Yields (n, result) from the pool as points finish, workers defaults to sweep_workers. Points are submitted largest first, the big graphs dominate the sweep so
+# starting them early keeps all workers busy to the end, and only one point per worker is in the pool at a time. Once cancel
+# is set nothing more is submitted and the generator stops within SWEEP_POLL_INTERVAL, only the points already running finish
+def parallel_sweep_points(engine, nodes, repetitions=None, workload=None, workers=None, memory=False, cancel=None):
+    pool = sweep_pool(workers or sweep_workers(engine, nodes, workload))
+    waiting = sorted(nodes, reverse=True)
+    running = set()
+    try:
+        while waiting or running:
+            while waiting and len(running) < _pool_workers:
+                running.add(pool.submit(measure_sweep_point, engine, waiting.pop(0), repetitions, workload, memory))
+            done, running = wait(running, timeout=SWEEP_POLL_INTERVAL / 1000, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                return
+            for future in done:
+                yield future.result()
+    finally:
+        for future in running:
+            future.cancel()    # Also reached when the caller stops early, a running point can't be cancelled and is left to finish
+
+
+# The sweep loop shared by the complexity analyser and the headless CLI, yields (n, result, cached) for every node count.
+# Points found in the cache come first and only the rest are measured, in the pool when parallel, each new point is then cached.
+# Memory profiles depend on what the process already holds, so they are always measured afresh and never cached.
+# Once cancel is set no further point is started and the generator stops
+def sweep_points(engine, nodes, repetitions=None, workload=None, parallel=False, workers=None, cache=None, memory=False, cancel=None):
+    if memory:
+        cache = None
+    cached = cache.lookup(engine, workload, repetitions, nodes) if cache is not None else {}
+    for n in nodes:
+        if n in cached:
+            yield n, cached[n], True
+    missing = [n for n in nodes if n not in cached]
+
+    if parallel and missing:
+        points = parallel_sweep_points(engine, missing, repetitions, workload, workers, memory, cancel)
+    else:
+        points = (measure_sweep_point(engine, n, repetitions, workload, memory) for n in missing if cancel is None or not cancel.is_set())
+    for n, result in points:
+        if cache is not None:
+            cache.store(engine, workload, repetitions, n, result)
+        yield n, result, False
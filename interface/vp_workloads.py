@@ -0,0 +1,202 @@
+#####################################################################################
+# Seeded benchmark workloads, graph families and weight distributions generated    #
+# with NumPy in O(V + E) time                                                        #
+#####################################################################################
+
+import math
+import numpy as np
+
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph
+from interface.vp_integer_weight_mst import MAX_WEIGHT_BUCKETS
+from interface.utils import generate_complete_graph, generate_node_identifier
+
+DEFAULT_AVERAGE_DEGREE = 8  # Target mean degree for the sparse families
+MAX_INTEGER_WEIGHT = 10  # Integer weights are drawn from 1..MAX_INTEGER_WEIGHT, the same range the visualiser uses
+
+
+# Random generator for one workload, the same (seed, n) always gives the same graph whichever order points are generated in
+def workload_rng(seed, n):
+    return np.random.default_rng([seed, n])
+
+
+def _identifiers(n):
+    return [generate_node_identifier(i) for i in range(n)]
+
+
+# Removes self-loops and repeated vertex pairs, keeping each pair oriented with the lower index first
+def _simple_edges(starts, ends, n):
+    low, high = np.minimum(starts, ends), np.maximum(starts, ends)
+    keys = np.unique(low[low != high] * n + high[low != high])
+    return keys // n, keys % n
+
+
+#                    #
+# GRAPH FAMILIES     #
+#                    #
+
+
+def complete_edges(n, rng):
+    return np.triu_indices(n, k=1)
+
+
+# G(n, p) with p = density, the edge count is drawn from the binomial and that many distinct pairs are sampled
+def erdos_renyi_edges(n, rng, density=None):
+    pairs = n * (n - 1) // 2
+    density = DEFAULT_AVERAGE_DEGREE / max(n - 1, 1) if density is None else density
+    m = int(rng.binomial(pairs, min(density, 1.0)))
+
+    # Sample pair ids with replacement and top up after removing repeats, expected O(m) while density is well below 1
+    keys = np.unique(rng.integers(0, pairs, size=m))
+    while keys.size < m:
+        keys = np.unique(np.concatenate((keys, rng.integers(0, pairs, size=m - keys.size))))
+    keys = rng.permutation(keys)[:m]
+
+    # Pair id k -> (i, j) with i < j in row-major upper triangle order
+    i = (n - 2 - np.floor(np.sqrt(-8 * keys + 4 * n * (n - 1) - 7) / 2 - 0.5)).astype(np.int64)
+    j = keys + i + 1 - pairs + (n - i) * (n - i - 1) // 2
+    return i, j
+
+
+# Points uniform in the unit square joined when closer than the radius that gives the target average degree.
+# Points are bucketed into cells one radius wide so only neighbouring cells are compared
+def random_geometric_edges(n, rng, average_degree=DEFAULT_AVERAGE_DEGREE):
+    radius = min(math.sqrt(average_degree / (math.pi * n)), 1.0)
+    points = rng.random((n, 2))
+    cells_per_side = max(int(1 / radius), 1)
+    cell_xy = np.minimum((points / radius).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 0] * cells_per_side + cell_xy[:, 1]
+
+    order = np.argsort(cell, kind='stable')
+    counts = np.bincount(cell, minlength=cells_per_side * cells_per_side)
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    starts, ends = [], []
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):   # Half of the neighbourhood, so each cell pair is visited once
+        nx, ny = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+        valid = np.flatnonzero((nx >= 0) & (nx < cells_per_side) & (ny >= 0) & (ny < cells_per_side))
+        neighbour_cell = nx[valid] * cells_per_side + ny[valid]
+        candidates = counts[neighbour_cell]
+        source = np.repeat(valid, candidates)
+        within = np.arange(candidates.sum()) - np.repeat(np.cumsum(candidates) - candidates, candidates)
+        target = order[np.repeat(first[neighbour_cell], candidates) + within]
+        keep = (source < target) if (dx, dy) == (0, 0) else np.ones(source.size, dtype=bool)
+        keep &= np.sum((points[source] - points[target]) ** 2, axis=1) <= radius * radius
+        starts.append(source[keep])
+        ends.append(target[keep])
+
+    return _simple_edges(np.concatenate(starts), np.concatenate(ends), n)
+
+
+# Nearest-neighbour grid as close to square as possible, vertex v sits at row v // width and column v % width
+def grid_edges(n, rng):
+    width = max(math.ceil(math.sqrt(n)), 1)
+    v = np.arange(n)
+    right = v[(v % width < width - 1) & (v + 1 < n)]
+    down = v[v + width < n]
+    return np.concatenate((right, down)), np.concatenate((right + 1, down + width))
+
+
+# Random recursive tree (vertex v attaches to a uniformly chosen earlier vertex) plus extra random edges, always connected
+def tree_plus_edges(n, rng, extra_edges=None):
+    children = np.arange(1, n)
+    parents = (rng.random(n - 1) * children).astype(np.int64)
+    extra = n if extra_edges is None else extra_edges
+    extra_starts = rng.integers(0, n, size=extra)
+    extra_ends = rng.integers(0, n, size=extra)
+    return _simple_edges(np.concatenate((parents, extra_starts)), np.concatenate((children, extra_ends)), n)
+
+
+# Chung-Lu graph with power-law expected degrees (exponent gamma), endpoints are drawn in proportion to vertex weight
+def power_law_edges(n, rng, gamma=2.5, average_degree=DEFAULT_AVERAGE_DEGREE):
+    vertex_weight = np.arange(1, n + 1, dtype=np.float64) ** (-1 / (gamma - 1))
+    probabilities = vertex_weight / vertex_weight.sum()
+    m = int(n * average_degree / 2)
+    starts = rng.choice(n, size=m, p=probabilities)
+    ends = rng.choice(n, size=m, p=probabilities)
+    return _simple_edges(starts, ends, n)
+
+
+GRAPH_FAMILIES = {
+    "Complete": complete_edges,
+    "Erdős–Rényi": erdos_renyi_edges,
+    "Random geometric": random_geometric_edges,
+    "Grid": grid_edges,
+    "Tree + extra edges": tree_plus_edges,
+    "Power-law": power_law_edges,
+}
+
+
+#                        #
+# WEIGHT DISTRIBUTIONS   #
+#                        #
+
+
+def unit_weights(starts, ends, rng):
+    return np.ones(starts.size, dtype=np.int64)
+
+
+# Floats in (0, 1], ties have probability zero
+def uniform_weights(starts, ends, rng):
+    return 1.0 - rng.random(starts.size)
+
+
+def integer_weights(starts, ends, rng):
+    return rng.integers(1, MAX_INTEGER_WEIGHT + 1, size=starts.size)
+
+
+# Distinct integers that fall as the higher endpoint index rises. Prim's from vertex 0 then finds every later edge
+# lighter than the key already held, so each relaxation is a decrease-key. The weights are spread over MAX_WEIGHT_BUCKETS + m
+# values so the bucket engines fall back to their general versions at every size
+def adversarial_weights(starts, ends, rng):
+    low, high = np.minimum(starts, ends), np.maximum(starts, ends)
+    order = np.lexsort((low, high))
+    weights = np.empty(starts.size, dtype=np.int64)
+    # Steps of at least 1, so flooring keeps the weights distinct
+    weights[order] = np.floor(np.linspace(MAX_WEIGHT_BUCKETS + starts.size, 1, starts.size))
+    return weights
+
+
+WEIGHT_DISTRIBUTIONS = {
+    "Unit": unit_weights,
+    "Uniform": uniform_weights,
+    "Integer": integer_weights,
+    "Adversarial": adversarial_weights,
+}
+
+
+# Describes the graphs a workload generates for chart titles and reports, None is the unit weight complete graphs
+def describe_workload(workload):
+    if workload is None:
+        return "complete graphs"
+    return f"{workload['family']} graphs with {workload['weights'].lower()} weights"
+
+
+# Roughly how many edges a workload has at n vertices without generating it, the sparse families aim for DEFAULT_AVERAGE_DEGREE
+def estimated_edge_count(n, workload=None):
+    pairs = n * (n - 1) // 2
+    if workload is None or workload["family"] == "Complete":
+        return pairs
+    return min(pairs, n * DEFAULT_AVERAGE_DEGREE // 2)
+
+
+# Builds one workload graph. Complete graphs with unit or integer weights are returned as an ImplicitCompleteGraph when
+# implicit is True, the unit weight complete graph is otherwise the same (V, E, W) triple the analyser always used
+def generate_workload(family, n, weights="Unit", seed=0, implicit=False):
+    if family not in GRAPH_FAMILIES:
+        raise ValueError(f"Unknown graph family {family!r}. Choose one of: {', '.join(GRAPH_FAMILIES)}")
+    if weights not in WEIGHT_DISTRIBUTIONS:
+        raise ValueError(f"Unknown weight distribution {weights!r}. Choose one of: {', '.join(WEIGHT_DISTRIBUTIONS)}")
+    if n < 2:
+        raise ValueError("Number of nodes must be at least 2 to generate a graph.")
+
+    if family == "Complete" and weights == "Unit":
+        return generate_complete_graph(n, implicit)
+    if family == "Complete" and weights == "Integer":
+        # Weights come from the implicit graph's seeded hash in both forms, so the explicit graph has the same edges and weights
+        graph = ImplicitCompleteGraph(_identifiers(n), seed=seed * 1000003 + n, max_weight=MAX_INTEGER_WEIGHT)
+        return graph if implicit else graph.to_indexed()
+
+    rng = workload_rng(seed, n)
+    starts, ends = GRAPH_FAMILIES[family](n, rng)
+    edge_weights = WEIGHT_DISTRIBUTIONS[weights](starts, ends, rng)
+    return IndexedGraph.from_index_arrays(_identifiers(n), starts, ends, edge_weights)
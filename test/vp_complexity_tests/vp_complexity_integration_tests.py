@@ -6,12 +6,18 @@ from interface.vp_complexity import ComplexityAnalyser
 from interface.utils import *
 import json
 import os
+import tempfile
 from PIL import Image
 
 class TestComplexityAnalyser(unittest.TestCase):
     def setUp(self):
-        self.analyser = ComplexityAnalyser()
+        self.cache_directory = tempfile.TemporaryDirectory()   # Sweeps cache into a throwaway file rather than the user's cache
+        self.cache_path = os.path.join(self.cache_directory.name, "sweeps.sqlite3")
+        self.analyser = ComplexityAnalyser(sweep_cache_path=self.cache_path)
         print("###########COMPLEXITY ANALYSER INTEGRATION TESTS###########\n")        
+
+    def tearDown(self):
+        self.cache_directory.cleanup()
     
     # CA User Story 1: Gathering comparison related metrics for Prim’s algorithm
     @patch('interface.vp_complexity.ComplexityAnalyser.clear_graph')
@@ -60,7 +66,7 @@ class TestComplexityAnalyser(unittest.TestCase):
     def test_ca_to_main_menu(self, mock_main_menu_class):                           # mock_main_menu_class is a mock of the MainMenu class
         # Mocking tkinter main loop to prevent GUI from opening
         with patch('tkinter.Tk.mainloop', new=MagicMock()):
-            self.app = ComplexityAnalyser()
+            self.app = ComplexityAnalyser(sweep_cache_path=self.cache_path)
         
         main_menu_instance = mock_main_menu_class.return_value
         
@@ -1,12 +1,17 @@
 import unittest
-from unittest.mock import MagicMock, mock_open, patch, call, create_autospec
+from unittest.mock import MagicMock, mock_open, patch, call, create_autospec, ANY
 from interface.vp_complexity import ComplexityAnalyser, Node, Edge
 from interface.utils import *
 from tkinter import Label, Frame
 import itertools
+import queue
+import threading
+import os
+import tempfile
 from interface.vp_prims_algorithm import prim_minimum_spanning_tree
+from interface.vp_sweep_pool import shutdown_sweep_pool, sweep_pool, parallel_sweep_points, measure_sweep_point
+from interface.vp_benchmark import TimingSummary
 import time
-import interface.config as config
 import psutil
 from matplotlib.testing.decorators import image_comparison
 import matplotlib.pyplot as plt
@@ -15,7 +20,9 @@ class TestComplexityAnalyser(unittest.TestCase):
     print("###########COMPLEXITY ANALYSER UNIT TESTS###########\n") 
 
     def setUp(self) -> None:
-        self.analyser = ComplexityAnalyser()
+        # Sweeps cache into a throwaway file rather than the user's cache
+        self.cache_directory = tempfile.TemporaryDirectory()
+        self.analyser = ComplexityAnalyser(sweep_cache_path=os.path.join(self.cache_directory.name, "sweeps.sqlite3"))
         self.analyser.comp_slider = MagicMock()
         self.analyser.comp_steps_slider = MagicMock()
         self.analyser.exec_slider = MagicMock()
@@ -24,6 +31,9 @@ class TestComplexityAnalyser(unittest.TestCase):
         # Mocking UI components that will be used or manipulated
         self.analyser.right_frame = MagicMock()
         self.analyser.lower_left_frame = MagicMock()
+
+    def tearDown(self) -> None:
+        self.cache_directory.cleanup()
         
 
     # Test the instantiation of the ComplexityAnalyser class
@@ -48,8 +58,8 @@ class TestComplexityAnalyser(unittest.TestCase):
         self.analyser.display_complexity_metrics = MagicMock()
         self.analyser.visualize_complexity = MagicMock()
 
-        # Mock the return value of prim_minimum_spanning_tree to a fixed value to simplify test
-        with patch('interface.vp_complexity.prim_minimum_spanning_tree', return_value=([], 10200)):
+        # Mock the registered Prim's engine to return a fixed value to simplify test
+        with patch.dict('interface.vp_engine_registry.MST_ENGINES', {"Prim's (array)": MagicMock(return_value=([], 10200))}):
             # Mock time.perf_counter to simulate a fixed execution time of 0.0
             with patch('time.perf_counter', return_value=0.0):  
                 self.analyser.analyse("comparisons")
@@ -62,8 +72,8 @@ class TestComplexityAnalyser(unittest.TestCase):
                 self.analyser.visualize_complexity.assert_called()
 
                 self.assertEqual(self.analyser.generate_complete_graph.call_count, 11, "generate_complete_graph should be called 11 times based on slider settings")
-                self.analyser.display_complexity_metrics.assert_called_with(100, 4950, [], 0.0, 10200, self.analyser.processor)
-                self.analyser.visualize_complexity.assert_called_with([2, 12, 22, 32, 42, 52, 62, 72, 82, 92, 100], [10200] * 11)   # 11 comparison metrics generated since 11 calls to generate_complete_graph with subsequent calls to prim_minimum_spanning_tree
+                self.analyser.display_complexity_metrics.assert_called_with(100, 4950, set(), 0.0, 10200, self.analyser.processor)
+                self.analyser.visualize_complexity.assert_called_with([2, 12, 22, 32, 42, 52, 62, 72, 82, 92, 100], [10200] * 11, None)   # 11 comparison metrics generated since 11 calls to generate_complete_graph with subsequent calls to prim_minimum_spanning_tree
 
 
 
@@ -80,8 +90,8 @@ class TestComplexityAnalyser(unittest.TestCase):
         self.analyser.display_complexity_metrics = MagicMock()
         self.analyser.visualize_execution_time = MagicMock()
 
-        # Mock the return value of prim_minimum_spanning_tree to a fixed value to simplify test
-        with patch('interface.vp_complexity.prim_minimum_spanning_tree', return_value=([], 10200)):
+        # Mock the registered Prim's engine to return a fixed value to simplify test
+        with patch.dict('interface.vp_engine_registry.MST_ENGINES', {"Prim's (array)": MagicMock(return_value=([], 10200))}):
             # Mock time.perf_counter to simulate a fixed execution time of 0.0
             with patch('time.perf_counter', return_value=0.0):  
                 self.analyser.analyse("execution_time")
@@ -94,8 +104,8 @@ class TestComplexityAnalyser(unittest.TestCase):
                 self.analyser. visualize_execution_time.assert_called()
 
                 self.assertEqual(self.analyser.generate_complete_graph.call_count, 11, "generate_complete_graph should be called 11 times based on slider settings")
-                self.analyser.display_complexity_metrics.assert_called_with(100, 4950, [], 0.0, 10200, self.analyser.processor)
-                self.analyser.visualize_execution_time.assert_called_with([2, 12, 22, 32, 42, 52, 62, 72, 82, 92, 100], [0.0] * 11)   # 11 comparison metrics generated since 11 calls to generate_complete_graph with subsequent calls to prim_minimum_spanning_tree
+                self.analyser.display_complexity_metrics.assert_called_with(100, 4950, set(), 0.0, 10200, self.analyser.processor)
+                self.analyser.visualize_execution_time.assert_called_with([2, 12, 22, 32, 42, 52, 62, 72, 82, 92, 100], [0.0] * 11, ANY, None)   # 11 comparison metrics generated since 11 calls to generate_complete_graph with subsequent calls to prim_minimum_spanning_tree
     
 
 
@@ -106,6 +116,102 @@ class TestComplexityAnalyser(unittest.TestCase):
     
 
 
+    # Test the sweep thread streams one result per point through the queue and stops when cancelled
+    def test_run_sweep_streams_and_cancels(self):
+        results_queue = queue.Queue()
+        self.analyser.run_sweep("Prim's (array)", [2, 5, 8], results_queue, threading.Event())
+
+        messages = [results_queue.get_nowait() for _ in range(4)]
+        self.assertEqual([kind for kind, _ in messages], ["point", "point", "point", "done"])
+        self.assertEqual([payload[0] for _, payload in messages[:3]], [2, 5, 8])
+        self.assertEqual(messages[2][1][1].num_comparisons, 8 * 7 - 7)   # 2m - deg(start) on a complete graph
+
+        cancel = threading.Event()
+        cancel.set()
+        self.analyser.run_sweep("Prim's (array)", [2, 5, 8], results_queue, cancel)
+        self.assertEqual(results_queue.get_nowait(), ("cancelled", None))
+        self.assertTrue(results_queue.empty())
+
+
+
+    # Test the parallel sweep measures every point in the process pool, largest first, with the same counts as a serial sweep
+    def test_run_sweep_parallel(self):
+        results_queue = queue.Queue()
+        self.analyser.run_sweep("Prim's (array)", [2, 5, 8], results_queue, threading.Event(), parallel=True)
+        shutdown_sweep_pool()
+
+        messages = [results_queue.get_nowait() for _ in range(4)]
+        self.assertEqual(messages[-1], ("done", None))
+        points = {n: result for _, (n, result) in messages[:3]}
+        self.assertEqual(sorted(points), [2, 5, 8])
+        self.assertEqual(points[8].num_comparisons, 8 * 7 - 7)
+        self.assertGreater(points[8].timings["mst"], 0)
+
+
+
+    # Test cancelling a parallel sweep stops submitting points, only one point per worker ever reaches the pool
+    def test_parallel_sweep_points_cancel(self):
+        cancel = threading.Event()
+        cancel.set()
+        pool = sweep_pool(1)
+        with patch.object(pool, 'submit', wraps=pool.submit) as submit:
+            self.assertEqual(list(parallel_sweep_points("Prim's (array)", [2, 5, 8], workers=1, cancel=cancel)), [])
+        shutdown_sweep_pool()
+
+        submit.assert_called_once()
+        self.assertEqual(submit.call_args[0][2], 8)    # Largest first
+
+
+
+    # Test a repeated sweep takes its points from the cache and only measures the points it has not seen
+    def test_run_sweep_uses_cache(self):
+        cache = self.analyser.sweep_cache
+        self.analyser.run_sweep("Prim's (array)", [2, 5], queue.Queue(), threading.Event(), cache=cache)
+
+        results_queue = queue.Queue()
+        with patch('interface.vp_sweep_pool.measure_sweep_point', wraps=measure_sweep_point) as measure_point:
+            self.analyser.run_sweep("Prim's (array)", [2, 5, 8], results_queue, threading.Event(), cache=cache)
+
+        measure_point.assert_called_once_with("Prim's (array)", 8, None, None, False)
+        messages = [results_queue.get_nowait() for _ in range(4)]
+        self.assertEqual([payload[0] for _, payload in messages[:3]], [2, 5, 8])
+        self.assertEqual(messages[1][1][1].num_comparisons, 5 * 4 - 4)
+        self.assertEqual(sorted(cache.lookup("Prim's (array)", None, None, [2, 5, 8])), [2, 5, 8])
+
+
+
+    # Test a memory sweep profiles every point, ends with the representation comparison and leaves the cache alone
+    def test_run_sweep_memory(self):
+        results_queue = queue.Queue()
+        self.analyser.run_sweep("Kruskal's (union-find)", [2, 20, 40], results_queue, threading.Event(), cache=self.analyser.sweep_cache, memory=True)
+
+        messages = [results_queue.get_nowait() for _ in range(5)]
+        self.assertEqual([kind for kind, _ in messages], ["point", "point", "point", "representations", "done"])
+        self.assertTrue(all(payload[1].memory_profile.generation_peak > 0 for _, payload in messages[:3]))
+        self.assertIn("IndexedGraph (CSR)", messages[3][1])
+        self.assertEqual(self.analyser.sweep_cache.size(), 0)
+
+
+
+    # Test polling hands the streamed results to show_results once the sweep thread finishes
+    def test_start_analysis_background_sweep(self):
+        self.analyser.comp_slider.get.return_value = 30
+        self.analyser.comp_steps_slider.get.return_value = 10
+        self.analyser.show_results = MagicMock()
+        self.analyser.after = MagicMock()
+
+        self.analyser.start_analysis("comparisons")
+        self.analyser.sweep_thread.join()
+        self.analyser.poll_sweep()
+
+        self.analyser.show_results.assert_called_once()
+        analysis_type, max_nodes, nodes, results = self.analyser.show_results.call_args[0]
+        self.assertEqual((analysis_type, max_nodes, nodes), ("comparisons", 30, [2, 12, 22, 30]))
+        self.assertEqual(len(results), 4)
+        self.assertEqual(self.analyser.comp_tab_analyse_button.cget('state'), 'normal')
+
+
+
     # Test clear_graph method
     def test_clear_graph(self):
         self.analyser.right_frame = MagicMock(spec=Frame)
@@ -229,7 +335,7 @@ class TestComplexityAnalyser(unittest.TestCase):
             call().pack(side='top', fill='x'),
             call(self.analyser.lower_left_frame, text=f"Number of edges in MST of max node graph: {mst_edges}", font=font, anchor='center'),
             call().pack(side='top', fill='x'),
-            call(self.analyser.lower_left_frame, text=f"Average Prim's execution time: {execution_time:.6f} seconds", font=font, anchor='center'),
+            call(self.analyser.lower_left_frame, text=f"Median execution time on max node graph: {execution_time:.6f} seconds", font=font, anchor='center'),
             call().pack(side='top', fill='x'),
             call(self.analyser.lower_left_frame, text=f"Number of comparisons: {num_comparisons}", font=font, anchor='center'),
             call().pack(side='top', fill='x'),
@@ -239,6 +345,25 @@ class TestComplexityAnalyser(unittest.TestCase):
     
 
 
+    # Test the display_timing_metrics method shows the confidence interval and spread of the benchmarked max node graph
+    @patch('interface.vp_complexity.ctk.CTkLabel')
+    def test_display_timing_metrics(self, mock_ctklabel):
+        summary = TimingSummary([0.004, 0.005, 0.006, 0.005, 0.007], 1)
+
+        self.analyser.display_timing_metrics(summary)
+
+        font = ('Helvetica', 14)
+        expected_calls = [
+            call(self.analyser.lower_left_frame, text=f"95% confidence interval for the median: {summary.ci_low:.6f} - {summary.ci_high:.6f} seconds", font=font, anchor='center'),
+            call().pack(side='top', fill='x'),
+            call(self.analyser.lower_left_frame, text=f"Interquartile range: {summary.iqr:.6f} seconds over 5 repetitions", font=font, anchor='center'),
+            call().pack(side='top', fill='x'),
+        ]
+
+        mock_ctklabel.assert_has_calls(expected_calls, any_order=False)
+
+
+
     # Test Prim's returns correct MST
     def test_mst_correctness(self):
         # Setup a small graph with known MST
@@ -0,0 +1,685 @@
+import unittest
+import os
+import tempfile
+import csv
+import json
+import subprocess
+import sys
+import io
+import contextlib
+import sqlite3
+import threading
+import inspect
+from unittest import mock
+from interface.vp_graph_core import IndexedGraph, ImplicitCompleteGraph, as_indexed_graph
+from interface.vp_prims_algorithm import prim_minimum_spanning_tree
+from interface.vp_priority_q_prims import prim_minimum_spanning_tree_with_priority_queue, IndexedMinHeap
+from interface.vp_dense_prims import prim_minimum_spanning_tree_dense
+from interface.vp_kruskal import kruskal_minimum_spanning_tree, DisjointSet
+from interface.vp_boruvka import boruvka_minimum_spanning_tree
+from interface.vp_integer_weight_mst import prim_minimum_spanning_tree_bucket_queue, kruskal_minimum_spanning_tree_counting_sort, small_integer_weight_range
+from interface.vp_engine_registry import MST_ENGINES, engine_names, run_engine, register_engine
+from interface.vp_benchmark import benchmark, benchmark_engine, median_confidence_interval
+from interface.vp_workloads import generate_workload, estimated_edge_count, GRAPH_FAMILIES, WEIGHT_DISTRIBUTIONS
+from interface.vp_sweep_pool import sweep_workers, sweep_points
+from interface.config import SWEEP_BYTES_PER_EDGE
+from interface.vp_sweep_cache import SweepCache, engine_version, cpu_model
+from interface.vp_benchmark_cli import main as benchmark_cli
+from interface.vp_memory_profile import profile_engine_memory, representation_bytes_per_edge
+from interface.utils import generate_complete_graph
+from interface.vp_complexity_fit import fit_complexity, loglog_exponent
+from interface.vp_language_benchmarks import LANGUAGE_IMPLEMENTATIONS, parse_timings, timing_rows, summarise, run_implementation, run_registry_engine
+import numpy as np
+from interface.utils import is_graph_connected, connected_component_labels, group_components
+
+class TestMSTEngines(unittest.TestCase):
+    print("###########MST ENGINE UNIT TESTS###########\n")
+
+    def setUp(self):
+        # Small graph with a unique MST, shared by the engine tests
+        self.V = ['A', 'B', 'C', 'D', 'E']
+        self.E = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'A'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('D', 'E')]
+        self.W = {('A', 'B'): 1, ('B', 'C'): 2, ('C', 'D'): 3, ('D', 'A'): 4, ('A', 'C'): 5, ('B', 'D'): 6, ('B', 'E'): 7, ('D', 'E'): 8}
+        self.expected_mst_edges = {('A', 'B'), ('B', 'C'), ('C', 'D'), ('B', 'E')}
+
+
+    #                    #
+    # GRAPH CORE TESTS   #
+    #                    #
+
+
+    # Test the CSR arrays hold every edge once from each endpoint
+    def test_indexed_graph_adjacency(self):
+        graph = IndexedGraph.from_vew((self.V, self.E, self.W))
+
+        self.assertEqual(graph.num_vertices, 5)
+        self.assertEqual(graph.num_edges, 8)
+        self.assertEqual(graph.offsets[-1], 16)
+        self.assertEqual(graph.identifiers[graph.index['C']], 'C')
+
+        # Neighbours of B are A, C, D and E with the weights from W
+        b = graph.index['B']
+        neighbours = {graph.identifiers[v]: weight for v, weight, _ in graph.neighbors(b)}
+        self.assertEqual(neighbours, {'A': 1, 'C': 2, 'D': 6, 'E': 7})
+        self.assertEqual(graph.degree(b), 4)
+
+        # Edge ids map back to the original edge tuples
+        for v, weight, edge_id in graph.neighbors(b):
+            self.assertEqual(self.W[graph.edges[edge_id]], weight)
+
+
+    # Test building the indexed graph from imported JSON data
+    def test_indexed_graph_from_json(self):
+        data = {"nodes": [{"id": "A", "x": 10, "y": 10}, {"id": "B", "x": 20, "y": 20}],
+                "edges": [{"start": "A", "end": "B", "weight": 3}]}
+        graph = IndexedGraph.from_json(data)
+
+        self.assertEqual(graph.identifiers, ['A', 'B'])
+        self.assertEqual(list(graph.neighbors(0)), [(1, 3, 0)])
+        self.assertIs(as_indexed_graph(graph), graph)
+
+
+    # Test an edge to a vertex outside V is rejected
+    def test_indexed_graph_unknown_vertex(self):
+        with self.assertRaises(ValueError):
+            IndexedGraph(['A', 'B'], [('A', 'Z')], [1])
+
+
+    # Test the implicit complete graph numbers and orients edges like an explicit complete graph without storing them
+    def test_implicit_complete_graph(self):
+        graph = ImplicitCompleteGraph(['A', 'B', 'C', 'D'], seed=3)
+        explicit = as_indexed_graph(graph)
+
+        self.assertEqual(graph.num_edges, 6)
+        self.assertEqual(explicit.edges, [('A', 'B'), ('A', 'C'), ('A', 'D'), ('B', 'C'), ('B', 'D'), ('C', 'D')])
+        for i in range(4):
+            for j, weight, edge_id in graph.neighbors(i):
+                self.assertEqual(explicit.edges[edge_id], graph.edge(i, j))
+                self.assertEqual(explicit.edge_weights[edge_id], weight)
+                self.assertEqual(graph.row(i)[j], weight)
+        self.assertEqual(graph.row(2)[2], float("inf"))
+        self.assertEqual(graph.weight_between(0, 3), ImplicitCompleteGraph(['A', 'B', 'C', 'D'], seed=3).edge_weight('D', 'A'))   # Seeded weights are repeatable
+
+
+    # Test Prim's runs on the implicit graph with the same MST weight and comparison count as on the materialised graph
+    def test_prims_on_implicit_graph(self):
+        graph = ImplicitCompleteGraph(range(30), weight=lambda i, j: (i * 7 + j * 13) % 11 + 1)
+        explicit = as_indexed_graph(graph)
+        weights = dict(zip(explicit.edges, explicit.edge_weights))
+
+        for engine in (prim_minimum_spanning_tree, prim_minimum_spanning_tree_dense):
+            implicit_mst_edges, implicit_comparisons = engine(graph)
+            explicit_mst_edges, explicit_comparisons = engine(explicit)
+            self.assertEqual(len(implicit_mst_edges), 29)
+            self.assertEqual(sum(map(weights.__getitem__, implicit_mst_edges)), sum(map(weights.__getitem__, explicit_mst_edges)))
+            self.assertEqual(implicit_comparisons, explicit_comparisons)
+
+        # Array Prim's walks each row in CSR neighbour order, so ties between equal weights pick the same edges
+        for graph in (graph, ImplicitCompleteGraph(range(10), seed=4, max_weight=3), ImplicitCompleteGraph(range(40), seed=1, max_weight=2)):
+            self.assertEqual(prim_minimum_spanning_tree(graph), prim_minimum_spanning_tree(as_indexed_graph(graph)))
+
+
+    # Test is_graph_connected accepts both the (V, E) pair and an IndexedGraph
+    def test_graph_connectivity(self):
+        self.assertTrue(is_graph_connected(set(self.V), set(self.E)))
+        self.assertFalse(is_graph_connected({'A', 'B', 'C', 'D'}, {('A', 'B'), ('C', 'D')}))
+        self.assertTrue(is_graph_connected(IndexedGraph.from_vew((self.V, self.E, self.W))))
+
+
+    # Test component labels identify which vertices are disconnected from each other
+    def test_connected_component_labels(self):
+        labels = connected_component_labels(['A', 'B', 'C', 'D', 'E'], [('A', 'B'), ('C', 'D'), ('D', 'B')])
+
+        self.assertEqual(labels, {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'E': 1})
+        self.assertEqual(group_components(labels), [['A', 'B', 'C', 'D'], ['E']])
+        self.assertFalse(is_graph_connected(set(), set()))
+
+
+    # Test a long path is handled without hitting the recursion limit
+    def test_connectivity_long_path(self):
+        V = list(range(20000))
+        E = [(v, v + 1) for v in range(len(V) - 1)]
+
+        self.assertTrue(is_graph_connected(V, E))
+
+
+    #                    #
+    # PRIM'S TESTS       #
+    #                    #
+
+
+    # Test array Prim's returns the correct MST from both graph forms with the same comparison count
+    def test_prims_on_indexed_graph(self):
+        mst_edges, num_comparisons = prim_minimum_spanning_tree((self.V, self.E, self.W))
+        indexed_mst_edges, indexed_comparisons = prim_minimum_spanning_tree(IndexedGraph.from_vew((self.V, self.E, self.W)))
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+        self.assertEqual(indexed_mst_edges, self.expected_mst_edges)
+        self.assertEqual(num_comparisons, indexed_comparisons)
+
+
+    # Test priority queue Prim's returns the correct MST, the parent array records the edge that set L(w)
+    def test_priority_queue_prims_correctness(self):
+        mst_edges, num_comparisons = prim_minimum_spanning_tree_with_priority_queue((self.V, self.E, self.W))
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+        self.assertEqual(num_comparisons, len(self.E) + 6)  # Each edge is compared once from whichever endpoint leaves the heap first, plus 6 heap sift comparisons
+
+
+    # Test priority queue Prim's starts a new tree from each unreached vertex, giving a spanning forest of a disconnected graph
+    def test_priority_queue_prims_disconnected_graph(self):
+        mst_edges, _ = prim_minimum_spanning_tree_with_priority_queue((['A', 'B', 'C', 'D', 'E'], [('A', 'B'), ('C', 'D'), ('D', 'E')], {('A', 'B'): 1, ('C', 'D'): 2, ('D', 'E'): 3}))
+
+        self.assertEqual(mst_edges, {('A', 'B'), ('C', 'D'), ('D', 'E')})
+
+
+    # Test the heap and array engines agree on total weight when the popped vertex isn't adjacent to the previous one
+    def test_priority_queue_prims_matches_array_prims(self):
+        V = ['A', 'B', 'C', 'D']
+        E = [('A', 'B'), ('A', 'C'), ('C', 'D'), ('B', 'D')]
+        W = {('A', 'B'): 1, ('A', 'C'): 2, ('C', 'D'): 1, ('B', 'D'): 9}
+
+        heap_mst_edges, _ = prim_minimum_spanning_tree_with_priority_queue((V, E, W))
+        array_mst_edges, _ = prim_minimum_spanning_tree((V, E, W))
+
+        self.assertEqual(heap_mst_edges, {('A', 'B'), ('A', 'C'), ('C', 'D')})
+        self.assertEqual(sum(W[e] for e in heap_mst_edges), sum(W[e] for e in array_mst_edges))
+
+
+    # Test the indexed heap pops in key order after decrease_key
+    def test_indexed_min_heap_decrease_key(self):
+        heap = IndexedMinHeap(4)
+        for v, key in enumerate([5, 3, 8, 6]):
+            heap.push(v, key)
+        heap.decrease_key(2, 1)
+
+        self.assertIn(2, heap)
+        self.assertEqual([heap.pop() for _ in range(len(heap))], [(1, 2), (3, 1), (5, 0), (6, 3)])
+        self.assertNotIn(2, heap)
+
+
+    # Test dense NumPy Prim's returns the correct MST, with edges oriented as given in E
+    def test_dense_prims_correctness(self):
+        mst_edges, num_comparisons = prim_minimum_spanning_tree_dense((self.V, self.E, self.W))
+        indexed_mst_edges, _ = prim_minimum_spanning_tree_dense(IndexedGraph.from_vew((self.V, self.E, self.W)))
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+        self.assertEqual(indexed_mst_edges, self.expected_mst_edges)
+        self.assertEqual(num_comparisons, 13)  # One comparison per neighbour of each vertex added after A: B 4 + C 3 + D 4 + E 2
+        self.assertEqual(num_comparisons, prim_minimum_spanning_tree((self.V, self.E, self.W))[1])  # Counted the same way as the array engine
+
+
+    # Test dense Prim's skips unreachable vertices instead of adding a bogus edge
+    def test_dense_prims_disconnected_graph(self):
+        mst_edges, _ = prim_minimum_spanning_tree_dense((['A', 'B', 'C', 'D'], [('A', 'B'), ('C', 'D')], {('A', 'B'): 1, ('C', 'D'): 2}))
+
+        self.assertEqual(mst_edges, {('A', 'B'), ('C', 'D')})
+
+
+    #                    #
+    # KRUSKAL'S TESTS    #
+    #                    #
+
+
+    # Test Kruskal's returns the correct MST from both graph forms
+    def test_kruskal_correctness(self):
+        mst_edges, num_comparisons = kruskal_minimum_spanning_tree((self.V, self.E, self.W))
+        indexed_mst_edges, _ = kruskal_minimum_spanning_tree(IndexedGraph.from_vew((self.V, self.E, self.W)))
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+        self.assertEqual(indexed_mst_edges, self.expected_mst_edges)
+        self.assertEqual(num_comparisons, 7)  # Stops after B - E, the 7th lightest edge, completes the tree
+
+
+    # Test union by rank and path compression keep every vertex pointing at a shared root
+    def test_disjoint_set(self):
+        components = DisjointSet(5)
+        self.assertTrue(components.union(0, 1))
+        self.assertTrue(components.union(2, 3))
+        self.assertTrue(components.union(1, 3))
+        self.assertFalse(components.union(0, 2))
+
+        self.assertEqual(components.num_sets, 2)
+        self.assertEqual(len({components.find(v) for v in range(4)}), 1)
+        self.assertNotEqual(components.find(4), components.find(0))
+
+
+    #                    #
+    # BORŮVKA'S TESTS    #
+    #                    #
+
+
+    # Test Borůvka's returns the correct MST and reports its rounds
+    def test_boruvka_correctness(self):
+        stats = {}
+        mst_edges, num_comparisons = boruvka_minimum_spanning_tree((self.V, self.E, self.W), stats=stats)
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+        self.assertEqual(stats["rounds"], 1)  # A-B, B-C, C-D and B-E are all chosen in the first round
+        self.assertEqual(len(stats["round_times"]), stats["rounds"])
+        self.assertEqual(num_comparisons, 2 * len(self.E))
+
+
+    # Test equal weights still give a spanning tree, ties are broken by edge order so no cycle forms
+    def test_boruvka_equal_weights(self):
+        V = ['A', 'B', 'C']
+        E = [('A', 'B'), ('B', 'C'), ('A', 'C')]
+        mst_edges, _ = boruvka_minimum_spanning_tree((V, E, {edge: 1 for edge in E}))
+
+        self.assertEqual(mst_edges, {('A', 'B'), ('B', 'C')})
+
+
+    # Test sharding the edge scan across processes gives the same tree
+    def test_boruvka_process_pool(self):
+        mst_edges, _ = boruvka_minimum_spanning_tree((self.V, self.E, self.W), processes=2)
+
+        self.assertEqual(mst_edges, self.expected_mst_edges)
+
+
+    #                          #
+    # SMALL INTEGER WEIGHT TESTS #
+    #                          #
+
+
+    # Test the bucket queue and counting sort engines return the correct MST for small integer weights
+    def test_integer_weight_engines_correctness(self):
+        graph = IndexedGraph.from_vew((self.V, self.E, self.W))
+        self.assertEqual(small_integer_weight_range(graph), (1, 8))
+
+        bucket_mst_edges, bucket_comparisons = prim_minimum_spanning_tree_bucket_queue(graph)
+        counting_mst_edges, _ = kruskal_minimum_spanning_tree_counting_sort(graph)
+
+        self.assertEqual(bucket_mst_edges, self.expected_mst_edges)
+        self.assertEqual(counting_mst_edges, self.expected_mst_edges)
+        self.assertEqual(bucket_comparisons, len(self.E))
+
+
+    # Test both integer engines return the same spanning forest as the generic engines on a disconnected graph,
+    # the bucket queue restarting from the first vertex outside the tree once its buckets run dry
+    def test_integer_weight_engines_disconnected_graph(self):
+        graph = IndexedGraph(['A', 'B', 'C', 'D', 'E', 'F'], [('A', 'B'), ('C', 'D'), ('D', 'E'), ('C', 'E')], [1, 2, 3, 1])
+        expected_mst_edges = {('A', 'B'), ('C', 'D'), ('C', 'E')}    # F is isolated
+
+        for engine in (prim_minimum_spanning_tree_bucket_queue, kruskal_minimum_spanning_tree_counting_sort,
+                       prim_minimum_spanning_tree, prim_minimum_spanning_tree_with_priority_queue, kruskal_minimum_spanning_tree):
+            self.assertEqual({edge for edge in engine(graph)[0] if edge is not None}, expected_mst_edges, engine.__name__)
+
+
+    # Test non-integer or widely spread weights fall back to the generic engines
+    def test_integer_weight_engines_fallback(self):
+        float_weights = {edge: weight + 0.5 for edge, weight in self.W.items()}
+        wide_weights = {**self.W, ('D', 'E'): 10 ** 6}
+
+        self.assertIsNone(small_integer_weight_range(IndexedGraph.from_vew((self.V, self.E, float_weights))))
+        self.assertIsNone(small_integer_weight_range(IndexedGraph.from_vew((self.V, self.E, wide_weights))))
+
+        for weights in (float_weights, wide_weights):
+            self.assertEqual(prim_minimum_spanning_tree_bucket_queue((self.V, self.E, weights))[0], self.expected_mst_edges)
+            self.assertEqual(kruskal_minimum_spanning_tree_counting_sort((self.V, self.E, weights))[0], self.expected_mst_edges)
+
+
+
+    #                       #
+    # ENGINE REGISTRY TESTS #
+    #                       #
+
+
+    # Test every registered engine returns the same MST and total weight through the common result
+    def test_registry_engines_agree(self):
+        for name in engine_names():
+            result = run_engine(name, (self.V, self.E, self.W))
+            self.assertEqual(result.engine, name)
+            self.assertEqual(result.tree_edges, self.expected_mst_edges, name)
+            self.assertEqual(result.total_weight, 13, name)
+            self.assertGreater(result.num_comparisons, 0, name)
+            self.assertTrue({"build", "mst", "total"} <= set(result.timings))
+
+        self.assertEqual(run_engine("Borůvka's (NumPy)", (self.V, self.E, self.W)).counters["rounds"], 1)
+
+
+    # Test the total weight counts the lightest of several edges joining the same pair, whichever order they are listed in
+    def test_registry_tree_weight_with_parallel_edges(self):
+        graph = IndexedGraph(['A', 'B', 'C'], [('A', 'B'), ('B', 'C'), ('B', 'A'), ('A', 'B')], [1, 2, 3, 4])
+        for name in engine_names():
+            self.assertEqual(run_engine(name, graph).total_weight, 3, name)
+
+
+    # Test unknown names and duplicate registrations are rejected
+    def test_registry_errors(self):
+        with self.assertRaises(ValueError):
+            run_engine("Not an engine", (self.V, self.E, self.W))
+        with self.assertRaises(ValueError):
+            register_engine("Prim's (array)", prim_minimum_spanning_tree)
+        self.assertIs(MST_ENGINES["Prim's (array)"], prim_minimum_spanning_tree)
+
+
+
+    #                          #
+    # BENCHMARK HARNESS TESTS  #
+    #                          #
+
+
+    # Test calibration grows the loop count until a sample reaches the minimum duration, and warm-up runs are untimed
+    def test_benchmark_calibration(self):
+        calls = []
+        summary = benchmark(lambda: calls.append(1), repetitions=4, warmup=3, min_sample_time=0.001)
+
+        self.assertEqual(summary.repetitions, 4)
+        self.assertGreater(summary.loops, 1)
+        self.assertGreaterEqual(len(calls), 3 + 4 * summary.loops)
+        self.assertLessEqual(summary.q1, summary.median)
+        self.assertLessEqual(summary.median, summary.q3)
+        self.assertLessEqual(summary.ci_low, summary.median)
+        self.assertGreaterEqual(summary.ci_high, summary.median)
+
+
+    # Test the median confidence interval uses the order statistics either side of the median
+    def test_median_confidence_interval(self):
+        self.assertEqual(median_confidence_interval(list(range(1, 21))), (6, 15))
+        self.assertEqual(median_confidence_interval([3, 1, 2]), (1, 3))
+
+
+    # Test a benchmarked engine run keeps the engine's tree and counters and reports the median as its MST time
+    def test_benchmark_engine(self):
+        result = benchmark_engine("Kruskal's (union-find)", (self.V, self.E, self.W), repetitions=3, min_sample_time=0.001)
+
+        self.assertEqual(result.tree_edges, self.expected_mst_edges)
+        self.assertEqual(result.timing_summary.repetitions, 3)
+        self.assertEqual(result.timings["mst"], result.timing_summary.median)
+
+
+    # Test engines that log are benchmarked quietly, only the untimed first run prints, and stdout is never swapped out
+    def test_benchmark_engine_quiet(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            benchmark_engine("Prim's (binary heap)", (self.V, self.E, self.W), repetitions=3, min_sample_time=0.001)
+        self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            benchmark(lambda: print("logged"), repetitions=1, warmup=0, min_sample_time=0)
+        self.assertEqual(output.getvalue(), "logged\n")
+
+
+
+    #                    #
+    # WORKLOAD TESTS     #
+    #                    #
+
+
+    # Test every family and weight distribution gives a simple graph that every engine agrees on
+    def test_workload_families(self):
+        for family in GRAPH_FAMILIES:
+            for weights in WEIGHT_DISTRIBUTIONS:
+                graph = as_indexed_graph(generate_workload(family, 40, weights, seed=7))
+                pairs = {(min(a, b), max(a, b)) for a, b in zip(graph.edge_start, graph.edge_end)}
+                self.assertEqual(len(pairs), graph.num_edges, f"{family} has repeated edges")
+                self.assertTrue(all(a != b for a, b in pairs), f"{family} has self-loops")
+
+                totals = {round(run_engine(name, graph).total_weight, 9) for name in ("Prim's (binary heap)", "Kruskal's (union-find)", "Borůvka's (NumPy)")}
+                self.assertEqual(len(totals), 1, f"Engines disagree on {family} with {weights} weights")
+
+
+    # Test workloads are reproducible from the seed and differ between seeds
+    def test_workload_seeding(self):
+        first = generate_workload("Erdős–Rényi", 200, "Uniform", seed=1)
+        again = generate_workload("Erdős–Rényi", 200, "Uniform", seed=1)
+        other = generate_workload("Erdős–Rényi", 200, "Uniform", seed=2)
+
+        self.assertEqual((first.edges, first.edge_weights), (again.edges, again.edge_weights))
+        self.assertNotEqual(first.edges, other.edges)
+
+
+    # Test integer weight complete workloads are the same graph whether or not they are generated implicitly
+    def test_workload_implicit_matches_explicit(self):
+        implicit = generate_workload("Complete", 30, "Integer", seed=4, implicit=True)
+        explicit = generate_workload("Complete", 30, "Integer", seed=4)
+
+        self.assertIsInstance(implicit, ImplicitCompleteGraph)
+        self.assertEqual((explicit.edges, explicit.edge_weights), (implicit.to_indexed().edges, implicit.to_indexed().edge_weights))
+        self.assertEqual(explicit.edge_weights, [implicit.edge_weight(start, end) for start, end in explicit.edges])
+
+
+    # Test the structured families have the expected shape
+    def test_workload_structure(self):
+        grid = generate_workload("Grid", 9, "Unit")
+        tree = generate_workload("Tree + extra edges", 50, "Integer", seed=3)
+        adversarial = generate_workload("Complete", 5, "Adversarial")
+
+        self.assertEqual(grid.num_edges, 12)    # 3 x 3 grid
+        self.assertTrue(is_graph_connected(tree))
+        self.assertEqual(len(set(adversarial.edge_weights)), 10)
+        self.assertIsNone(small_integer_weight_range(adversarial))    # too wide for buckets even with only 10 edges
+        with self.assertRaises(ValueError):
+            generate_workload("Not a family", 10)
+
+
+
+    #                    #
+    # SWEEP CACHE TESTS  #
+    #                    #
+
+
+    # Test a stored point comes back with its tree, counts and timing samples, and only under the same key
+    def test_sweep_cache_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SweepCache(os.path.join(directory, "sweeps.sqlite3"), max_bytes=10 ** 6)
+            workload = {"family": "Grid", "weights": "Integer", "seed": 0}
+            result = benchmark_engine("Kruskal's (union-find)", (self.V, self.E, self.W), repetitions=3, min_sample_time=0.001)
+            cache.store("Kruskal's (union-find)", workload, 3, 5, result)
+
+            found = cache.lookup("Kruskal's (union-find)", workload, 3, [5, 6])
+            self.assertEqual(list(found), [5])
+            self.assertEqual(found[5].tree_edges, self.expected_mst_edges)
+            self.assertEqual(found[5].counters, result.counters)
+            self.assertEqual(found[5].timing_summary.samples, result.timing_summary.samples)
+
+            self.assertEqual(cache.lookup("Kruskal's (union-find)", workload, None, [5]), {})
+            self.assertEqual(cache.lookup("Kruskal's (union-find)", None, 3, [5]), {})
+            self.assertEqual(cache.lookup("Borůvka's (NumPy)", workload, 3, [5]), {})
+
+
+    # Test the least recently used points are evicted past the size limit and invalidate removes matching points
+    def test_sweep_cache_eviction_and_invalidation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SweepCache(os.path.join(directory, "sweeps.sqlite3"), max_bytes=10 ** 6)
+            result = run_engine("Kruskal's (union-find)", (self.V, self.E, self.W))
+            for n in (5, 6, 7):
+                cache.store("Kruskal's (union-find)", None, None, n, result)
+            cache.lookup("Kruskal's (union-find)", None, None, [5])    # 6 is now the least recently used
+
+            cache.max_bytes = cache.size()    # Room for three points
+            cache.store("Prim's (array)", None, None, 5, result)
+            self.assertEqual(sorted(cache.lookup("Kruskal's (union-find)", None, None, [5, 6, 7])), [5, 7])
+
+            self.assertEqual(cache.invalidate(engine="Prim's (array)"), 1)
+            self.assertEqual(cache.invalidate_stale(), 0)
+            self.assertEqual(cache.invalidate(), 2)
+            self.assertEqual(cache.size(), 0)
+
+
+    # Test points measured with other engine code are never returned and are removed as stale, and caches written before
+    # points carried a version are discarded rather than misread
+    def test_sweep_cache_engine_version(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sweeps.sqlite3")
+            with contextlib.closing(sqlite3.connect(path)) as connection, connection:
+                connection.execute("CREATE TABLE points (engine TEXT, family TEXT, weights TEXT, seed INTEGER, repetitions INTEGER, n INTEGER, fingerprint TEXT, record TEXT, size INTEGER, last_used REAL)")
+            cache = SweepCache(path, max_bytes=10 ** 6)
+            result = run_engine("Kruskal's (union-find)", (self.V, self.E, self.W))
+            cache.store("Kruskal's (union-find)", None, None, 5, result)
+            self.assertEqual(list(cache.lookup("Kruskal's (union-find)", None, None, [5])), [5])
+
+            with contextlib.closing(sqlite3.connect(path)) as connection, connection:
+                connection.execute("UPDATE points SET version = 'edited'")
+            self.assertEqual(cache.lookup("Kruskal's (union-find)", None, None, [5]), {})
+            self.assertEqual(cache.invalidate_stale(), 1)
+
+            cache.store("Kruskal's (union-find)", None, None, 5, result)
+            with contextlib.closing(sqlite3.connect(path)) as connection, connection:
+                connection.execute("UPDATE points SET version = 'edited'")
+            self.assertEqual(SweepCache(path, max_bytes=10 ** 6).size(), 0)    # Stale points are dropped when the cache opens
+
+        self.assertEqual(engine_version("Kruskal's (union-find)"), engine_version("Kruskal's (union-find)"))
+        self.assertNotEqual(engine_version("Kruskal's (union-find)"), engine_version("Prim's (array)"))
+        self.assertTrue(cpu_model())
+
+    # Test the engine version follows the modules an engine imports, the bucket queue falls back to the heap engine
+    def test_engine_version_dependencies(self):
+        source = inspect.getsource
+        edited = lambda module: source(module) + ("# edited" if module.__name__ == "interface.vp_priority_q_prims" else "")
+        before = engine_version("Prim's (bucket queue)")
+        engine_version.cache_clear()
+        try:
+            with mock.patch("interface.vp_sweep_cache.inspect.getsource", side_effect=edited):
+                self.assertNotEqual(engine_version("Prim's (bucket queue)"), before)
+        finally:
+            engine_version.cache_clear()
+
+    # Test the shared sweep loop yields cached points first, caches what it measures, never caches memory profiles and stops when cancelled
+    def test_sweep_points(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SweepCache(os.path.join(directory, "sweeps.sqlite3"), max_bytes=10 ** 6)
+            list(sweep_points("Prim's (array)", [5], cache=cache))
+            points = list(sweep_points("Prim's (array)", [2, 5, 8], cache=cache))
+            self.assertEqual([(n, cached) for n, _, cached in points], [(5, True), (2, False), (8, False)])
+            self.assertEqual(points[2][1].num_comparisons, 8 * 7 - 7)
+            self.assertEqual(sorted(cache.lookup("Prim's (array)", None, None, [2, 5, 8])), [2, 5, 8])
+
+            cache.invalidate()
+            self.assertEqual(len(list(sweep_points("Kruskal's (union-find)", [2, 20], cache=cache, memory=True))), 2)
+            self.assertEqual(cache.size(), 0)
+
+        cancel = threading.Event()
+        cancel.set()
+        self.assertEqual(list(sweep_points("Prim's (array)", [2, 5, 8], cancel=cancel)), [])
+
+    # Test the parallel sweep uses every core unless the largest point's graph would not fit in free memory that many times
+    def test_sweep_workers_memory_bound(self):
+        cores = os.cpu_count() or 1
+        workload = {"family": "Erdős–Rényi", "weights": "Uniform", "seed": 0}
+        graph_bytes = estimated_edge_count(1000, workload) * SWEEP_BYTES_PER_EDGE
+        plenty = mock.Mock(available=graph_bytes * (cores + 1))
+        with mock.patch("interface.vp_sweep_pool.psutil.virtual_memory", return_value=plenty):
+            self.assertEqual(sweep_workers("Kruskal's (union-find)", [10, 1000], workload), cores)
+        short = mock.Mock(available=graph_bytes // 2)
+        with mock.patch("interface.vp_sweep_pool.psutil.virtual_memory", return_value=short):
+            self.assertEqual(sweep_workers("Kruskal's (union-find)", [10, 1000], workload), 1)
+            self.assertEqual(sweep_workers("Prim's (array)", [10, 1000]), cores)
+
+
+
+
+    #                        #
+    # COMPLEXITY FIT TESTS   #
+    #                        #
+
+
+    # Test the fit picks the model the measurements were generated from, with the exponent inside its interval
+    def test_fit_complexity_model_selection(self):
+        nodes = np.arange(50, 1050, 50)
+        noise = 1 + 0.02 * np.random.default_rng(0).standard_normal(nodes.size)
+        sparse_edges = 4 * nodes
+
+        quadratic = fit_complexity(nodes, 3e-8 * nodes ** 2 * noise + 1e-4)
+        linearithmic = fit_complexity(nodes, 5 * nodes * np.log2(nodes) * noise)
+        sparse = fit_complexity(nodes, sparse_edges * np.log2(nodes) * noise, sparse_edges)
+
+        self.assertEqual(quadratic.best.name, "O(n^2)")
+        self.assertTrue(quadratic.exponent_low <= quadratic.exponent <= quadratic.exponent_high)
+        self.assertAlmostEqual(quadratic.exponent, 2, delta=0.1)
+        self.assertEqual(linearithmic.best.name, "O(n log n)")
+        self.assertIn(sparse.best.name, ("O(m log n)", "O(n log n)"))   # m = 4n, the two only differ by the constant
+        self.assertGreater(quadratic.support, 0.9)
+
+
+    # Test sweeps too short to fit give None and zero measurements are left out
+    def test_fit_complexity_insufficient_points(self):
+        self.assertIsNone(fit_complexity([2, 12], [1, 121]))
+        self.assertIsNone(fit_complexity([2, 12, 22, 32], [0.0, 0.0, 0.0, 0.0]))
+        self.assertAlmostEqual(loglog_exponent(np.array([10.0, 20.0, 40.0]), np.array([5.0, 10.0, 20.0])), 1)
+
+
+
+    #                        #
+    # MEMORY PROFILING TESTS #
+    #                        #
+
+
+    # Test a profiled run keeps the engine's result and charges the graph to generation and the tree to the MST run
+    def test_profile_engine_memory(self):
+        explicit = profile_engine_memory("Kruskal's (union-find)", generate_complete_graph, 120)
+        implicit = profile_engine_memory("Prim's (array)", lambda n: generate_complete_graph(n, implicit=True), 120)
+
+        self.assertEqual(len(explicit.tree_edges), 119)
+        self.assertEqual(implicit.num_comparisons, 119 * 119)
+        self.assertGreater(explicit.memory_profile.generation_peak, explicit.memory_profile.graph_bytes)
+        self.assertGreater(explicit.memory_profile.mst_peak, 0)
+        self.assertLess(implicit.memory_profile.graph_bytes * 20, explicit.memory_profile.graph_bytes)   # O(n) against O(n^2)
+
+
+    # Test the representation comparison only offers the implicit graph for complete graphs and orders the costs sensibly
+    def test_representation_bytes_per_edge(self):
+        complete = representation_bytes_per_edge(generate_complete_graph(150))
+        grid = representation_bytes_per_edge(generate_workload("Grid", 400, "Uniform"))
+
+        self.assertEqual(list(complete), ["(V, E, W) triple", "IndexedGraph (CSR)", "Dense weight matrix", "ImplicitCompleteGraph"])
+        self.assertLess(complete["ImplicitCompleteGraph"], 1)
+        self.assertLess(complete["Dense weight matrix"], complete["IndexedGraph (CSR)"])
+        self.assertNotIn("ImplicitCompleteGraph", grid)
+        self.assertGreater(grid["Dense weight matrix"], grid["IndexedGraph (CSR)"])   # n^2 cells for about 2n edges
+        self.assertNotIn("Dense weight matrix", representation_bytes_per_edge(generate_workload("Grid", 400, "Uniform"), max_dense_nodes=100))
+
+
+
+    #                    #
+    # HEADLESS CLI TESTS #
+    #                    #
+
+
+    # Test the command-line runner writes every sweep point to CSV/JSON and a chart, without loading Tk
+    def test_benchmark_cli_outputs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = {extension: os.path.join(directory, f"sweep.{extension}") for extension in ("csv", "json", "png")}
+            status = benchmark_cli(["--metric", "comparisons", "--family", "Grid", "--weights", "Integer", "--max-nodes", "30", "--step", "10",
+                                    "--no-cache", "--csv", paths["csv"], "--json", paths["json"], "--plot", paths["png"]])
+
+            with open(paths["csv"], newline="") as file:
+                rows = list(csv.DictReader(file))
+            with open(paths["json"]) as file:
+                sweep = json.load(file)
+
+            self.assertEqual(status, 0)
+            self.assertEqual([int(row["nodes"]) for row in rows], [2, 12, 22, 30])
+            self.assertEqual([point["comparisons"] for point in sweep["points"]], [int(row["comparisons"]) for row in rows])
+            self.assertEqual(sweep["workload"], {"family": "Grid", "weights": "Integer", "seed": 0})
+            self.assertEqual(sweep["fit"]["best"], sweep["fit"]["models"][0]["model"])
+            self.assertGreater(os.path.getsize(paths["png"]), 0)
+
+        # A fresh interpreter, the other tests in this process may already have imported Tk
+        check = "import sys, interface.vp_benchmark_cli; print(any(m.split('.')[0] in ('tkinter', 'customtkinter') for m in sys.modules))"
+        self.assertEqual(subprocess.run([sys.executable, "-c", check], capture_output=True, text=True).stdout.strip(), "False")
+
+
+    def test_language_benchmark_parsing(self):
+        output = ("[2, 500]\n"
+                  "Execution time for uniform weight with 2 nodes: 0.000001000 seconds\n"
+                  "Execution time for uniform weight with 2 nodes: 3e-06 seconds\n"
+                  "Execution time for uniform weight with 500 nodes: 0.25 seconds\n")
+        rows = timing_rows("C++", "C++", parse_timings(output))
+        summary = summarise(rows)
+
+        self.assertEqual([(row["nodes"], row["repetition"], row["seconds"]) for row in rows], [(2, 1, 1e-6), (2, 2, 3e-6), (500, 1, 0.25)])
+        self.assertEqual([(point["nodes"], point["repetitions"], point["median"]) for point in summary], [(2, 2, 2e-6), (500, 1, 0.25)])
+
+    def test_language_benchmark_python_implementations(self):
+        # The Python program needs no toolchain, so it is the one external implementation that can always be run
+        rows = run_implementation(LANGUAGE_IMPLEMENTATIONS["Python (exec_analysis.py)"], [2, 20], 2)
+        engine_rows = run_registry_engine("Prim's (array)", [2, 20], 2)
+
+        for table in (rows, engine_rows):
+            self.assertEqual([(row["nodes"], row["repetition"]) for row in table], [(2, 1), (2, 2), (20, 1), (20, 2)])
+            self.assertTrue(all(row["seconds"] > 0 and row["language"] == "Python" for row in table))
+
+if __name__ == '__main__':
+    unittest.main()
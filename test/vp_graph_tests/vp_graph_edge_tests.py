@@ -3,6 +3,7 @@ from tkinter import StringVar
 from unittest.mock import MagicMock, mock_open, patch
 from interface.vp_graph import GraphVisualiser, Node, Edge
 from interface.utils import *
+from interface.config import CANVAS_LAYERS, EDGE_LAYER, LABEL_LAYER, NON_MST_TAG
 
 class TestVPGraphEdge(unittest.TestCase):
     print("###########GRAPH VISUALISER EDGE TESTS###########\n") 
@@ -31,6 +32,19 @@ class TestVPGraphEdge(unittest.TestCase):
     
 
 
+    # Test a new edge's items are tagged with their layer and state, and the layers are restacked with one raise per layer
+    def test_create_edge_layering(self):
+        self.vp.create_node(100, 100, "A")
+        self.vp.create_node(200, 200, "B")
+        self.vp.canvas.tag_raise.reset_mock()
+        self.vp.create_edge(Edge(self.vp.nodes[0], self.vp.nodes[1], 10))
+
+        self.assertEqual(self.vp.canvas.create_line.call_args[1]['tags'], (EDGE_LAYER, NON_MST_TAG))
+        self.assertEqual(self.vp.canvas.create_text.call_args[1]['tags'], (LABEL_LAYER, NON_MST_TAG))
+        self.assertEqual([c.args for c in self.vp.canvas.tag_raise.call_args_list], [(layer,) for layer in CANVAS_LAYERS])
+
+
+
     # Test creating an edge with the same start and end nodes 
     def test_create_edge_with_same_start_end_nodes(self):
         self.vp.create_node(100, 100, "A")
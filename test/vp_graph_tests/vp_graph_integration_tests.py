@@ -4,6 +4,7 @@ from customtkinter import CTk
 from unittest.mock import MagicMock, mock_open, patch
 from interface.vp_graph import GraphVisualiser, Node, Edge
 from interface.utils import *
+from interface.config import NON_MST_TAG
 import json
 import os
 from PIL import Image
@@ -278,29 +279,28 @@ class TestVPGraphIntegration(unittest.TestCase):
         # Create some nodes and edges for the graph
         self.app.create_node(100, 100, "A")  # Node A at 100x100
         self.app.create_node(200, 200, "B")  # Node B at 200x200
+        self.app.create_edge(Edge(self.app.nodes[0], self.app.nodes[1], 5))
 
         # Assume initial canvas size
-        initial_width = self.app.canvas.winfo_width()
-        initial_height = self.app.canvas.winfo_height()
-        self.app.canvas_old_width = initial_width
-        self.app.canvas_old_height = initial_height
-
-        # Mock the canvas width and height properties
-        self.app.canvas.winfo_width = MagicMock(return_value=400)
-        self.app.canvas.winfo_height = MagicMock(return_value=400)
-
-        # Simulate the canvas resize event
-        self.app.on_canvas_resize(event=MagicMock(width=400, height=400))
-
-        # Check if the resize_move_node method was called for each node
-        self.assertEqual(self.app.resize_move_node.call_count, len(self.app.nodes))
-
-        # For each node, check if the node was repositioned correctly based on the new size
-        for node in self.app.nodes:
-            # Calculate expected new position
-            expected_x = node.x * (400 / initial_width)
-            expected_y = node.y * (400 / initial_height)
-            self.app.resize_move_node.assert_any_call(node, expected_x, expected_y)
+        self.app.canvas_old_width = 200
+        self.app.canvas_old_height = 200
+
+        # Simulate a burst of resize events while the window is dragged, nothing moves until the next frame
+        for size in (250, 300, 400):
+            self.app.on_canvas_resize(event=MagicMock(width=size, height=size))
+        self.assertEqual((self.app.nodes[0].x, self.app.nodes[0].y), (100, 100))
+
+        # Apply the pending resize as the frame tick would
+        self.app.canvas.coords.reset_mock()
+        self.app.apply_canvas_resize()
+
+        # The nodes are scaled once, to the latest size
+        self.assertEqual([(node.x, node.y) for node in self.app.nodes], [(200, 200), (400, 400)])
+        self.assertIsNone(self.app.resize_job)
+
+        # Every item's coordinates are set exactly once, the circle and label of each node and the line, marker and label of the edge
+        self.assertEqual(self.app.canvas.coords.call_count, 2 * 2 + 3)
+        self.app.resize_move_node.assert_not_called()
     
 
     # GV User story 10: Moving a node
@@ -323,6 +323,7 @@ class TestVPGraphIntegration(unittest.TestCase):
         # Simulate dragging the node "A" to a new position (150, 150).
         event = MagicMock(x=150, y=150)
         self.app.drag_handler(event)
+        self.app.apply_drag()    # Flush the move the next frame would apply
 
         # After the drag operation
         new_node_x, new_node_y = self.app.selected_node.x, self.app.selected_node.y
@@ -376,6 +377,11 @@ class TestVPGraphIntegration(unittest.TestCase):
             # If not, print the call_args_list for debug
             print("itemconfig call_args_list:", self.app.canvas.itemconfigure.call_args_list)
             raise
+
+        # Every non-MST edge is hidden with one tag-wide call, and the heaviest edge has left the non-MST tag
+        self.app.canvas.itemconfigure.assert_called_once_with(NON_MST_TAG, state='hidden')
+        self.assertEqual([edge.is_mst_edge for edge in self.app.edges], [True, True, False])
+        self.app.canvas.dtag.assert_any_call(self.app.edges[0].line_id, NON_MST_TAG)
     
 
     # GV User story 12: Removing an edge
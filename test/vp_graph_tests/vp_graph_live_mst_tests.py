@@ -0,0 +1,79 @@
+import unittest
+from interface.vp_dynamic_mst import DynamicMST
+
+class TestLiveMST(unittest.TestCase):
+    print("###########GRAPH VISUALISER LIVE MST TESTS###########\n")
+
+    def setUp(self):
+        # Square A-B-C-D with a heavy diagonal, edges keyed by their identifier pairs
+        self.mst = DynamicMST()
+        for key, weight in [(('A', 'B'), 1), (('B', 'C'), 2), (('C', 'D'), 3), (('D', 'A'), 4), (('A', 'C'), 5)]:
+            self.mst.add_edge(key, key[0], key[1], weight)
+
+
+    # Test edges are only kept when they don't close a cycle with a lighter path
+    def test_insert_edges(self):
+        self.assertEqual(self.mst.tree_edges, {('A', 'B'), ('B', 'C'), ('C', 'D')})
+        self.assertEqual(self.mst.total_weight, 6)
+
+
+    # Test a lighter edge replaces the heaviest edge on the cycle it closes
+    def test_insert_replaces_heaviest_cycle_edge(self):
+        self.assertTrue(self.mst.add_edge(('B', 'D'), 'B', 'D', 1))
+
+        self.assertEqual(self.mst.tree_edges, {('A', 'B'), ('B', 'C'), ('B', 'D')})
+        self.assertEqual(self.mst.total_weight, 4)
+
+
+    # Test deleting a tree edge reconnects the tree with the lightest edge across the cut
+    def test_delete_tree_edge(self):
+        self.mst.remove_edge(('B', 'C'))
+
+        self.assertEqual(self.mst.tree_edges, {('A', 'B'), ('C', 'D'), ('D', 'A')})
+        self.assertEqual(self.mst.total_weight, 8)
+
+
+    # Test deleting a non-tree edge leaves the MST unchanged
+    def test_delete_non_tree_edge(self):
+        self.mst.remove_edge(('A', 'C'))
+
+        self.assertEqual(self.mst.tree_edges, {('A', 'B'), ('B', 'C'), ('C', 'D')})
+        self.assertEqual(self.mst.total_weight, 6)
+
+
+    # Test deleting a vertex drops its edges and leaves a forest when no replacement exists
+    def test_delete_vertex(self):
+        self.mst.remove_vertex('C')
+
+        self.assertEqual(self.mst.tree_edges, {('A', 'B'), ('D', 'A')})
+        self.assertEqual(self.mst.total_weight, 5)
+
+        self.mst.remove_vertex('A')
+        self.assertEqual(self.mst.tree_edges, set())
+        self.assertIsNone(self.mst.tree_path('B', 'D'))
+
+
+    # Test components are tracked as edges join trees and deletions split them
+    def test_connectivity_tracking(self):
+        self.assertTrue(self.mst.is_connected())
+
+        self.mst.add_vertex('E')
+        self.assertEqual(self.mst.num_components, 2)
+        self.assertNotEqual(self.mst.component['E'], self.mst.component['A'])
+
+        self.mst.add_edge(('D', 'E'), 'D', 'E', 7)
+        self.assertTrue(self.mst.is_connected())
+
+        self.mst.remove_edge(('D', 'E'))   # Bridge, no replacement so E is split off again
+        self.assertEqual(self.mst.num_components, 2)
+
+        self.mst.remove_edge(('B', 'C'))   # Replaced by D-A, A-B-C-D stays one component
+        self.assertEqual(self.mst.num_components, 2)
+        self.assertEqual(self.mst.component['B'], self.mst.component['C'])
+
+        self.mst.remove_vertex('E')
+        self.assertTrue(self.mst.is_connected())
+
+
+if __name__ == '__main__':
+    unittest.main()
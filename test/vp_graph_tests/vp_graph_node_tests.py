@@ -104,10 +104,11 @@ class TestVPGraphNode(unittest.TestCase):
 
     # Test node moves within canvas boundaries and updates edge positions when canvas is resized
     def test_move_node_canvas_resize(self):
-        self.vp.nodes = [Node(100, 100, "A"), Node(200, 200, "B")]
-        self.vp.edges = [Edge(self.vp.nodes[0], self.vp.nodes[1], 10)]
+        self.vp.create_node(100, 100, "A")
+        self.vp.create_node(200, 200, "B")
+        self.vp.create_edge(Edge(self.vp.nodes[0], self.vp.nodes[1], 10))
         for node in self.vp.nodes:
-            node.id = MagicMock()  # Mock visual ID for canvas elements
+            node.id = MagicMock()  # Distinct visual IDs, the mocked canvas returns the same one from every create call
             node.text_id = MagicMock()
         for edge in self.vp.edges:
             edge.line_id = MagicMock()
@@ -136,11 +137,70 @@ class TestVPGraphNode(unittest.TestCase):
         self.vp.canvas.coords.assert_any_call(edge.text_id, mid_x, mid_y)
 
 
+    # Test clicks anywhere inside a node's drawn circle find it, and clicks outside it don't
+    def test_find_node(self):
+        self.vp.create_node(100, 100, "A")
+        self.vp.create_node(300, 300, "B")
+
+        self.assertEqual(self.vp.find_node(117, 100).identifier, "A")
+        self.assertEqual(self.vp.find_node(300, 284).identifier, "B")
+        self.assertIsNone(self.vp.find_node(114, 114))
+
+        # The index follows the node when it is dragged
+        self.vp.canvas.winfo_width.return_value = 700
+        self.vp.canvas.winfo_height.return_value = 568
+        self.vp.selected_node = self.vp.nodes[0]
+        self.vp.drag_handler(MagicMock(x=500, y=150))
+        self.vp.apply_drag()
+        self.assertIsNone(self.vp.find_node(100, 100))
+        self.assertEqual(self.vp.find_node(500, 150).identifier, "A")
+
+
+    # Test dragging a node only updates the edges touching it, and deleting a node drops it from its neighbours' incident edges
+    def test_incident_edges(self):
+        self.vp.canvas.winfo_width.return_value = 700
+        self.vp.canvas.winfo_height.return_value = 568
+        for i, (x, y) in enumerate([(100, 100), (300, 100), (200, 300), (400, 400)]):
+            self.vp.create_node(x, y, chr(65+i))
+        A, B, C, D = self.vp.nodes
+        for start, end in [(A, B), (A, C), (B, C)]:
+            self.vp.create_edge(Edge(start, end, 1))
+        self.assertEqual(self.vp.edges_of(D), [])
+
+        self.vp.canvas.coords.reset_mock()
+        self.vp.selected_node = C
+        self.vp.drag_handler(MagicMock(x=250, y=350))
+        self.vp.apply_drag()
+        self.assertEqual(self.vp.canvas.coords.call_count, 2 * 3)    # Line, midpoint and label of A - C and B - C only
+
+        self.vp.delete_node_var.get = MagicMock(return_value="A")
+        self.vp.delete_node()
+        self.assertEqual([(edge.start_node, edge.end_node) for edge in self.vp.edges_of(B)], [(B, C)])
+        self.assertEqual(len(self.vp.edges), 1)
+
+
+    # Test deleting a node with a self-loop removes the loop along with its other edges
+    def test_delete_node_with_self_loop(self):
+        self.vp.create_node(100, 100, "A")
+        self.vp.create_node(300, 100, "B")
+        A, B = self.vp.nodes
+        self.vp.create_edge(Edge(A, A, 2))
+        self.vp.create_edge(Edge(A, B, 3))
+
+        self.vp.delete_node_var.get = MagicMock(return_value="A")
+        self.vp.delete_node()
+        self.assertEqual(self.vp.nodes, [B])
+        self.assertEqual(len(self.vp.edges), 0)
+        self.assertEqual(self.vp.edges_of(B), [])
+
+
     # Test that the graph becomes disconnected after a node deletion and Prim's algorithm handles it.
     def test_graph_disconnect_after_node_deletion(self):
         # Setup a connected graph
-        self.vp.nodes = [Node(100, 100, "A"), Node(200, 200, "B"), Node(300, 300, "C")]
-        self.vp.edges = [Edge(self.vp.nodes[0], self.vp.nodes[1], 1), Edge(self.vp.nodes[1], self.vp.nodes[2], 2)]
+        for x, y, identifier in [(100, 100, "A"), (200, 200, "B"), (300, 300, "C")]:
+            self.vp.create_node(x, y, identifier)
+        self.vp.create_edge(Edge(self.vp.nodes[0], self.vp.nodes[1], 1))
+        self.vp.create_edge(Edge(self.vp.nodes[1], self.vp.nodes[2], 2))
 
         # Delete node B to disconnect the graph
         self.vp.delete_node_var.get = MagicMock(return_value="B")
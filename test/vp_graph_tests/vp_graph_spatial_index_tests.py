@@ -0,0 +1,63 @@
+import unittest
+import random
+from interface.vp_spatial_index import SpatialGrid, point_in_circle, segment_distance
+
+class TestSpatialIndex(unittest.TestCase):
+    print("###########GRAPH VISUALISER SPATIAL INDEX TESTS###########\n")
+
+    def setUp(self):
+        self.grid = SpatialGrid(64)
+
+
+    # Test a circle can be found from anywhere inside it, including across cell borders
+    def test_circle_query(self):
+        self.grid.insert_circle("A", 60, 60, 18)
+
+        for x, y in [(60, 60), (42, 60), (78, 60), (60, 78), (70, 70)]:
+            self.assertIn("A", self.grid.query(x, y))
+        self.assertNotIn("A", self.grid.query(200, 200))
+
+
+    # Test moving an item re-registers it, so it is no longer found at its old position
+    def test_move_and_remove(self):
+        self.grid.insert_circle("A", 10, 10, 18)
+        self.grid.insert_circle("A", 300, 300, 18)
+
+        self.assertNotIn("A", self.grid.query(10, 10))
+        self.assertIn("A", self.grid.query(300, 300))
+        self.assertEqual(len(self.grid), 1)
+
+        self.grid.remove("A")
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid.cells, {})
+
+
+    # Test every point within the padding of a random segment is in a cell the segment was registered in
+    def test_segment_cells_cover_padding(self):
+        rng = random.Random(0)
+        for trial in range(200):
+            x0, y0, x1, y1 = (rng.uniform(-200, 800) for _ in range(4))
+            self.grid.insert_segment(trial, x0, y0, x1, y1, 4)
+            for _ in range(20):
+                t = rng.random()
+                x, y = x0 + t * (x1 - x0) + rng.uniform(-2.8, 2.8), y0 + t * (y1 - y0) + rng.uniform(-2.8, 2.8)
+                self.assertIn(trial, self.grid.query(x, y))
+
+
+    # Test a long diagonal segment takes cells along its length rather than its whole bounding box
+    def test_segment_cell_count(self):
+        self.grid.insert_segment("AB", 0, 0, 6400, 6400, 4)
+        self.assertLess(len(self.grid.item_cells["AB"]), 400)
+
+
+    # Test the exact hit tests used on the grid's candidates
+    def test_exact_hit_tests(self):
+        self.assertTrue(point_in_circle(118, 100, 100, 100, 18))
+        self.assertFalse(point_in_circle(113, 113, 100, 100, 18))
+        self.assertEqual(segment_distance(5, 3, 0, 0, 10, 0), 3)
+        self.assertEqual(segment_distance(13, 4, 0, 0, 10, 0), 5)
+        self.assertEqual(segment_distance(3, 4, 0, 0, 0, 0), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
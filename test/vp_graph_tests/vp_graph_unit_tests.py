@@ -54,8 +54,10 @@ class TestVisualisingPrims(unittest.TestCase):
     # Test creating a node and edge after Prim's
     def test_add_node_and_edge_after_prims(self):
         # Setup a known graph and run Prim's algorithm
-        self.vp.nodes = [Node(100, 100, "A"), Node(200, 200, "B"), Node(300, 300, "C")]
-        self.vp.edges = [Edge(self.vp.nodes[0], self.vp.nodes[1], 1), Edge(self.vp.nodes[1], self.vp.nodes[2], 2)]
+        for x, y, identifier in [(100, 100, "A"), (200, 200, "B"), (300, 300, "C")]:
+            self.vp.create_node(x, y, identifier)
+        self.vp.create_edge(Edge(self.vp.nodes[0], self.vp.nodes[1], 1))
+        self.vp.create_edge(Edge(self.vp.nodes[1], self.vp.nodes[2], 2))
         graph = (set(["A", "B", "C"]), {("A", "B"), ("B", "C")}, {("A", "B"): 1, ("B", "C"): 2})
         self.vp.prim_minimum_spanning_tree(graph)
 
@@ -194,8 +196,9 @@ class TestVisualisingPrims(unittest.TestCase):
     # Test Prim's with a disconnected graph
     def test_prims_with_disconnected_graph(self):
         # Setup a disconnected graph
-        self.vp.nodes = [Node(100, 100, "A"), Node(200, 200, "B"), Node(300, 300, "C")]
-        self.vp.edges = [Edge(self.vp.nodes[0], self.vp.nodes[1], 10)]
+        for x, y, identifier in [(100, 100, "A"), (200, 200, "B"), (300, 300, "C")]:
+            self.vp.create_node(x, y, identifier)
+        self.vp.create_edge(Edge(self.vp.nodes[0], self.vp.nodes[1], 10))
         self.vp.start_vertex_var.set = "A"
         
         # Mock the status_label to capture text changes
@@ -275,8 +278,58 @@ class TestVisualisingPrims(unittest.TestCase):
         event.x = 150
         event.y = 150
         self.vp.drag_handler(event)
+        self.vp.apply_drag()    # Flush the move the next frame would apply
         self.assertEqual(self.vp.nodes[0].x, 150)
         self.assertEqual(self.vp.nodes[0].y, 150)
+
+
+    # Test a burst of motion events is coalesced into one move to the latest position, flushed when the button is released
+    def test_drag_coalescing(self):
+        self.vp.canvas.winfo_width.return_value = 300
+        self.vp.canvas.winfo_height.return_value = 300
+
+        self.vp.create_node(100, 100, "A")
+        self.vp.selected_node = self.vp.nodes[0]
+        self.vp.canvas.move.reset_mock()
+        for x in range(110, 200, 10):
+            self.vp.drag_handler(MagicMock(x=x, y=150))
+        self.assertEqual((self.vp.nodes[0].x, self.vp.nodes[0].y), (100, 100))  # Nothing moves until the next frame
+
+        self.vp.release_handler(MagicMock(x=190, y=150))
+        self.assertEqual((self.vp.nodes[0].x, self.vp.nodes[0].y), (190, 150))
+        self.assertEqual(self.vp.canvas.move.call_count, 2)    # The circle and label are moved once each
+        self.assertIsNone(self.vp.drag_job)
+        self.assertIsNone(self.vp.selected_node)
+
+
+
+    # Test deleting the node being dragged drops the move still waiting for the next frame
+    def test_delete_node_cancels_pending_drag(self):
+        self.vp.create_node(100, 100, "A")
+        self.vp.selected_node = self.vp.nodes[0]
+        self.vp.drag_handler(MagicMock(x=150, y=150))
+        self.assertIsNotNone(self.vp.drag_job)
+
+        self.vp.delete_node_var.get = MagicMock(return_value="A")
+        self.vp.delete_node()
+        self.assertIsNone(self.vp.drag_job)
+        self.assertIsNone(self.vp.pending_drag_pos)
+        self.assertIsNone(self.vp.selected_node)
+
+
+    # Test leaving for the main menu cancels a rescale and a move still waiting for the next frame, so neither runs against the destroyed canvas
+    def test_return_to_main_menu_cancels_pending_jobs(self):
+        self.vp.create_node(100, 100, "A")
+        self.vp.selected_node = self.vp.nodes[0]
+        self.vp.drag_handler(MagicMock(x=150, y=150))
+        self.vp.on_canvas_resize(MagicMock(width=400, height=400))
+        self.assertIsNotNone(self.vp.resize_job)
+
+        with patch.object(self.vp, 'destroy'), patch('interface.vp_main_gui.MainMenu'):
+            self.vp.return_to_main_menu()
+        self.assertIsNone(self.vp.resize_job)
+        self.assertIsNone(self.vp.drag_job)
+        self.assertIsNone(self.vp.pending_drag_pos)
     
     
 if __name__ == '__main__':